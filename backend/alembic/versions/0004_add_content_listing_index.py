@@ -0,0 +1,30 @@
+"""Add composite index backing keyset pagination of the content listing.
+
+Revision ID: 0004_add_content_listing_index
+Revises: 0003_privacy_defaults
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_add_content_listing_index"
+down_revision = "0003_privacy_defaults"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_content_items_listing",
+        "content_items",
+        ["status", "published_at", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_content_items_listing", table_name="content_items")
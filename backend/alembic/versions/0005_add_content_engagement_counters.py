@@ -0,0 +1,48 @@
+"""Add denormalized like/comment counters to content items.
+
+Revision ID: 0005_add_content_engagement_counters
+Revises: 0004_add_content_listing_index
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005_add_content_engagement_counters"
+down_revision = "0004_add_content_listing_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "content_items",
+        sa.Column("likes_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "content_items",
+        sa.Column("comments_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        sa.text(
+            """
+            UPDATE content_items SET
+                likes_count = (
+                    SELECT count(*) FROM likes WHERE likes.content_id = content_items.id
+                ),
+                comments_count = (
+                    SELECT count(*) FROM comments
+                    WHERE comments.content_id = content_items.id
+                    AND comments.status = 'active'
+                )
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("content_items", "comments_count")
+    op.drop_column("content_items", "likes_count")
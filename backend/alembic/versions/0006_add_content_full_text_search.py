@@ -0,0 +1,86 @@
+"""Add full-text search structures for content items.
+
+Postgres gets a generated, weighted tsvector column with a GIN index. SQLite gets an
+external-content FTS5 table kept in sync by triggers.
+
+Revision ID: 0006_add_content_full_text_search
+Revises: 0005_add_content_engagement_counters
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006_add_content_full_text_search"
+down_revision = "0005_add_content_engagement_counters"
+branch_labels = None
+depends_on = None
+
+
+POSTGRES_UPGRADE = (
+    """
+    ALTER TABLE content_items ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_content_items_search_vector ON content_items USING gin (search_vector)",
+)
+
+SQLITE_UPGRADE = (
+    """
+    CREATE VIRTUAL TABLE content_items_fts USING fts5(
+        title, description,
+        content='content_items', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER content_items_fts_ai AFTER INSERT ON content_items BEGIN
+        INSERT INTO content_items_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER content_items_fts_ad AFTER DELETE ON content_items BEGIN
+        INSERT INTO content_items_fts(content_items_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER content_items_fts_au
+    AFTER UPDATE OF title, description ON content_items BEGIN
+        INSERT INTO content_items_fts(content_items_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO content_items_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    "INSERT INTO content_items_fts(content_items_fts) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    statements = ()
+    if dialect == "postgresql":
+        statements = POSTGRES_UPGRADE
+    elif dialect == "sqlite":
+        statements = SQLITE_UPGRADE
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.drop_index("ix_content_items_search_vector", table_name="content_items")
+        op.drop_column("content_items", "search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("content_items_fts_ai", "content_items_fts_ad", "content_items_fts_au"):
+            op.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        op.execute(sa.text("DROP TABLE IF EXISTS content_items_fts"))
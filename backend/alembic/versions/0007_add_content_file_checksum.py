@@ -0,0 +1,28 @@
+"""Add SHA-256 checksum of stored content files.
+
+Revision ID: 0007_add_content_file_checksum
+Revises: 0006_add_content_full_text_search
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_add_content_file_checksum"
+down_revision = "0006_add_content_full_text_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "content_items",
+        sa.Column("file_checksum", sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("content_items", "file_checksum")
@@ -0,0 +1,50 @@
+"""Add transactional notification outbox.
+
+Revision ID: 0008_add_notification_outbox
+Revises: 0007_add_content_file_checksum
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_add_notification_outbox"
+down_revision = "0007_add_content_file_checksum"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_outbox",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("topic", sa.String(length=100), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("idempotency_key", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("leased_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("lease_owner", sa.String(length=64), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("idempotency_key", name="uq_notification_outbox_idempotency_key"),
+    )
+    op.create_index(
+        "ix_notification_outbox_claim", "notification_outbox", ["status", "available_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_outbox_claim", table_name="notification_outbox")
+    op.drop_table("notification_outbox")
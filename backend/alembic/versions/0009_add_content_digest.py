@@ -0,0 +1,63 @@
+"""Add content digest preference and digest buffer.
+
+Revision ID: 0009_add_content_digest
+Revises: 0008_add_notification_outbox
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_add_content_digest"
+down_revision = "0008_add_notification_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user_preferences",
+        sa.Column(
+            "content_digest", sa.String(length=16), nullable=False, server_default="immediate"
+        ),
+    )
+    op.create_table(
+        "notification_digest_entries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("frequency", sa.String(length=16), nullable=False),
+        sa.Column(
+            "content_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("content_items.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("broadcast_id", sa.String(length=32), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_notification_digest_entries_due",
+        "notification_digest_entries",
+        ["frequency", "created_at", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_digest_entries_due", table_name="notification_digest_entries")
+    op.drop_table("notification_digest_entries")
+    op.drop_column("user_preferences", "content_digest")
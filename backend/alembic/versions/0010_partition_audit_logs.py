@@ -0,0 +1,100 @@
+"""Partition audit_logs by month on Postgres.
+
+The table is rebuilt as ``PARTITION BY RANGE (created_at)`` with one partition per month
+that already holds rows, the current month and the next two, plus a default partition
+for anything outside those ranges. The primary key becomes ``(id, created_at)`` because
+Postgres requires the partition key in every unique constraint. Other dialects are left
+unpartitioned; the archival job deletes expired rows there instead.
+
+Revision ID: 0010_partition_audit_logs
+Revises: 0009_add_content_digest
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_partition_audit_logs"
+down_revision = "0009_add_content_digest"
+branch_labels = None
+depends_on = None
+
+
+POSTGRES_UPGRADE = (
+    "ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned",
+    "ALTER INDEX ix_audit_logs_created_at RENAME TO ix_audit_logs_unpartitioned_created_at",
+    """
+    CREATE TABLE audit_logs (
+        id uuid NOT NULL,
+        actor_id uuid REFERENCES users (id) ON DELETE SET NULL,
+        action_type varchar(100) NOT NULL,
+        target_type varchar(100) NOT NULL,
+        target_id varchar(255),
+        metadata json,
+        created_at timestamptz NOT NULL DEFAULT now(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """,
+    "CREATE INDEX ix_audit_logs_created_at ON audit_logs (created_at)",
+    "CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT",
+    """
+    DO $$
+    DECLARE
+        month date;
+    BEGIN
+        FOR month IN
+            SELECT generate_series(
+                date_trunc('month', least(
+                    coalesce((SELECT min(created_at) FROM audit_logs_unpartitioned), now()),
+                    now()
+                )),
+                date_trunc('month', now()) + interval '2 months',
+                interval '1 month'
+            )::date
+        LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                'audit_logs_' || to_char(month, '"y"YYYY"m"MM'),
+                month,
+                (month + interval '1 month')::date
+            );
+        END LOOP;
+    END $$
+    """,
+    "INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned",
+    "DROP TABLE audit_logs_unpartitioned",
+)
+
+POSTGRES_DOWNGRADE = (
+    "ALTER TABLE audit_logs RENAME TO audit_logs_partitioned",
+    "ALTER INDEX ix_audit_logs_created_at RENAME TO ix_audit_logs_partitioned_created_at",
+    """
+    CREATE TABLE audit_logs (
+        id uuid PRIMARY KEY,
+        actor_id uuid REFERENCES users (id) ON DELETE SET NULL,
+        action_type varchar(100) NOT NULL,
+        target_type varchar(100) NOT NULL,
+        target_id varchar(255),
+        metadata json,
+        created_at timestamptz NOT NULL DEFAULT now()
+    )
+    """,
+    "CREATE INDEX ix_audit_logs_created_at ON audit_logs (created_at)",
+    "INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned",
+    "DROP TABLE audit_logs_partitioned CASCADE",
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for statement in POSTGRES_UPGRADE:
+            op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for statement in POSTGRES_DOWNGRADE:
+            op.execute(sa.text(statement))
@@ -0,0 +1,40 @@
+"""Add composite indexes for keyset paging of audit logs.
+
+Each index ends in ``(created_at, id)`` so the admin listing, filtered by action type or
+actor or not at all, reads a page straight off the index. On the partitioned Postgres
+table the indexes are created on every partition.
+
+Revision ID: 0011_add_audit_log_keyset_indexes
+Revises: 0010_partition_audit_logs
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_add_audit_log_keyset_indexes"
+down_revision = "0010_partition_audit_logs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_audit_logs_created_at_id", "audit_logs", ["created_at", "id"])
+    op.create_index(
+        "ix_audit_logs_action_type_created_at",
+        "audit_logs",
+        ["action_type", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_audit_logs_actor_created_at", "audit_logs", ["actor_id", "created_at", "id"]
+    )
+    op.drop_index("ix_audit_logs_created_at", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+    op.drop_index("ix_audit_logs_actor_created_at", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_action_type_created_at", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_created_at_id", table_name="audit_logs")
@@ -0,0 +1,43 @@
+"""Add daily audit rollups and rollup watermarks.
+
+Revision ID: 0012_add_audit_daily_rollups
+Revises: 0011_add_audit_log_keyset_indexes
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_add_audit_daily_rollups"
+down_revision = "0011_add_audit_log_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_daily_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("action_type", sa.String(length=100), primary_key=True),
+        sa.Column("target_type", sa.String(length=100), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(length=64), primary_key=True),
+        sa.Column("high_water", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rollup_watermarks")
+    op.drop_table("audit_daily_rollups")
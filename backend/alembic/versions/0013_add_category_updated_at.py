@@ -0,0 +1,33 @@
+"""Add updated_at to categories so category listings can be revalidated.
+
+Revision ID: 0013_add_category_updated_at
+Revises: 0012_add_audit_daily_rollups
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_add_category_updated_at"
+down_revision = "0012_add_audit_daily_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "categories",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("categories", "updated_at")
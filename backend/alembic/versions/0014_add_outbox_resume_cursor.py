@@ -0,0 +1,27 @@
+"""Add a resume cursor to notification_outbox for chunked broadcasts.
+
+Revision ID: 0014_add_outbox_resume_cursor
+Revises: 0013_add_category_updated_at
+Create Date: 2026-10-17
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_add_outbox_resume_cursor"
+down_revision = "0013_add_category_updated_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notification_outbox", sa.Column("resume_cursor", sa.String(length=64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("notification_outbox", "resume_cursor")
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from ...config import get_settings
 from ...dependencies import get_current_admin, get_db
 from ...models.content import ContentItem, ContentStatus
 from ...models.user import User
-from ...schemas.audit import AuditLogActor, AuditLogEntry, AuditLogListResponse
+from ...schemas.audit import (
+    AuditLogActor,
+    AuditLogEntry,
+    AuditLogListResponse,
+    DailyStatsDay,
+    DailyStatsResponse,
+)
 from ...schemas.content import (
     AdminContentListResponse,
     AdminContentResponse,
     ContentUpdateRequest,
     ContentUpdateResponse,
 )
+from ...services.audit_export_service import MEDIA_TYPES, ExportFormat, stream_export
 from ...services.audit_service import list_logs as list_audit_logs
+from ...services.audit_service import log_action
 from ...services.content_service import ContentService
+from ...services.rollup_service import DASHBOARD_ACTIONS, daily_counts, high_water
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -61,16 +73,21 @@ async def create_content(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid category id"
         ) from exc
-    file_bytes = await file.read()
+
+    too_large_detail = f"File exceeds {get_settings().content_max_file_size_mb}MB limit"
+    if file.size is not None and file.size > ContentService.max_file_size_bytes():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=too_large_detail)
 
     try:
-        content = ContentService.create_content(
+        # The spooled upload is copied to storage in chunks off the event loop.
+        written = await run_in_threadpool(
+            ContentService.create_content,
             db,
             title=title,
             description=description,
             category_id=category_uuid,
             status=status_enum,
-            file_bytes=file_bytes,
+            file_obj=file.file,
             content_type=file.content_type or "",
             owner=admin,
         )
@@ -82,7 +99,7 @@ async def create_content(
             ) from exc
         if message == "file_too_large":
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="File exceeds 200MB limit"
+                status_code=status.HTTP_400_BAD_REQUEST, detail=too_large_detail
             ) from exc
         if message == "category_not_found":
             raise HTTPException(
@@ -90,7 +107,9 @@ async def create_content(
             ) from exc
         raise
 
-    return AdminContentResponse.model_validate(content)
+    return AdminContentResponse.model_validate(written.content).model_copy(
+        update={"broadcast_id": written.broadcast_id}
+    )
 
 
 @router.patch("/content/{content_id}", response_model=ContentUpdateResponse)
@@ -107,7 +126,7 @@ def update_content(
     status_enum = payload.status
 
     try:
-        updated = ContentService.update_content(
+        written = ContentService.update_content(
             db,
             content=content,
             actor=admin,
@@ -124,7 +143,9 @@ def update_content(
             ) from exc
         raise
 
-    return ContentUpdateResponse.model_validate(updated)
+    return ContentUpdateResponse.model_validate(written.content).model_copy(
+        update={"broadcast_id": written.broadcast_id}
+    )
 
 
 @router.patch("/content/{content_id}/archive", response_model=AdminContentResponse)
@@ -145,20 +166,33 @@ def archive_content(
 def get_audit_logs(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     action_type: Optional[str] = None,
+    actor_id: Optional[UUID] = None,
     start_at: Optional[datetime] = None,
     end_at: Optional[datetime] = None,
+    total_mode: Literal["exact", "estimated"] = Query("exact"),
     db: Session = Depends(get_db),
     admin: User = Depends(get_current_admin),
 ) -> AuditLogListResponse:
-    logs, total = list_audit_logs(
-        db,
-        page=page,
-        page_size=page_size,
-        action_type=action_type,
-        start_at=start_at,
-        end_at=end_at,
-    )
+    try:
+        result = list_audit_logs(
+            db,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            action_type=action_type,
+            actor_id=actor_id,
+            start_at=start_at,
+            end_at=end_at,
+            estimate_total=total_mode == "estimated",
+        )
+    except ValueError as exc:
+        if str(exc) == "invalid_cursor":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+        raise
 
     items = [
         AuditLogEntry(
@@ -179,7 +213,85 @@ def get_audit_logs(
                 else None
             ),
         )
-        for log in logs
+        for log in result.items
     ]
 
-    return AuditLogListResponse(items=items, page=page, page_size=page_size, total=total)
+    return AuditLogListResponse(
+        items=items,
+        page=page,
+        page_size=page_size,
+        total=result.total,
+        total_is_estimate=result.total_is_estimate,
+        next_cursor=result.next_cursor,
+    )
+
+
+@router.get("/audit/export", response_class=StreamingResponse)
+def export_audit_logs(
+    export_format: ExportFormat = Query(ExportFormat.csv, alias="format"),
+    compress: bool = Query(True, description="gzip the export"),
+    action_type: Optional[str] = None,
+    actor_id: Optional[UUID] = None,
+    start_at: Optional[datetime] = None,
+    end_at: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    admin: User = Depends(get_current_admin),
+) -> StreamingResponse:
+    filters = {
+        "action_type": action_type,
+        "actor_id": actor_id,
+        "start_at": start_at,
+        "end_at": end_at,
+    }
+    log_action(
+        db,
+        actor_id=admin.id,
+        action_type="admin.audit.export",
+        target_type="audit_log",
+        metadata={
+            "format": export_format.value,
+            **{key: str(value) for key, value in filters.items() if value is not None},
+        },
+    )
+    db.commit()
+
+    filename = f"audit-logs.{export_format.value}" + (".gz" if compress else "")
+    return StreamingResponse(
+        stream_export(db.get_bind(), export_format=export_format, compress=compress, **filters),
+        media_type="application/gzip" if compress else MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/stats/daily", response_model=DailyStatsResponse)
+def get_daily_stats(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db),
+    admin: User = Depends(get_current_admin),
+) -> DailyStatsResponse:
+    """Daily logins, registrations, likes, comments and downloads from the audit rollups."""
+
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=29)
+    if end < start or (end - start).days > 366:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid date range")
+
+    metric_by_action = {action: metric for metric, action in DASHBOARD_ACTIONS.items()}
+    rows = daily_counts(db, start=start, end=end, action_types=list(metric_by_action))
+    by_day: dict[date, dict[str, int]] = {}
+    totals = dict.fromkeys(DASHBOARD_ACTIONS, 0)
+    for row in rows:
+        metric = metric_by_action[row.action_type]
+        counts = by_day.setdefault(row.day, dict.fromkeys(DASHBOARD_ACTIONS, 0))
+        # Several target types can roll up into one action.
+        counts[metric] += row.count
+        totals[metric] += row.count
+
+    return DailyStatsResponse(
+        start=start,
+        end=end,
+        days=[DailyStatsDay(day=day, counts=counts) for day, counts in sorted(by_day.items())],
+        totals=totals,
+        up_to=high_water(db),
+    )
@@ -4,9 +4,11 @@ from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from ...database import get_db
 from ...config import get_settings
+from ...security import hash_password_async, verify_password_async
 from ...schemas.auth import (
     ForgotPasswordRequest,
     LoginRequest,
@@ -19,30 +21,28 @@ from ...schemas.auth import (
     VerifyEmailResponse,
 )
 from ...services.auth_service import AuthService
-from ...services.notification_service import send_verification_email
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED)
-def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> RegisterResponse:
+async def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> RegisterResponse:
+    password_hash = await hash_password_async(payload.password)
     try:
-        user = AuthService.register_user(
+        user, verification_token = await run_in_threadpool(
+            AuthService.register_user,
             db,
             email=payload.email,
             first_name=payload.first_name,
             last_name=payload.last_name,
-            password=payload.password,
+            password_hash=password_hash,
         )
     except ValueError as e:
         if str(e) == "email_already_registered":
             raise HTTPException(status_code=400, detail="Email already registered")
         raise
 
-    verification_token = AuthService.generate_verification_token(user)
-    send_verification_email(user, verification_token)
-
     return RegisterResponse(
         id=str(user.id),
         email=user.email,
@@ -104,7 +104,7 @@ def _clear_refresh_cookie(response: Response) -> None:
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(
+async def login(
     payload: LoginRequest,
     response: Response,
     request: Request,
@@ -112,20 +112,20 @@ def login(
 ) -> TokenResponse:
     device_info = request.headers.get("user-agent")
     ip_address = request.client.host if request.client else None
+    user = await run_in_threadpool(AuthService.get_user_by_email, db, payload.email)
+    if not user or not await verify_password_async(payload.password, user.password_hash):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
     try:
-        user, access_token, refresh_token, session = AuthService.login(
+        user, access_token, refresh_token, session = await run_in_threadpool(
+            AuthService.start_session,
             db,
-            email=payload.email,
-            password=payload.password,
+            user,
             device_info=device_info,
             ip_address=ip_address,
         )
     except ValueError as exc:
         message = str(exc)
-        if message == "invalid_credentials":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
-            )
         if message == "user_not_active":
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account not active")
         raise
@@ -245,12 +245,18 @@ def forgot_password(
 
 
 @router.post("/reset-password", response_model=MessageResponse)
-def reset_password(
+async def reset_password(
     payload: ResetPasswordRequest,
     db: Session = Depends(get_db),
 ) -> MessageResponse:
     try:
-        AuthService.reset_password(db, token=payload.token, new_password=payload.new_password)
+        reset_entry = await run_in_threadpool(
+            AuthService.validate_password_reset, db, token=payload.token
+        )
+        password_hash = await hash_password_async(payload.new_password)
+        await run_in_threadpool(
+            AuthService.complete_password_reset, db, reset_entry, password_hash=password_hash
+        )
     except ValueError as exc:
         message = str(exc)
         if message in {"invalid_token", "token_not_found", "token_used", "token_expired"}:
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy import desc, func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy import and_, func, literal, or_, tuple_
 from sqlalchemy.orm import Session
 
-from ...dependencies import get_current_user, get_db
+from ...category_catalog import get_category_catalog
+from ...dependencies import get_current_principal, get_db
 from ...models.comment import Comment, CommentStatus
 from ...models.content import ContentItem, ContentStatus
 from ...models.category import Category
-from ...models.like import Like
-from ...models.user import User
+from ...principal_cache import Principal
 from ...schemas.content import (
     ContentCategoryListResponse,
-    ContentCategoryResponse,
     ContentDownloadResponse,
+    MemberContentBatchResponse,
     MemberContentDetailResponse,
     MemberContentListResponse,
     MemberContentResponse,
@@ -29,173 +30,175 @@ from ...schemas.comment import (
     CommentUpdateRequest,
 )
 from ...schemas.like import LikeResponse
+from ...response_cache import catalog_version, get_content_listing_cache, listing_etag
 from ...services.audit_service import log_action
 from ...services.comment_service import create_comment, delete_comment, update_comment
-from ...services.download_service import generate_download_token
+from ...services.content_service import (
+    MAX_DETAIL_BATCH,
+    MEDIA_TYPES_BY_EXTENSION,
+    ContentDetail,
+    ContentService,
+)
+from ...services.download_service import generate_download_token, verify_download_token
 from ...services.like_service import add_like, remove_like
+from ...services.search_service import build_content_search, render_highlight
+from ...utils.http_cache import etag_matches, make_etag, not_modified
+from ...utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    parse_cursor_datetime,
+    parse_cursor_uuid,
+)
 
 
 router = APIRouter(prefix="/content", tags=["content"])
 
+# Member reads are revalidated on every use; categories change rarely enough to reuse briefly.
+_REVALIDATE = "private, no-cache"
+_CATEGORIES_CACHE_CONTROL = "private, max-age=60"
+
 
 @router.get("", response_model=MemberContentListResponse)
 def list_content(
     *,
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     page: int = Query(1, ge=1),
     page_size: int = Query(12, ge=1, le=50),
+    cursor: Optional[str] = Query(None),
     category_id: Optional[UUID] = Query(None),
     search: Optional[str] = Query(None),
     content_type: Optional[str] = Query(None),
     uploaded_after: Optional[datetime] = Query(None),
     uploaded_before: Optional[datetime] = Query(None),
-) -> MemberContentListResponse:
-    filters = [ContentItem.status == ContentStatus.published.value]
-
-    if category_id:
-        filters.append(ContentItem.category_id == category_id)
-
-    if search:
-        ilike = f"%{search}%"
-        filters.append(ContentItem.title.ilike(ilike) | ContentItem.description.ilike(ilike))
-
-    if content_type:
-        filters.append(ContentItem.file_type == content_type.lower())
-
-    if uploaded_after:
-        filters.append(ContentItem.created_at >= uploaded_after)
-
-    if uploaded_before:
-        filters.append(ContentItem.created_at <= uploaded_before)
-
-    likes_subq = (
-        db.query(Like.content_id.label("content_id"), func.count(Like.id).label("likes_count"))
-        .group_by(Like.content_id)
-        .subquery()
-    )
-    comments_subq = (
-        db.query(
-            Comment.content_id.label("content_id"),
-            func.count(Comment.id).label("comments_count"),
-        )
-        .filter(Comment.status == CommentStatus.active.value)
-        .group_by(Comment.content_id)
-        .subquery()
-    )
-
-    query = (
-        db.query(
-            ContentItem,
-            func.coalesce(likes_subq.c.likes_count, 0).label("likes_count"),
-            func.coalesce(comments_subq.c.comments_count, 0).label("comments_count"),
-            Category.name.label("category_name"),
+) -> Union[MemberContentListResponse, Response]:
+    """List published content.
+
+    Listings do not depend on the caller, so non-search pages are served from a shared
+    cache keyed on the normalized filters and the catalog version; any content, like or
+    comment write bumps the version. The ETag is derived from that key, so a client
+    revalidating an unchanged page gets a 304 before anything is loaded or rendered.
+    """
+
+    def load() -> MemberContentListResponse:
+        return _load_content_page(
+            db,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            category_id=category_id,
+            search=search,
+            content_type=content_type,
+            uploaded_after=uploaded_after,
+            uploaded_before=uploaded_before,
         )
-        .filter(*filters)
-        .outerjoin(likes_subq, ContentItem.id == likes_subq.c.content_id)
-        .outerjoin(comments_subq, ContentItem.id == comments_subq.c.content_id)
-        .outerjoin(Category, ContentItem.category_id == Category.id)
-    )
 
-    base_total_query = db.query(func.count(ContentItem.id)).filter(*filters)
-    total = base_total_query.scalar()
-    records = (
-        query.order_by(desc(ContentItem.published_at), desc(ContentItem.created_at))
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    if search:
+        return load()
+
+    key = (
+        catalog_version(),
+        page if not cursor else None,
+        page_size,
+        cursor,
+        category_id,
+        content_type.lower() if content_type else None,
+        uploaded_after.isoformat() if uploaded_after else None,
+        uploaded_before.isoformat() if uploaded_before else None,
     )
-
-    return MemberContentListResponse(
-        items=[
-            MemberContentResponse(
-                id=content.id,
-                title=content.title,
-                description=content.description,
-                file_type=content.file_type,
-                file_size=content.file_size,
-                category_id=content.category_id,
-                category_name=category_name,
-                published_at=content.published_at,
-                created_at=content.created_at,
-                updated_at=content.updated_at,
-                owner_id=content.owner_id,
-                likes_count=likes_count,
-                comments_count=comments_count,
-            )
-            for content, likes_count, comments_count, category_name in records
-        ],
-        total=total,
-        page=page,
-        page_size=page_size,
+    headers = {"etag": listing_etag(key), "cache-control": _REVALIDATE}
+    if etag_matches(request.headers.get("if-none-match"), headers["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    cached = get_content_listing_cache().get_or_load(
+        key, lambda: load().model_dump_json().encode("utf-8")
     )
+    return Response(content=cached.body, media_type="application/json", headers=headers)
 
 
 @router.get("/categories", response_model=ContentCategoryListResponse)
 def list_categories(
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> ContentCategoryListResponse:
-    categories = db.query(Category).order_by(Category.name.asc()).all()
-    return ContentCategoryListResponse(
-        items=[ContentCategoryResponse.model_validate(category) for category in categories]
-    )
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
+    catalog = get_category_catalog().snapshot(db)
+    headers = {"etag": catalog.etag, "cache-control": _CATEGORIES_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), catalog.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=catalog.body, media_type="application/json", headers=headers)
+
+
+@router.get("/batch", response_model=MemberContentBatchResponse)
+def get_content_batch(
+    ids: str = Query(..., description=f"Comma-separated content ids, at most {MAX_DETAIL_BATCH}"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+) -> MemberContentBatchResponse:
+    """Detail records for several published items, in request order.
+
+    Unknown or unpublished ids are left out rather than failing the whole batch.
+    """
+
+    try:
+        content_ids = [UUID(value.strip()) for value in ids.split(",") if value.strip()]
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid content id"
+        ) from exc
+
+    try:
+        details = ContentService.get_published_details(
+            db, content_ids=content_ids, viewer_id=current_user.id
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_DETAIL_BATCH} ids per request",
+        ) from exc
+
+    return MemberContentBatchResponse(items=[_detail_response(detail) for detail in details])
 
 
 @router.get("/{content_id}", response_model=MemberContentDetailResponse)
 def get_content_detail(
     content_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> MemberContentDetailResponse:
-    content = _get_published_content_or_404(db, content_id)
-
-    likes_count = db.query(Like).filter(Like.content_id == content.id).count()
-    comments_count = (
-        db.query(Comment)
-        .filter(Comment.content_id == content.id, Comment.status == CommentStatus.active.value)
-        .count()
-    )
-    liked_by_me = (
-        db.query(Like)
-        .filter(Like.content_id == content.id, Like.user_id == current_user.id)
-        .first()
-        is not None
+    current_user: Principal = Depends(get_current_principal),
+) -> Union[MemberContentDetailResponse, Response]:
+    detail = ContentService.get_published_detail(
+        db, content_id=content_id, viewer_id=current_user.id
     )
-    category_name = content.category.name if content.category else None
-    owner_name = None
-    if content.owner:
-        owner_name = " ".join(
-            filter(None, [content.owner.first_name, content.owner.last_name])
-        ).strip()
-        if not owner_name:
-            owner_name = content.owner.email
+    if detail is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content not found")
 
-    return MemberContentDetailResponse(
-        id=content.id,
-        title=content.title,
-        description=content.description,
-        file_type=content.file_type,
-        file_size=content.file_size,
-        category_id=content.category_id,
-        category_name=category_name,
-        published_at=content.published_at,
-        created_at=content.created_at,
-        updated_at=content.updated_at,
-        owner_id=content.owner_id,
-        status=ContentStatus(content.status),
-        likes_count=likes_count,
-        comments_count=comments_count,
-        liked_by_me=liked_by_me,
-        owner_name=owner_name,
+    content = detail.content
+    cached = not_modified(
+        request,
+        response,
+        etag=make_etag(
+            content.id,
+            content.updated_at,
+            content.likes_count,
+            content.comments_count,
+            detail.liked_by_me,
+            detail.category_name,
+            detail.owner_name,
+        ),
+        cache_control=_REVALIDATE,
     )
+    if cached:
+        return cached
+    return _detail_response(detail)
 
 
 @router.post("/{content_id}/download", response_model=ContentDownloadResponse)
 def generate_download(
     content_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> ContentDownloadResponse:
     content = _get_published_content_or_404(db, content_id)
 
@@ -214,13 +217,58 @@ def generate_download(
     return ContentDownloadResponse(token=token)
 
 
+@router.api_route("/{content_id}/file", methods=["GET", "HEAD"], response_class=FileResponse)
+def download_content_file(
+    content_id: UUID,
+    request: Request,
+    token: str = Query(..., description="Token issued by POST /content/{content_id}/download"),
+    db: Session = Depends(get_db),
+) -> Response:
+    """Serve a content file to the holder of a valid download token.
+
+    The file is handed to the ASGI server as a path so servers implementing the
+    ``http.response.pathsend`` extension can use sendfile(); ``Range``/``If-Range`` and
+    ``HEAD`` are handled by :class:`FileResponse`.
+    """
+
+    try:
+        verify_download_token(token, content_id=content_id)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid download token"
+        ) from exc
+
+    content = _get_published_content_or_404(db, content_id)
+    file_path = ContentService.resolve_content_file(content.file_path)
+    if file_path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    stat_result = file_path.stat()
+    if content.file_checksum:
+        etag = f'"{content.file_checksum}"'
+    else:
+        etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+    headers = {"etag": etag, "cache-control": "private, max-age=300"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return FileResponse(
+        file_path,
+        stat_result=stat_result,
+        media_type=MEDIA_TYPES_BY_EXTENSION.get(content.file_type, "application/octet-stream"),
+        filename=f"{content.title}.{content.file_type}",
+        headers=headers,
+    )
+
+
 @router.post(
     "/{content_id}/likes", response_model=LikeResponse, status_code=status.HTTP_201_CREATED
 )
 def like_content(
     content_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> LikeResponse:
     content = _get_published_content_or_404(db, content_id)
 
@@ -248,7 +296,7 @@ def like_content(
 def unlike_content(
     content_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     content = _get_published_content_or_404(db, content_id)
 
@@ -270,7 +318,7 @@ def unlike_content(
 def list_comments(
     content_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CommentListResponse:
     content = _get_published_content_or_404(db, content_id)
 
@@ -291,7 +339,7 @@ def create_comment_endpoint(
     content_id: UUID,
     payload: CommentCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CommentResponse:
     content = _get_published_content_or_404(db, content_id)
 
@@ -320,7 +368,7 @@ def update_comment_endpoint(
     comment_id: UUID,
     payload: CommentUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CommentResponse:
     comment = db.get(Comment, comment_id)
     if not comment or comment.status != CommentStatus.active.value:
@@ -352,7 +400,7 @@ def update_comment_endpoint(
 def delete_comment_endpoint(
     comment_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     comment = db.get(Comment, comment_id)
     if not comment or comment.status != CommentStatus.active.value:
@@ -374,6 +422,154 @@ def delete_comment_endpoint(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+def _load_content_page(
+    db: Session,
+    *,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    category_id: Optional[UUID],
+    search: Optional[str],
+    content_type: Optional[str],
+    uploaded_after: Optional[datetime],
+    uploaded_before: Optional[datetime],
+) -> MemberContentListResponse:
+    filters = [ContentItem.status == ContentStatus.published.value]
+
+    if category_id:
+        filters.append(ContentItem.category_id == category_id)
+
+    if content_type:
+        filters.append(ContentItem.file_type == content_type.lower())
+
+    if uploaded_after:
+        filters.append(ContentItem.created_at >= uploaded_after)
+
+    if uploaded_before:
+        filters.append(ContentItem.created_at <= uploaded_before)
+
+    content_search = build_content_search(db, search) if search else None
+    if content_search and cursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is not available for search results",
+        )
+
+    query = (
+        db.query(
+            ContentItem,
+            Category.name.label("category_name"),
+            (content_search.snippet if content_search else literal(None)).label("highlight"),
+        )
+        .filter(*filters)
+        .outerjoin(Category, ContentItem.category_id == Category.id)
+    )
+    base_total_query = db.query(func.count(ContentItem.id)).filter(*filters)
+    if content_search:
+        query = content_search.apply(query).order_by(content_search.rank.desc())
+        base_total_query = content_search.apply_filter(base_total_query)
+
+    total = base_total_query.scalar()
+
+    query = query.order_by(
+        ContentItem.published_at.desc().nulls_first(),
+        ContentItem.created_at.desc(),
+        ContentItem.id.desc(),
+    )
+    if cursor:
+        try:
+            query = query.filter(_after_cursor(cursor))
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    records = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(records) > page_size:
+        records = records[:page_size]
+        if not content_search:
+            last = records[-1][0]
+            next_cursor = encode_cursor([last.published_at, last.created_at, last.id])
+
+    return MemberContentListResponse(
+        items=[
+            MemberContentResponse(
+                id=content.id,
+                title=content.title,
+                description=content.description,
+                file_type=content.file_type,
+                file_size=content.file_size,
+                category_id=content.category_id,
+                category_name=category_name,
+                published_at=content.published_at,
+                created_at=content.created_at,
+                updated_at=content.updated_at,
+                owner_id=content.owner_id,
+                likes_count=content.likes_count,
+                comments_count=content.comments_count,
+                highlight=render_highlight(highlight),
+            )
+            for content, category_name, highlight in records
+        ],
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+    )
+
+
+def _after_cursor(cursor: str):
+    """Keyset predicate for rows after ``cursor`` in the member listing order.
+
+    Listing order is ``published_at DESC NULLS FIRST, created_at DESC, id DESC`` so the
+    ``ix_content_items_listing`` index can serve it with a backward scan.
+    """
+
+    published_raw, created_raw, id_raw = decode_cursor(cursor, size=3)
+    published_at = parse_cursor_datetime(published_raw)
+    created_at = parse_cursor_datetime(created_raw)
+    content_id = parse_cursor_uuid(id_raw)
+    if created_at is None:
+        raise ValueError("invalid_cursor")
+
+    if published_at is None:
+        return or_(
+            ContentItem.published_at.is_not(None),
+            and_(
+                ContentItem.published_at.is_(None),
+                tuple_(ContentItem.created_at, ContentItem.id) < tuple_(created_at, content_id),
+            ),
+        )
+    return tuple_(ContentItem.published_at, ContentItem.created_at, ContentItem.id) < tuple_(
+        published_at, created_at, content_id
+    )
+
+
+def _detail_response(detail: ContentDetail) -> MemberContentDetailResponse:
+    content = detail.content
+    return MemberContentDetailResponse(
+        id=content.id,
+        title=content.title,
+        description=content.description,
+        file_type=content.file_type,
+        file_size=content.file_size,
+        category_id=content.category_id,
+        category_name=detail.category_name,
+        published_at=content.published_at,
+        created_at=content.created_at,
+        updated_at=content.updated_at,
+        owner_id=content.owner_id,
+        status=ContentStatus(content.status),
+        likes_count=content.likes_count,
+        comments_count=content.comments_count,
+        liked_by_me=detail.liked_by_me,
+        owner_name=detail.owner_name,
+    )
+
+
 def _get_published_content_or_404(db: Session, content_id: UUID) -> ContentItem:
     content = db.get(ContentItem, content_id)
     if not content or content.status != ContentStatus.published.value:
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+from typing import Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
 from ...dependencies import get_current_user
 from ...database import get_db
-from ...models.preference import PrivacyLevel
+from ...models.preference import ContentDigest, PrivacyLevel
 from ...models.user import User
 from ...schemas.profile import (
     ProfileResponse,
@@ -19,6 +20,7 @@ from ...schemas.profile import (
     PreferencesUpdateResponse,
 )
 from ...services.profile_service import ProfileService
+from ...utils.http_cache import make_etag, not_modified
 
 
 def _load_user_with_profile(db: Session, user_id) -> User:
@@ -63,16 +65,37 @@ def _serialize_profile(user: User) -> ProfileResponse:
         notify_content=preferences.notify_content if preferences else None,
         notify_community=preferences.notify_community if preferences else None,
         notify_account=preferences.notify_account if preferences else None,
+        content_digest=preferences.content_digest if preferences else None,
     )
 
 
 @router.get("/me", response_model=ProfileResponse)
 def get_my_profile(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
-) -> ProfileResponse:
-    refreshed = _load_user_with_profile(db, current_user.id)
-    return _serialize_profile(refreshed)
+) -> Union[ProfileResponse, Response]:
+    # The profile is rendered from these three rows; their updated_at stamps version it.
+    # get_current_user joined the profile and preferences in, so this costs no query.
+    profile = current_user.profile
+    preferences = current_user.preferences
+    cached = not_modified(
+        request,
+        response,
+        etag=make_etag(
+            current_user.id,
+            current_user.updated_at,
+            profile.updated_at if profile else None,
+            preferences.updated_at if preferences else None,
+        ),
+        cache_control="private, no-cache",
+    )
+    if cached:
+        return cached
+
+    ProfileService.ensure_preferences(db, current_user)
+    return _serialize_profile(current_user)
 
 
 @router.patch("/me", response_model=ProfileUpdateResponse)
@@ -175,6 +198,7 @@ def update_preferences(
         notify_content=payload.notify_content,
         notify_community=payload.notify_community,
         notify_account=payload.notify_account,
+        content_digest=ContentDigest(payload.content_digest) if payload.content_digest else None,
     )
 
     refreshed = _load_user_with_profile(db, current_user.id)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from .config import get_settings
+from .models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedAuditSink:
+    """Writes audit rows from a background thread in multi-row INSERTs.
+
+    Rows are flushed once ``flush_size`` are queued or the oldest has waited
+    ``flush_interval_seconds``. Buffered rows are lost if the process dies before a flush,
+    which is why only low-value, high-volume actions are routed here (see
+    ``audit_buffered_actions``). When the queue is full :meth:`submit` refuses the row and
+    the caller writes it synchronously instead.
+    """
+
+    def __init__(self, *, flush_size: int, flush_interval_seconds: float, max_queue: int) -> None:
+        self.flush_size = flush_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue = max_queue
+        self._queue: Deque[tuple[Engine, dict[str, Any]]] = deque()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._submitted = 0
+        self._rejected = 0
+        self._written = 0
+        self._failed = 0
+        self._flushes = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+
+    def submit(self, bind: Engine, row: dict[str, Any]) -> bool:
+        with self._condition:
+            if self._closed or len(self._queue) >= self.max_queue:
+                self._rejected += 1
+                return False
+            self._queue.append((bind, row))
+            self._submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+                self._thread.start()
+            if len(self._queue) >= self.flush_size:
+                self._condition.notify()
+        return True
+
+    def flush(self) -> int:
+        """Write everything queued so far; returns the number of rows written."""
+
+        with self._flush_lock:
+            with self._condition:
+                batch = list(self._queue)
+                self._queue.clear()
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            written = 0
+            by_bind: dict[Engine, list[dict[str, Any]]] = {}
+            for bind, row in batch:
+                by_bind.setdefault(bind, []).append(row)
+            for bind, rows in by_bind.items():
+                written += self._write(bind, rows)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            with self._condition:
+                self._written += written
+                self._failed += len(batch) - written
+                self._flushes += 1
+                self._last_flush_ms = elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            return written
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "queue_depth": len(self._queue),
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "written": self._written,
+                "failed": self._failed,
+                "flushes": self._flushes,
+                "last_flush_ms": round(self._last_flush_ms, 3),
+                "max_flush_ms": round(self._max_flush_ms, 3),
+            }
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._closed = True
+            thread, self._thread = self._thread, None
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._queue) < self.flush_size:
+                    self._condition.wait(self.flush_interval_seconds)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover - _write already isolates row failures
+                logger.exception("Audit sink flush failed")
+            if closed:
+                return
+
+    def _write(self, bind: Engine, rows: list[dict[str, Any]]) -> int:
+        try:
+            # executemany of a single INSERT: SQLAlchemy sends it as multi-row VALUES batches.
+            with bind.begin() as connection:
+                connection.execute(insert(AuditLog.__table__), rows)
+            return len(rows)
+        except Exception:
+            if len(rows) == 1:
+                logger.exception(
+                    "Dropping audit entry that could not be written",
+                    extra={"action_type": rows[0]["action_type"]},
+                )
+                return 0
+        # One bad row (e.g. its actor was deleted meanwhile) must not take the batch with it.
+        return sum(self._write(bind, [row]) for row in rows)
+
+
+_sink: Optional[BufferedAuditSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_audit_sink() -> BufferedAuditSink:
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            settings = get_settings()
+            _sink = BufferedAuditSink(
+                flush_size=settings.audit_buffer_flush_size,
+                flush_interval_seconds=settings.audit_buffer_flush_interval_ms / 1000,
+                max_queue=settings.audit_buffer_max_queue,
+            )
+        return _sink
+
+
+def shutdown_audit_sink() -> None:
+    """Flush buffered audit rows and stop the writer thread."""
+
+    global _sink
+    with _sink_lock:
+        sink, _sink = _sink, None
+    if sink is not None:
+        sink.shutdown()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, SessionTransaction
+
+from .config import get_settings
+from .models.category import Category
+from .response_cache import CachedResponse
+from .schemas.content import ContentCategoryListResponse, ContentCategoryResponse
+
+_CATEGORIES_CHANGED_KEY = "categories_changed"
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    """Immutable view of the ``categories`` table, ready to serve without further queries."""
+
+    version: tuple[Any, ...]
+    by_id: Mapping[UUID, ContentCategoryResponse]
+    items: tuple[ContentCategoryResponse, ...]
+    body: bytes
+    etag: str
+
+
+class CategoryCatalog:
+    """Process-local category catalog shared by the categories route and validation.
+
+    Category writes committed in this process drop the snapshot. Writes made elsewhere are
+    picked up by a cheap ``count``/``max(updated_at)`` version check that runs at most once
+    every ``check_seconds``.
+    """
+
+    def __init__(self, *, check_seconds: float) -> None:
+        self.check_seconds = check_seconds
+        self._snapshot: Optional[CategorySnapshot] = None
+        self._checked_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._checks = 0
+        self._reloads = 0
+        self._invalidations = 0
+
+    def snapshot(self, db: Session) -> CategorySnapshot:
+        with self._lock:
+            current = self._snapshot
+            if current is not None and time.monotonic() < self._checked_at + self.check_seconds:
+                self._hits += 1
+                return current
+            generation = self._generation
+
+        version = tuple(
+            db.execute(select(func.count(Category.id), func.max(Category.updated_at))).one()
+        )
+        reload = current is None or current.version != version
+        if reload:
+            current = _load_snapshot(db, version)
+
+        with self._lock:
+            self._checks += 1
+            self._reloads += int(reload)
+            # Keep a snapshot read before a concurrent invalidation out of the catalog.
+            if generation == self._generation:
+                self._snapshot = current
+                self._checked_at = time.monotonic()
+        return current
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._generation += 1
+            self._snapshot = None
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "categories": len(self._snapshot.items) if self._snapshot else 0,
+                "hits": self._hits,
+                "version_checks": self._checks,
+                "reloads": self._reloads,
+                "invalidations": self._invalidations,
+            }
+
+
+_catalog: Optional[CategoryCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_category_catalog() -> CategoryCatalog:
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = CategoryCatalog(check_seconds=get_settings().category_catalog_check_seconds)
+        return _catalog
+
+
+def _load_snapshot(db: Session, version: tuple[Any, ...]) -> CategorySnapshot:
+    categories = db.execute(select(Category).order_by(Category.name.asc())).scalars().all()
+    items = tuple(ContentCategoryResponse.model_validate(category) for category in categories)
+    # The ETag digests the body rather than the version, which can repeat within one
+    # timestamp tick (a rename and a revert in the same second).
+    response = CachedResponse.from_body(
+        ContentCategoryListResponse(items=list(items)).model_dump_json().encode("utf-8")
+    )
+    return CategorySnapshot(
+        version=version,
+        by_id={item.id: item for item in items},
+        items=items,
+        body=response.body,
+        etag=response.etag,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _detect_category_writes(session: Session, flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Category):
+            session.info[_CATEGORIES_CHANGED_KEY] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if session.info.pop(_CATEGORIES_CHANGED_KEY, False):
+        get_category_catalog().invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session: Session, previous: SessionTransaction) -> None:
+    if previous.parent is None:
+        session.info.pop(_CATEGORIES_CHANGED_KEY, None)
@@ -41,11 +41,79 @@ class Settings(BaseSettings):
     refresh_cookie_domain: Optional[str] = Field(default=None)
     auth_rate_limit_attempts: int = Field(default=5, ge=1)
     auth_rate_limit_window_minutes: int = Field(default=15, ge=1)
+    auth_rate_limit_max_keys: int = Field(
+        default=100_000, ge=1, description="Client keys tracked before the oldest are evicted"
+    )
+    auth_rate_limit_backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="memory: per-process limiter; sqlite: GCRA shared by all local workers",
+    )
+    auth_rate_limit_sqlite_path: str = Field(
+        default="storage/rate_limits.sqlite3",
+        description="State file for the sqlite rate-limit backend",
+    )
+    password_hash_workers: int = Field(
+        default=2, ge=1, description="Worker processes reserved for password hashing"
+    )
+    password_hash_queue_size: int = Field(
+        default=32,
+        ge=0,
+        description="Hashing jobs allowed to wait for a worker before auth requests get 503",
+    )
+    principal_cache_ttl_seconds: int = Field(
+        default=30, ge=0, description="Seconds an authenticated principal stays cached (0 = off)"
+    )
+    principal_cache_max_entries: int = Field(default=10_000, ge=1)
+    content_listing_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds a member content listing page stays cached (0 = off)",
+    )
+    content_listing_cache_max_entries: int = Field(default=512, ge=1)
+    content_listing_cache_max_bytes: int = Field(default=16 * 1024 * 1024, ge=1)
+    category_catalog_check_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds between checks for category changes made by other processes",
+    )
+    audit_buffer_enabled: bool = Field(
+        default=False, description="Write audit_buffered_actions through the buffered sink"
+    )
+    audit_buffered_actions: List[str] = Field(
+        default_factory=lambda: [
+            "content.like",
+            "content.unlike",
+            "content.download.request",
+            "auth.refresh",
+        ],
+        description="High-volume, non-security-critical actions that may be buffered",
+    )
+    audit_count_cache_seconds: int = Field(
+        default=60, ge=0, description="Lifetime of cached audit log counts (estimated totals)"
+    )
+    audit_rollup_lag_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Audit rows younger than this are left for the next rollup run",
+    )
+    audit_buffer_flush_size: int = Field(default=200, ge=1)
+    audit_buffer_flush_interval_ms: int = Field(default=500, ge=1)
+    audit_buffer_max_queue: int = Field(
+        default=10_000, ge=1, description="Buffered rows beyond this are written synchronously"
+    )
 
     media_root: str = Field(default="storage", description="Root directory for uploaded media")
     avatar_subdir: str = Field(default="avatars", description="Subdirectory for avatar uploads")
     content_subdir: str = Field(default="content", description="Subdirectory for content files")
     content_max_file_size_mb: int = Field(default=200, ge=1)
+    audit_retention_months: int = Field(
+        default=12,
+        ge=0,
+        description="Months of audit logs kept in the database before archival (0 = forever)",
+    )
+    audit_archive_subdir: str = Field(
+        default="audit_archive", description="Subdirectory of media_root for audit archives"
+    )
 
     cors_origins: List[str] = Field(
         default_factory=lambda: ["http://localhost:5173"],
@@ -75,10 +143,38 @@ class Settings(BaseSettings):
 
     notification_provider: str = Field(
         default="logging",
-        description="Notification provider backend to use (e.g., logging, sendgrid, twilio)",
+        description="Notification provider backend to use (e.g., logging, fake, sendgrid, twilio)",
+    )
+    notification_batch_size: int = Field(
+        default=500, ge=1, description="Recipients loaded per batch when broadcasting"
+    )
+    notification_send_concurrency: int = Field(
+        default=8, ge=1, description="Notification batches sent in parallel per broadcast"
+    )
+    notification_fake_latency_ms: float = Field(
+        default=50.0, ge=0, description="Simulated round trip of the 'fake' provider"
+    )
+    notification_fake_batch_size: int = Field(
+        default=1000, ge=1, description="Messages per call accepted by the 'fake' provider"
+    )
+    notification_outbox_enabled: bool = Field(
+        default=False,
+        description="Write notifications to the outbox table for notification_worker to send",
+    )
+    notification_outbox_batch_size: int = Field(default=100, ge=1)
+    notification_outbox_lease_seconds: int = Field(
+        default=300,
+        ge=1,
+        description="How long a worker holds an outbox row; renewed per row and per chunk",
+    )
+    notification_outbox_max_attempts: int = Field(default=8, ge=1)
+    notification_outbox_retry_base_seconds: float = Field(default=5.0, gt=0)
+    notification_outbox_retry_max_seconds: float = Field(default=3600.0, gt=0)
+    notification_outbox_sent_retention_hours: int = Field(
+        default=168, ge=0, description="Hours sent outbox rows are kept before purging (0 = keep)"
     )
 
-    @field_validator("cors_origins", "allowed_hosts", mode="before")
+    @field_validator("cors_origins", "allowed_hosts", "audit_buffered_actions", mode="before")
     @classmethod
     def split_comma_separated(cls, value: str | List[str]) -> List[str]:
         if isinstance(value, str):
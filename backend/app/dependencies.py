@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from .database import get_db
 from .models.user import User, UserStatus
+from .principal_cache import Principal, load_principal
 from .security import TokenError, decode_token
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(
+def get_current_principal(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
-) -> User:
+) -> Principal:
+    """Authenticate the bearer token and return a cached principal snapshot.
+
+    Prefer this over :func:`get_current_user` in routes that only need the caller's id or
+    role; it skips loading the user with its joined profile and preferences.
+    """
+
     try:
         payload = decode_token(token, purpose="access")
     except TokenError:
@@ -25,13 +34,28 @@ def get_current_user(
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.get(User, user_id)
-    if not user:
+    try:
+        user_uuid = UUID(str(user_id))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+
+    principal = load_principal(db, user_uuid)
+    if not principal:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
-    if user.status != UserStatus.active.value:
+    if principal.status != UserStatus.active.value:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account not active")
 
+    return principal
+
+
+def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+) -> User:
+    user = db.get(User, principal.id)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
 
 
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from .config import get_settings
+
+T = TypeVar("T")
+
+
+class HashingPoolSaturated(RuntimeError):
+    """Raised when the password hashing pool already has its maximum pending work."""
+
+    def __init__(self, pending: int) -> None:
+        super().__init__("hashing_pool_saturated")
+        self.pending = pending
+
+
+class HashingPool:
+    """Bounded process pool for CPU-heavy password hashing.
+
+    bcrypt holds a CPU for hundreds of milliseconds; running it in worker processes keeps
+    it off the event loop and off the shared anyio threadpool, and the pending limit turns
+    a login burst into fast 503s instead of an ever-growing queue.
+    """
+
+    def __init__(self, *, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self.max_pending = workers + queue_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise HashingPoolSaturated(self._pending)
+            if self._executor is None:
+                self._executor = self._new_executor()
+            try:
+                future = self._executor.submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); start a fresh pool for this and later calls.
+                self._executor = self._new_executor()
+                future = self._executor.submit(fn, *args)
+            self._pending += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def prewarm(self, timeout: Optional[float] = None) -> None:
+        """Start the worker processes now so the first logins do not pay for it."""
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_executor()
+            executor = self._executor
+        # One task per worker makes the executor start all of them.
+        futures = [executor.submit(_ready) for _ in range(self.workers)]
+        wait_futures(futures, timeout=timeout)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Forking the server would copy its threads, held locks and open DB connections
+        # into the workers; start them from a clean forkserver instead.
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=_process_context())
+
+    def _on_done(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Imported once in the fork server, so new workers start with the app modules loaded.
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _ready() -> None:
+    return None
+
+
+_pool: Optional[HashingPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool() -> HashingPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            settings = get_settings()
+            _pool = HashingPool(
+                workers=settings.password_hash_workers,
+                queue_size=settings.password_hash_queue_size,
+            )
+        return _pool
+
+
+def shutdown_hashing_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
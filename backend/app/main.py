@@ -1,18 +1,30 @@
-from fastapi import FastAPI
+import logging
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
 
+from .audit_sink import get_audit_sink, shutdown_audit_sink
+from .category_catalog import get_category_catalog
 from .config import get_settings
 from .api.routes import admin as admin_routes
 from .api.routes import auth as auth_routes
 from .api.routes import content as content_routes
 from .api.routes import profile as profile_routes
+from .principal_cache import get_principal_cache
+from .response_cache import content_listing_stats
+from .services.notification_service import shutdown_notification_dispatcher
 from .middleware.rate_limit import AuthRateLimitMiddleware
-from .database import remove_session
+from .middleware.upload_limit import UploadSizeLimitMiddleware
+from .database import remove_session, session_scope
+from .hashing_pool import HashingPoolSaturated, get_hashing_pool, shutdown_hashing_pool
 from .logging_config import configure_logging
 from .telemetry import collect_runtime_metrics
 
 settings = get_settings()
 configure_logging(settings.log_level)
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=settings.app_name,
@@ -31,6 +43,7 @@ app.add_middleware(
 )
 
 app.add_middleware(AuthRateLimitMiddleware)
+app.add_middleware(UploadSizeLimitMiddleware)
 
 app.include_router(auth_routes.router)
 app.include_router(profile_routes.router)
@@ -38,6 +51,17 @@ app.include_router(content_routes.router)
 app.include_router(admin_routes.router)
 
 
+@app.exception_handler(HashingPoolSaturated)
+async def hashing_pool_saturated_handler(
+    request: Request, exc: HashingPoolSaturated
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication is temporarily busy, please retry"},
+        headers={"Retry-After": "1", "X-Hashing-Queue-Depth": str(exc.pending)},
+    )
+
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the Community App API"}
@@ -51,13 +75,35 @@ def health_check():
 @app.get("/metrics")
 def metrics():
     """Placeholder metrics endpoint for future observability integrations."""
-    return {"status": "ok", "details": collect_runtime_metrics()}
+    return {
+        "status": "ok",
+        "details": collect_runtime_metrics(),
+        "password_hashing": get_hashing_pool().stats(),
+        "principal_cache": get_principal_cache().stats(),
+        "content_listing_cache": content_listing_stats(),
+        "category_catalog": get_category_catalog().stats(),
+        "audit_sink": get_audit_sink().stats(),
+    }
+
+
+@app.on_event("startup")
+def startup_event() -> None:
+    """Start hashing workers and load the category catalog so first requests skip it."""
+    get_hashing_pool().prewarm(timeout=30)
+    try:
+        with session_scope() as db:
+            get_category_catalog().snapshot(db)
+    except SQLAlchemyError:
+        logger.warning("Category catalog not preloaded; it will load on first use")
 
 
 @app.on_event("shutdown")
 def shutdown_event() -> None:
     """Ensure scoped sessions are cleaned up when application stops."""
     remove_session()
+    shutdown_hashing_pool()
+    shutdown_notification_dispatcher()
+    shutdown_audit_sink()
 
 
 if __name__ == "__main__":
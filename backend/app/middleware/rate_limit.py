@@ -1,46 +1,58 @@
 from __future__ import annotations
 
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..config import get_settings
 from ..utils.rate_limiter import auth_rate_limiter
 
 
-class AuthRateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limit selected auth endpoints using an in-process store."""
+class AuthRateLimitMiddleware:
+    """Rate limit selected auth endpoints.
 
-    _LIMITED_PATHS = {
-        ("POST", "/auth/login"),
-        ("POST", "/auth/register"),
-        ("POST", "/auth/forgot-password"),
-        ("POST", "/auth/reset-password"),
-    }
+    Written as plain ASGI so every other request is passed straight through to the app
+    without the task and stream wrapping that ``BaseHTTPMiddleware`` adds.
+    """
+
+    _LIMITED_PATHS = frozenset(
+        {
+            ("POST", "/auth/login"),
+            ("POST", "/auth/register"),
+            ("POST", "/auth/forgot-password"),
+            ("POST", "/auth/reset-password"),
+        }
+    )
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         settings = get_settings()
         self.limit = settings.auth_rate_limit_attempts
         self.window = settings.auth_rate_limit_window_minutes * 60
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-        if (request.method, request.url.path) in self._LIMITED_PATHS:
-            client_host = request.client.host if request.client else "unknown"
-            key = f"{client_host}:{request.url.path}"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in self._LIMITED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
+        key = f"{client_host}:{scope['path']}"
+        if auth_rate_limiter.blocking:
+            retry_after = await run_in_threadpool(auth_rate_limiter.check, key)
+        else:
             retry_after = auth_rate_limiter.check(key)
-            if retry_after is not None:
-                headers = {"Retry-After": str(int(retry_after))}
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "detail": "Too many requests. Please try again later.",
-                        "limit": self.limit,
-                        "window_seconds": self.window,
-                    },
-                    headers=headers,
-                )
-
-        response = await call_next(request)
-        return response
+        if retry_after is None:
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            status_code=429,
+            content={
+                "detail": "Too many requests. Please try again later.",
+                "limit": self.limit,
+                "window_seconds": self.window,
+            },
+            headers={"Retry-After": str(int(retry_after))},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import get_settings
+
+# Room for the form fields and multipart boundaries around the file itself.
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Cap request bodies on upload endpoints while they are still arriving.
+
+    Starlette's multipart parser spools file parts to disk before the route runs, so a
+    check in the route only fires once the whole body has been written. A declared
+    ``Content-Length`` over the cap is refused before anything is read, and a body that
+    grows past it mid-stream is cut off with a 413.
+    """
+
+    _LIMITED_PATHS = frozenset({("POST", "/admin/content")})
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in self._LIMITED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        max_mb = get_settings().content_max_file_size_mb
+        max_body = max_mb * 1024 * 1024 + FORM_OVERHEAD_BYTES
+        detail = f"File exceeds {max_mb}MB limit"
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > max_body:
+            response = JSONResponse(status_code=413, content={"detail": detail})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body:
+                    # Raised inside body parsing, so FastAPI passes it on to its handler.
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
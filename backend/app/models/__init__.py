@@ -1,8 +1,11 @@
 from .audit import AuditLog
+from .audit_rollup import AuditDailyRollup, RollupWatermark
 from .category import Category
 from .comment import Comment
 from .content import ContentItem
 from .like import Like
+from .notification_digest import NotificationDigestEntry
+from .notification_outbox import NotificationOutbox
 from .preference import UserPreference
 from .profile import UserProfile
 from .session import UserSession
@@ -10,16 +13,20 @@ from .user import User
 from .password_reset import PasswordResetToken
 
 __all__ = [
+    "AuditDailyRollup",
     "AuditLog",
     "Category",
     "Comment",
     "ContentItem",
     "Like",
+    "NotificationDigestEntry",
+    "NotificationOutbox",
     "UserPreference",
     "UserProfile",
     "UserSession",
     "User",
     "PasswordResetToken",
+    "RollupWatermark",
     "UserStatus",
 ]
 from .user import UserStatus
@@ -12,8 +12,14 @@ from ..database import Base
 
 
 class AuditLog(Base):
+    # On Postgres the table is range-partitioned by month on created_at (migration 0010,
+    # primary key (id, created_at)); partitions are managed by scripts/audit_archive.py.
     __tablename__ = "audit_logs"
-    __table_args__ = (Index("ix_audit_logs_created_at", "created_at"),)
+    __table_args__ = (
+        Index("ix_audit_logs_created_at_id", "created_at", "id"),
+        Index("ix_audit_logs_action_type_created_at", "action_type", "created_at", "id"),
+        Index("ix_audit_logs_actor_created_at", "actor_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     actor_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class AuditDailyRollup(Base):
+    """Audit entries per UTC day, action and target type, maintained by rollup_service."""
+
+    __tablename__ = "audit_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    action_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+    target_type: Mapped[str] = mapped_column(String(100), primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class RollupWatermark(Base):
+    """How far (by source ``created_at``) a rollup has consumed its source table."""
+
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    high_water: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
@@ -5,7 +5,18 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +31,9 @@ class ContentStatus(str, Enum):
 
 class ContentItem(Base):
     __tablename__ = "content_items"
+    __table_args__ = (
+        Index("ix_content_items_listing", "status", "published_at", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -27,6 +41,7 @@ class ContentItem(Base):
     file_path: Mapped[str] = mapped_column(String(512), nullable=False)
     file_type: Mapped[str] = mapped_column(String(64), nullable=False)
     file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    file_checksum: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     category_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("categories.id", ondelete="SET NULL"), nullable=True
     )
@@ -37,6 +52,10 @@ class ContentItem(Base):
         String(32), nullable=False, default=ContentStatus.draft.value
     )
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    likes_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    comments_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -48,3 +67,64 @@ class ContentItem(Base):
     owner = relationship("User", back_populates="content_items")
     comments = relationship("Comment", back_populates="content", cascade="all, delete-orphan")
     likes = relationship("Like", back_populates="content", cascade="all, delete-orphan")
+
+
+# Full-text search shadow structures. Postgres keeps a generated ``tsvector`` column with a
+# GIN index; SQLite (tests, local dev) keeps an external-content FTS5 table synced by
+# triggers. Both are queried through ``services.search_service``.
+CONTENT_SEARCH_POSTGRES_DDL = (
+    """
+    ALTER TABLE content_items ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_content_items_search_vector "
+    "ON content_items USING gin (search_vector)",
+)
+
+CONTENT_SEARCH_SQLITE_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS content_items_fts USING fts5(
+        title, description,
+        content='content_items', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS content_items_fts_ai AFTER INSERT ON content_items BEGIN
+        INSERT INTO content_items_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS content_items_fts_ad AFTER DELETE ON content_items BEGIN
+        INSERT INTO content_items_fts(content_items_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS content_items_fts_au
+    AFTER UPDATE OF title, description ON content_items BEGIN
+        INSERT INTO content_items_fts(content_items_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO content_items_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+)
+
+for _statement in CONTENT_SEARCH_POSTGRES_DDL:
+    event.listen(
+        ContentItem.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
+for _statement in CONTENT_SEARCH_SQLITE_DDL:
+    event.listen(
+        ContentItem.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    ContentItem.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS content_items_fts").execute_if(dialect="sqlite"),
+)
@@ -17,6 +17,12 @@ class PrivacyLevel(str, Enum):
     admin = "admin"
 
 
+class ContentDigest(str, Enum):
+    immediate = "immediate"
+    hourly = "hourly"
+    daily = "daily"
+
+
 class UserPreference(Base):
     __tablename__ = "user_preferences"
 
@@ -31,6 +37,9 @@ class UserPreference(Base):
     notify_content: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     notify_community: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     notify_account: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    content_digest: Mapped[str] = mapped_column(
+        String(16), nullable=False, default=ContentDigest.immediate.value
+    )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .config import get_settings
+from .models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authorization-relevant slice of a user, safe to share across requests."""
+
+    id: UUID
+    email: str
+    status: str
+    is_admin: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, status=user.status, is_admin=user.is_admin)
+
+
+class PrincipalCache:
+    """Thread-safe TTL + LRU cache of :class:`Principal` snapshots keyed by user id.
+
+    Entries are dropped explicitly when a service changes a user in this process; the TTL
+    bounds staleness for changes made elsewhere (other workers, scripts, SQL).
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[UUID, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, user_id: UUID) -> Optional[Principal]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[user_id]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, principal: Principal) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[principal.id] = (expires_at, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+
+_cache: Optional[PrincipalCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> PrincipalCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = get_settings()
+            _cache = PrincipalCache(
+                ttl_seconds=settings.principal_cache_ttl_seconds,
+                max_entries=settings.principal_cache_max_entries,
+            )
+        return _cache
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """Drop the cached snapshot for ``user_id``; call after committing a user change."""
+
+    get_principal_cache().invalidate(user_id)
+
+
+def load_principal(db: Session, user_id: UUID) -> Optional[Principal]:
+    """Return the principal for ``user_id`` from the cache or a single-table lookup."""
+
+    cache = get_principal_cache()
+    principal = cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    row = db.execute(
+        select(User.id, User.email, User.status, User.is_admin).where(User.id == user_id)
+    ).one_or_none()
+    if row is None:
+        return None
+    principal = Principal(id=row.id, email=row.email, status=row.status, is_admin=row.is_admin)
+    cache.put(principal)
+    return principal
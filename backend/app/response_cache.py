@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from .config import get_settings
+from .models.category import Category
+from .models.comment import Comment
+from .models.content import ContentItem
+from .models.like import Like
+from .utils.http_cache import make_etag
+
+_CATALOG_MODELS = (ContentItem, Category, Like, Comment)
+_CATALOG_CHANGED_KEY = "catalog_changed"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedResponse":
+        # Digested once when the entry is filled; hits and 304s reuse it.
+        return cls(body=body, etag=f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"')
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of encoded response bodies, capped by count and bytes.
+
+    Concurrent misses for the same key are coalesced: one caller runs the loader while
+    the others wait for its result instead of hitting the database as well.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: int,
+        wait_seconds: float = 5.0,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.wait_seconds = wait_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, CachedResponse]] = OrderedDict()
+        self._inflight: dict[Hashable, threading.Event] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], bytes]) -> CachedResponse:
+        if self.ttl_seconds <= 0:
+            return CachedResponse.from_body(loader())
+
+        while True:
+            with self._lock:
+                cached = self._lookup(key)
+                if cached is not None:
+                    self._hits += 1
+                    return cached
+                pending = self._inflight.get(key)
+                if pending is None:
+                    self._misses += 1
+                    self._inflight[key] = threading.Event()
+                    break
+                self._coalesced += 1
+            # Another request is loading this key; if it fails or stalls, load it ourselves.
+            if not pending.wait(self.wait_seconds):
+                return CachedResponse.from_body(loader())
+
+        try:
+            cached = CachedResponse.from_body(loader())
+            self._store(key, cached)
+            return cached
+        finally:
+            with self._lock:
+                self._inflight.pop(key).set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "evictions": self._evictions,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _lookup(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: Hashable, cached: CachedResponse) -> None:
+        if len(cached.body) > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, cached)
+            self._bytes += len(cached.body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.body)
+                self._evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, cached = self._entries.pop(key)
+        self._bytes -= len(cached.body)
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+_catalog_version = 0
+_version_bumped_at = time.monotonic()
+_version_lock = threading.Lock()
+# Versions restart with the process; the epoch keeps an old tag from matching a new run.
+_PROCESS_EPOCH = uuid.uuid4().hex
+
+
+def get_content_listing_cache() -> ResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = get_settings()
+            _cache = ResponseCache(
+                ttl_seconds=settings.content_listing_cache_ttl_seconds,
+                max_entries=settings.content_listing_cache_max_entries,
+                max_bytes=settings.content_listing_cache_max_bytes,
+            )
+        return _cache
+
+
+def catalog_version() -> int:
+    with _version_lock:
+        return _catalog_version
+
+
+def bump_catalog_version() -> int:
+    """Make every cached listing unreachable; they age out of the LRU on their own."""
+
+    global _catalog_version, _version_bumped_at
+    with _version_lock:
+        _catalog_version += 1
+        _version_bumped_at = time.monotonic()
+        return _catalog_version
+
+
+def listing_etag(key: Hashable) -> str:
+    """ETag for the listing cached under ``key``, known without loading the page.
+
+    Writes made by other processes do not bump the version, so the tag also rolls over
+    every cache TTL since the last bump; such writes then surface to revalidating
+    clients within the same bound as they do through the cache itself.
+    """
+
+    ttl = get_content_listing_cache().ttl_seconds
+    with _version_lock:
+        age = time.monotonic() - _version_bumped_at
+    # With the cache off every response is loaded fresh, so never answer 304.
+    window = int(age // ttl) if ttl > 0 else uuid.uuid4().hex
+    return make_etag(_PROCESS_EPOCH, window, *key)
+
+
+def mark_catalog_changed(db: Session) -> None:
+    """Bump the catalog version once ``db`` commits.
+
+    ORM writes to content, categories, likes and comments are detected on flush; call
+    this for bulk ``UPDATE`` statements that bypass the unit of work.
+    """
+
+    db.info[_CATALOG_CHANGED_KEY] = True
+
+
+def content_listing_stats() -> dict[str, float]:
+    return {**get_content_listing_cache().stats(), "catalog_version": catalog_version()}
+
+
+@event.listens_for(Session, "after_flush")
+def _detect_catalog_writes(session: Session, flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, _CATALOG_MODELS):
+            mark_catalog_changed(session)
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_after_commit(session: Session) -> None:
+    if session.info.pop(_CATALOG_CHANGED_KEY, False):
+        bump_catalog_version()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session: Session, previous: SessionTransaction) -> None:
+    if previous.parent is None:
+        session.info.pop(_CATALOG_CHANGED_KEY, None)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class AuditLogActor(BaseModel):
@@ -28,3 +28,24 @@ class AuditLogListResponse(BaseModel):
     page: int
     page_size: int
     total: int
+    total_is_estimate: bool = Field(
+        default=False, description="True when total is a planner estimate or cached count"
+    )
+    next_cursor: Optional[str] = Field(
+        default=None, description="Opaque cursor for the next page, if more items exist"
+    )
+
+
+class DailyStatsDay(BaseModel):
+    day: date
+    counts: dict[str, int]
+
+
+class DailyStatsResponse(BaseModel):
+    start: date
+    end: date
+    days: list[DailyStatsDay]
+    totals: dict[str, int]
+    up_to: Optional[datetime] = Field(
+        default=None, description="Audit entries created before this instant are counted"
+    )
@@ -22,6 +22,13 @@ class AdminContentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     file_path: str = Field(description="Relative path to stored content file")
+    file_checksum: Optional[str] = Field(
+        default=None, description="SHA-256 hex digest of the stored file"
+    )
+    broadcast_id: Optional[str] = Field(
+        default=None,
+        description="Id of the member notification fan-out queued when this write published",
+    )
 
     model_config = {"from_attributes": True}
 
@@ -55,6 +62,10 @@ class MemberContentResponse(BaseModel):
     updated_at: datetime
     likes_count: int
     comments_count: int
+    highlight: Optional[str] = Field(
+        default=None,
+        description="Search snippet with matches wrapped in <mark> tags (search results only)",
+    )
 
     model_config = {"from_attributes": True}
 
@@ -64,6 +75,9 @@ class MemberContentListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(
+        default=None, description="Opaque cursor for the next page, if more items exist"
+    )
 
 
 class MemberContentDetailResponse(MemberContentResponse):
@@ -72,6 +86,10 @@ class MemberContentDetailResponse(MemberContentResponse):
     owner_name: Optional[str]
 
 
+class MemberContentBatchResponse(BaseModel):
+    items: List[MemberContentDetailResponse]
+
+
 class ContentDownloadResponse(BaseModel):
     token: str
     expires_in: int = 300
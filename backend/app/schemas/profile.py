@@ -25,6 +25,7 @@ class ProfileResponse(BaseModel):
     notify_content: Optional[bool]
     notify_community: Optional[bool]
     notify_account: Optional[bool]
+    content_digest: Optional[str] = None
 
 
 class ProfileUpdateRequest(BaseModel):
@@ -52,6 +53,7 @@ class PreferencesUpdateRequest(BaseModel):
     notify_content: Optional[bool] = None
     notify_community: Optional[bool] = None
     notify_account: Optional[bool] = None
+    content_digest: Optional[constr(pattern=r"^(immediate|hourly|daily)$")] = None
 
 
 class PreferencesUpdateResponse(ProfileResponse):
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
@@ -9,10 +11,13 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from .config import get_settings
+from .hashing_pool import get_hashing_pool
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+TOKEN_DIGEST_PREFIX = "hmac-sha256$"
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -22,6 +27,18 @@ def verify_password(password: str, password_hash: str) -> bool:
     return pwd_context.verify(password, password_hash)
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash ``password`` in the hashing pool; raises HashingPoolSaturated when it is full."""
+
+    return await get_hashing_pool().run(hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """Verify ``password`` in the hashing pool; raises HashingPoolSaturated when it is full."""
+
+    return await get_hashing_pool().run(verify_password, password, password_hash)
+
+
 def _create_token(
     subject: str,
     expires_delta: timedelta,
@@ -87,10 +104,28 @@ def create_password_reset_token(subject: str) -> tuple[str, str]:
 
 
 def hash_token(token: str) -> str:
-    return pwd_context.hash(token)
+    """Digest a high-entropy token (refresh or reset JWT) for storage.
+
+    Tokens are random and already signed, so a keyed HMAC is as strong as a slow password
+    hash here while costing microseconds instead of a bcrypt round.
+    """
+
+    settings = get_settings()
+    digest = hmac.new(
+        settings.secret_key.encode("utf-8"), token.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+    return f"{TOKEN_DIGEST_PREFIX}{digest}"
 
 
 def verify_token_hash(token: str, token_hash: str) -> bool:
+    """Check ``token`` against a stored digest.
+
+    Hashes written before the HMAC scheme are bcrypt and still verify; they are replaced
+    the next time the token rotates.
+    """
+
+    if token_hash.startswith(TOKEN_DIGEST_PREFIX):
+        return hmac.compare_digest(hash_token(token), token_hash)
     return pwd_context.verify(token, token_hash)
 
 
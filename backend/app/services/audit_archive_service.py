@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+_ARCHIVE_NAME = re.compile(r"^(\d{4})-(\d{2})(?:\.(\d+))?\.ndjson\.gz$")
+_STREAM_BATCH = 1000
+_DEFAULT_PARTITION = "audit_logs_default"
+
+
+@dataclass(frozen=True)
+class ArchivedMonth:
+    month: date
+    rows: int
+    path: Path
+
+
+def month_start(value: datetime | date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"audit_logs_y{month.year:04d}m{month.month:02d}"
+
+
+def archive_dir() -> Path:
+    settings = get_settings()
+    return Path(settings.media_root) / settings.audit_archive_subdir
+
+
+def retention_cutoff(now: Optional[datetime] = None) -> Optional[date]:
+    """First month that is still retained, or None when retention is disabled."""
+
+    months = get_settings().audit_retention_months
+    if months <= 0:
+        return None
+    return add_months(month_start(now or datetime.now(timezone.utc)), -months)
+
+
+def ensure_partitions(db: Session, *, months_ahead: int = 2) -> list[str]:
+    """Create monthly partitions up to ``months_ahead`` months from now (Postgres only).
+
+    Rows written before a month's partition existed sit in ``audit_logs_default``, and
+    Postgres refuses to create a partition whose range the default still holds. Those
+    rows are moved into the new partition while the default is detached, all in one
+    transaction.
+    """
+
+    if db.get_bind().dialect.name != "postgresql":
+        return []
+    created = []
+    current = month_start(datetime.now(timezone.utc))
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        exists = db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+        if exists:
+            continue
+        bounds = {"start": _as_datetime(month), "end": _as_datetime(add_months(month, 1))}
+        stranded = db.execute(
+            text(
+                f"SELECT 1 FROM {_DEFAULT_PARTITION} "
+                "WHERE created_at >= :start AND created_at < :end LIMIT 1"
+            ),
+            bounds,
+        ).first()
+        if stranded:
+            logger.info(
+                "Moving default-partition audit rows into a new partition",
+                extra={"partition": name},
+            )
+            db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {_DEFAULT_PARTITION}"))
+        # DDL takes no bind parameters; the bounds are dates built above.
+        db.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF audit_logs "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            )
+        )
+        if stranded:
+            columns = ", ".join(column.name for column in AuditLog.__table__.columns)
+            moved = (
+                f"DELETE FROM {_DEFAULT_PARTITION} "
+                "WHERE created_at >= :start AND created_at < :end "
+                f"RETURNING {columns}"
+            )
+            db.execute(
+                text(f"WITH moved AS ({moved}) INSERT INTO {name} ({columns}) SELECT * FROM moved"),
+                bounds,
+            )
+            db.execute(
+                text(f"ALTER TABLE audit_logs ATTACH PARTITION {_DEFAULT_PARTITION} DEFAULT")
+            )
+        created.append(name)
+    db.commit()
+    return created
+
+
+def expired_months(db: Session, cutoff: date) -> list[date]:
+    """Months before ``cutoff`` that still hold rows (or, on Postgres, a partition)."""
+
+    months: set[date] = set()
+    if db.get_bind().dialect.name == "postgresql":
+        partitions = db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = 'audit_logs'"
+            )
+        ).scalars()
+        for name in partitions:
+            match = re.fullmatch(r"audit_logs_y(\d{4})m(\d{2})", name)
+            if match:
+                month = date(int(match.group(1)), int(match.group(2)), 1)
+                if month < cutoff:
+                    months.add(month)
+
+    # Rows outside any monthly partition (the default partition, or unpartitioned tables).
+    oldest = db.execute(
+        select(func.min(AuditLog.created_at)).where(AuditLog.created_at < _as_datetime(cutoff))
+    ).scalar()
+    month = month_start(oldest) if oldest else cutoff
+    while month < cutoff:
+        has_rows = db.execute(select(AuditLog.id).where(*_month_filter(month)).limit(1)).first()
+        if has_rows:
+            months.add(month)
+        month = add_months(month, 1)
+    return sorted(months)
+
+
+def archive_month(db: Session, month: date) -> ArchivedMonth:
+    """Stream one month of audit rows to gzipped NDJSON under ``media_root``, then drop them.
+
+    The file is written to a temporary name and renamed once complete. If a previous run
+    archived the month already, a numbered part file is added next to it; readers merge
+    parts and de-duplicate by id, so a run interrupted between writing and dropping is
+    safe to repeat.
+    """
+
+    directory = archive_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = _next_archive_path(directory, month)
+    partial = path.with_name(f".{path.name}.partial")
+
+    rows = 0
+    with gzip.open(partial, "wt", encoding="utf-8") as handle:
+        result = db.execute(
+            select(AuditLog.__table__)
+            .where(*_month_filter(month))
+            .order_by(AuditLog.created_at, AuditLog.id)
+            .execution_options(yield_per=_STREAM_BATCH)
+        )
+        for row in result.mappings():
+            handle.write(json.dumps(_serialize(row), separators=(",", ":")) + "\n")
+            rows += 1
+    with open(partial, "rb") as handle:
+        os.fsync(handle.fileno())
+    if rows:
+        os.replace(partial, path)
+    else:
+        partial.unlink()
+
+    _drop_month(db, month)
+    db.commit()
+    logger.info(
+        "Audit month archived",
+        extra={"month": month.isoformat(), "rows": rows, "path": str(path) if rows else None},
+    )
+    return ArchivedMonth(month=month, rows=rows, path=path)
+
+
+def archive_expired(db: Session, *, now: Optional[datetime] = None) -> list[ArchivedMonth]:
+    cutoff = retention_cutoff(now)
+    if cutoff is None:
+        return []
+    return [archive_month(db, month) for month in expired_months(db, cutoff)]
+
+
+def list_archives() -> dict[date, list[Path]]:
+    archives: dict[date, list[Path]] = {}
+    directory = archive_dir()
+    if not directory.is_dir():
+        return archives
+    for path in sorted(directory.iterdir()):
+        match = _ARCHIVE_NAME.match(path.name)
+        if match:
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            archives.setdefault(month, []).append(path)
+    return dict(sorted(archives.items()))
+
+
+def read_archive(
+    month: date,
+    *,
+    action_type: Optional[str] = None,
+    actor_id: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield archived entries for ``month`` matching the filters, each id once."""
+
+    seen: set[str] = set()
+    for path in list_archives().get(month, []):
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                entry = json.loads(line)
+                if entry["id"] in seen:
+                    continue
+                seen.add(entry["id"])
+                if action_type and entry["action_type"] != action_type:
+                    continue
+                if actor_id and entry["actor_id"] != actor_id:
+                    continue
+                yield entry
+
+
+def _drop_month(db: Session, month: date) -> None:
+    if db.get_bind().dialect.name == "postgresql":
+        name = partition_name(month)
+        if db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+            db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+            db.execute(text(f"DROP TABLE {name}"))
+    # Rows that landed in the default partition (or an unpartitioned table).
+    db.execute(
+        delete(AuditLog).where(*_month_filter(month)).execution_options(synchronize_session=False)
+    )
+
+
+def _next_archive_path(directory: Path, month: date) -> Path:
+    stem = f"{month.year:04d}-{month.month:02d}"
+    path = directory / f"{stem}.ndjson.gz"
+    part = 1
+    while path.exists():
+        path = directory / f"{stem}.{part}.ndjson.gz"
+        part += 1
+    return path
+
+
+def _month_filter(month: date):
+    return (
+        AuditLog.created_at >= _as_datetime(month),
+        AuditLog.created_at < _as_datetime(add_months(month, 1)),
+    )
+
+
+def _as_datetime(month: date) -> datetime:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+
+
+def _serialize(row) -> dict[str, Any]:
+    created_at = row["created_at"]
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return {
+        "id": str(row["id"]),
+        "actor_id": str(row["actor_id"]) if row["actor_id"] else None,
+        "action_type": row["action_type"],
+        "target_type": row["target_type"],
+        "target_id": row["target_id"],
+        "metadata": row["metadata"],
+        "created_at": created_at.isoformat(),
+    }
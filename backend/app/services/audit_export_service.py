@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from enum import Enum
+from typing import Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..models.audit import AuditLog
+from ..models.user import User
+from .audit_service import log_filters
+
+EXPORT_COLUMNS = (
+    "id",
+    "created_at",
+    "action_type",
+    "target_type",
+    "target_id",
+    "actor_id",
+    "actor_email",
+    "actor_first_name",
+    "actor_last_name",
+    "metadata",
+)
+_FETCH_SIZE = 2000
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class ExportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+MEDIA_TYPES = {ExportFormat.csv: "text/csv", ExportFormat.ndjson: "application/x-ndjson"}
+
+
+def stream_export(
+    bind: Engine,
+    *,
+    export_format: ExportFormat,
+    compress: bool,
+    action_type: Optional[str] = None,
+    actor_id: Optional[UUID] = None,
+    start_at: Optional[datetime] = None,
+    end_at: Optional[datetime] = None,
+    fetch_size: int = _FETCH_SIZE,
+) -> Iterator[bytes]:
+    """Yield the matching audit rows, oldest first, as encoded (and optionally gzipped) chunks.
+
+    Runs on its own session because the response outlives the request's session. Rows are
+    read through a server-side cursor ``fetch_size`` at a time as plain tuples (no ORM
+    objects), so memory stays flat however long the range is.
+    """
+
+    filters = log_filters(
+        action_type=action_type, actor_id=actor_id, start_at=start_at, end_at=end_at
+    )
+    statement = (
+        select(
+            AuditLog.id,
+            AuditLog.created_at,
+            AuditLog.action_type,
+            AuditLog.target_type,
+            AuditLog.target_id,
+            AuditLog.actor_id,
+            User.email,
+            User.first_name,
+            User.last_name,
+            AuditLog.metadata_json,
+        )
+        .outerjoin(User, User.id == AuditLog.actor_id)
+        .where(*filters)
+        .order_by(AuditLog.created_at, AuditLog.id)
+        .execution_options(stream_results=True, yield_per=fetch_size)
+    )
+    encode = _csv_chunk if export_format == ExportFormat.csv else _ndjson_chunk
+    # wbits=31 writes a gzip header and trailer around the deflate stream.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    with Session(bind=bind) as db:
+        if export_format == ExportFormat.csv:
+            yield emit(_csv_chunk([EXPORT_COLUMNS], header=True))
+        for partition in db.execute(statement).partitions():
+            chunk = emit(encode(partition))
+            if chunk:
+                yield chunk
+    if compressor:
+        yield compressor.flush()
+
+
+def _csv_chunk(rows, *, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerows(rows)
+    else:
+        writer.writerows(
+            (
+                row[0],
+                _isoformat(row[1]),
+                _csv_text(row[2]),
+                _csv_text(row[3]),
+                _csv_text(row[4]),
+                row[5] or "",
+                _csv_text(row[6]),
+                _csv_text(row[7]),
+                _csv_text(row[8]),
+                _csv_text(json.dumps(row[9], separators=(",", ":")) if row[9] else None),
+            )
+            for row in rows
+        )
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_text(value: Optional[str]) -> str:
+    """Neutralize cells a spreadsheet would run as a formula (OWASP CSV injection)."""
+
+    if not value:
+        return ""
+    if value[0] in _FORMULA_PREFIXES:
+        return "'" + value
+    return value
+
+
+def _ndjson_chunk(rows) -> bytes:
+    dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+    lines = [
+        dumps(
+            {
+                "id": str(row[0]),
+                "created_at": _isoformat(row[1]),
+                "action_type": row[2],
+                "target_type": row[3],
+                "target_id": row[4],
+                "actor": (
+                    {
+                        "id": str(row[5]),
+                        "email": row[6],
+                        "first_name": row[7],
+                        "last_name": row[8],
+                    }
+                    if row[5]
+                    else None
+                ),
+                "metadata": row[9],
+            }
+        )
+        for row in rows
+    ]
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _isoformat(value: datetime) -> str:
+    return value.isoformat() if value else ""
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
-from datetime import datetime
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any, Optional, Sequence
 
 import uuid
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import event, func, insert, select, tuple_
+from sqlalchemy.orm import Session, SessionTransaction, selectinload
 
+from ..audit_sink import get_audit_sink
+from ..config import get_settings
 from ..models.audit import AuditLog
+from ..utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    parse_cursor_datetime,
+    parse_cursor_uuid,
+)
+
+logger = logging.getLogger(__name__)
+
+_PENDING_AUDIT_ROWS = "pending_audit_rows"
 
 
 def log_action(
@@ -20,6 +37,39 @@ def log_action(
     target_id: Optional[str] = None,
     metadata: Optional[dict[str, Any]] = None,
 ) -> AuditLog:
+    """Record an audit entry as part of ``db``'s transaction.
+
+    With ``audit_buffer_enabled``, actions listed in ``audit_buffered_actions`` are handed
+    to the buffered sink once the transaction commits instead of being inserted inline;
+    the returned entry is then not attached to ``db``. Everything else is flushed now.
+    """
+
+    settings = get_settings()
+    if settings.audit_buffer_enabled and action_type in settings.audit_buffered_actions:
+        entry = AuditLog(
+            id=uuid.uuid4(),
+            actor_id=actor_id,
+            action_type=action_type,
+            target_type=target_type,
+            target_id=target_id,
+            metadata_json=metadata or {},
+            created_at=datetime.now(timezone.utc),
+        )
+        # Make sure a transaction is open so a later rollback() fires the discard hook.
+        db.connection()
+        db.info.setdefault(_PENDING_AUDIT_ROWS, []).append(
+            {
+                "id": entry.id,
+                "actor_id": actor_id,
+                "action_type": action_type,
+                "target_type": target_type,
+                "target_id": target_id,
+                "metadata": entry.metadata_json,
+                "created_at": entry.created_at,
+            }
+        )
+        return entry
+
     entry = AuditLog(
         actor_id=actor_id,
         action_type=action_type,
@@ -32,36 +82,148 @@ def log_action(
     return entry
 
 
+@event.listens_for(Session, "after_commit")
+def _submit_pending_audit_rows(session: Session) -> None:
+    rows = session.info.pop(_PENDING_AUDIT_ROWS, None)
+    if not rows:
+        return
+    bind = session.get_bind()
+    sink = get_audit_sink()
+    rejected = [row for row in rows if not sink.submit(bind, row)]
+    if rejected:
+        # Sink queue is full: fall back to writing this request's rows directly.
+        try:
+            with bind.begin() as connection:
+                connection.execute(insert(AuditLog.__table__), rejected)
+        except Exception:
+            logger.exception("Audit entries could not be written", extra={"rows": len(rejected)})
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_audit_rows(session: Session, previous: SessionTransaction) -> None:
+    if previous.parent is None:
+        session.info.pop(_PENDING_AUDIT_ROWS, None)
+
+
+def log_filters(
+    *,
+    action_type: Optional[str] = None,
+    actor_id: Optional[uuid.UUID] = None,
+    start_at: Optional[datetime] = None,
+    end_at: Optional[datetime] = None,
+) -> list:
+    filters = []
+    if action_type:
+        filters.append(AuditLog.action_type == action_type)
+    if actor_id:
+        filters.append(AuditLog.actor_id == actor_id)
+    if start_at:
+        filters.append(AuditLog.created_at >= start_at)
+    if end_at:
+        filters.append(AuditLog.created_at <= end_at)
+    return filters
+
+
+@dataclass(frozen=True)
+class AuditLogPage:
+    items: Sequence[AuditLog]
+    total: int
+    total_is_estimate: bool
+    next_cursor: Optional[str]
+
+
 def list_logs(
     db: Session,
     *,
     page: int = 1,
     page_size: int = 50,
+    cursor: Optional[str] = None,
     action_type: Optional[str] = None,
+    actor_id: Optional[uuid.UUID] = None,
     start_at: Optional[datetime] = None,
     end_at: Optional[datetime] = None,
-) -> tuple[Sequence[AuditLog], int]:
+    estimate_total: bool = False,
+) -> AuditLogPage:
+    """Return a page of audit logs, newest first.
+
+    With ``cursor`` (the ``next_cursor`` of the previous page) the page is read by keyset
+    on ``(created_at, id)`` and ``page`` is ignored. ``estimate_total`` swaps the exact
+    count for the planner's row estimate on Postgres, or a briefly cached count elsewhere.
+    """
+
     if page < 1:
         raise ValueError("page_must_be_positive")
     page_size = max(1, min(page_size, 100))
 
+    filters = log_filters(
+        action_type=action_type, actor_id=actor_id, start_at=start_at, end_at=end_at
+    )
+    if estimate_total:
+        total = _estimated_count(db, filters, (action_type, actor_id, start_at, end_at))
+    else:
+        total = db.execute(select(func.count(AuditLog.id)).where(*filters)).scalar_one()
+
     query = (
-        select(AuditLog).options(selectinload(AuditLog.actor)).order_by(AuditLog.created_at.desc())
+        select(AuditLog)
+        .options(selectinload(AuditLog.actor))
+        .where(*filters)
+        .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
     )
-    count_query = select(func.count(AuditLog.id))
+    if cursor:
+        created_raw, id_raw = decode_cursor(cursor, size=2)
+        created_at = parse_cursor_datetime(created_raw)
+        if created_at is None:
+            raise ValueError("invalid_cursor")
+        query = query.where(
+            tuple_(AuditLog.created_at, AuditLog.id) < tuple_(created_at, parse_cursor_uuid(id_raw))
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
 
-    if action_type:
-        query = query.where(AuditLog.action_type == action_type)
-        count_query = count_query.where(AuditLog.action_type == action_type)
-    if start_at:
-        query = query.where(AuditLog.created_at >= start_at)
-        count_query = count_query.where(AuditLog.created_at >= start_at)
-    if end_at:
-        query = query.where(AuditLog.created_at <= end_at)
-        count_query = count_query.where(AuditLog.created_at <= end_at)
+    logs = db.execute(query.limit(page_size + 1)).scalars().all()
+    next_cursor = None
+    if len(logs) > page_size:
+        logs = logs[:page_size]
+        next_cursor = encode_cursor([logs[-1].created_at, logs[-1].id])
+
+    return AuditLogPage(
+        items=logs, total=total, total_is_estimate=estimate_total, next_cursor=next_cursor
+    )
+
+
+_count_cache: dict[tuple, tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
+
+
+def clear_count_cache() -> None:
+    with _count_cache_lock:
+        _count_cache.clear()
 
-    total = db.execute(count_query).scalar_one()
 
-    logs = db.execute(query.offset((page - 1) * page_size).limit(page_size)).scalars().all()
+def _estimated_count(db: Session, filters: list, cache_key: tuple) -> int:
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql":
+        compiled = select(AuditLog.id).where(*filters).compile(bind=bind)
+        plan = (
+            db.connection()
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params)
+            .scalar_one()
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
 
-    return logs, total
+    ttl = get_settings().audit_count_cache_seconds
+    key = (str(bind.url), *cache_key)
+    now = time.monotonic()
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    total = db.execute(select(func.count(AuditLog.id)).where(*filters)).scalar_one()
+    with _count_cache_lock:
+        _count_cache[key] = (now + ttl, total)
+        # Filter combinations are admin-driven, so the cache stays small; bound it anyway.
+        if len(_count_cache) > 256:
+            _count_cache.pop(next(iter(_count_cache)))
+    return total
@@ -4,17 +4,19 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from ..config import get_settings
 from ..models.password_reset import PasswordResetToken
 from ..models.session import UserSession
 from ..models.user import User, UserStatus
+from ..principal_cache import invalidate_principal
 from ..services.audit_service import log_action
 from ..services.notification_service import (
-    send_account_verified_email,
-    send_password_reset_email,
+    queue_account_verified_email,
+    queue_password_reset_email,
+    queue_verification_email,
 )
 from ..security import (
     TokenError,
@@ -22,9 +24,7 @@ from ..security import (
     create_password_reset_token,
     create_verification_token,
     decode_token,
-    hash_password,
     hash_token,
-    verify_password,
     verify_token_hash,
     create_refresh_token,
 )
@@ -38,9 +38,14 @@ class AuthService:
         email: str,
         first_name: str,
         last_name: str,
-        password: str,
+        password_hash: str,
         actor_id: Optional[str] = None,
-    ) -> User:
+    ) -> tuple[User, str]:
+        """Create a pending user from an already computed ``password_hash``.
+
+        Returns the user and the verification token that was queued for email delivery.
+        """
+
         existing = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
         if existing:
             raise ValueError("email_already_registered")
@@ -49,7 +54,7 @@ class AuthService:
             email=email,
             first_name=first_name,
             last_name=last_name,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             status=UserStatus.pending.value,
         )
         db.add(user)
@@ -68,9 +73,12 @@ class AuthService:
             metadata={"email": email},
         )
 
+        verification_token = AuthService.generate_verification_token(user)
+        queue_verification_email(db, user, verification_token)
+
         db.commit()
         db.refresh(user)
-        return user
+        return user, verification_token
 
     @staticmethod
     def generate_verification_token(user: User) -> str:
@@ -109,25 +117,27 @@ class AuthService:
                 target_id=str(user.id),
                 metadata={"verification": "success"},
             )
+            queue_account_verified_email(db, user)
             db.commit()
+            invalidate_principal(user.id)
             db.refresh(user)
             activated = True
-            send_account_verified_email(user)
 
         return user, activated
 
     @staticmethod
-    def login(
+    def get_user_by_email(db: Session, email: str) -> Optional[User]:
+        return db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+
+    @staticmethod
+    def start_session(
         db: Session,
+        user: User,
         *,
-        email: str,
-        password: str,
         device_info: Optional[str] = None,
         ip_address: Optional[str] = None,
     ) -> tuple[User, str, str, UserSession]:
-        user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
-        if not user or not verify_password(password, user.password_hash):
-            raise ValueError("invalid_credentials")
+        """Open a session for a user whose password has already been verified."""
 
         if user.status != UserStatus.active.value:
             raise ValueError("user_not_active")
@@ -154,7 +164,7 @@ class AuthService:
             action_type="auth.login",
             target_type="session",
             target_id=str(session_id),
-            metadata={"email": email},
+            metadata={"email": user.email},
         )
 
         access_token = create_access_token(str(user.id), extra_claims={"sid": str(session_id)})
@@ -319,12 +329,14 @@ class AuthService:
             },
         )
 
+        queue_password_reset_email(db, email=user.email, token=token, token_id=token_id)
         db.commit()
-        send_password_reset_email(user.email, token)
         return token
 
     @staticmethod
-    def reset_password(db: Session, *, token: str, new_password: str) -> User:
+    def validate_password_reset(db: Session, *, token: str) -> PasswordResetToken:
+        """Check a reset token before the (expensive) new password hash is computed."""
+
         try:
             payload = decode_token(token, purpose="reset")
         except TokenError as exc:
@@ -377,9 +389,30 @@ class AuthService:
             db.commit()
             raise ValueError("user_not_found")
 
-        user.password_hash = hash_password(new_password)
-        reset_entry.used_at = now
-        db.add_all([user, reset_entry])
+        return reset_entry
+
+    @staticmethod
+    def complete_password_reset(
+        db: Session, reset_entry: PasswordResetToken, *, password_hash: str
+    ) -> User:
+        user = db.get(User, reset_entry.user_id)
+        if not user:
+            raise ValueError("user_not_found")
+
+        # The token was validated before hashing; claim it atomically so two concurrent
+        # resets with the same token cannot both succeed.
+        claimed = db.execute(
+            update(PasswordResetToken)
+            .where(PasswordResetToken.id == reset_entry.id, PasswordResetToken.used_at.is_(None))
+            .values(used_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session="fetch")
+        ).rowcount
+        if not claimed:
+            db.rollback()
+            raise ValueError("token_used")
+
+        user.password_hash = password_hash
+        db.add(user)
 
         log_action(
             db,
@@ -390,6 +423,7 @@ class AuthService:
         )
 
         db.commit()
+        invalidate_principal(user.id)
         db.refresh(user)
 
         # Invalidate other outstanding tokens for the user
@@ -4,9 +4,11 @@ from typing import Optional
 from uuid import UUID
 
 import bleach
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from ..models.comment import Comment, CommentStatus
+from ..services.content_service import ContentService
 
 
 def create_comment(
@@ -24,6 +26,8 @@ def create_comment(
         status=CommentStatus.active.value,
     )
     db.add(comment)
+    db.flush()
+    ContentService.adjust_engagement_counts(db, content_id=content_id, comments=1)
     db.commit()
     db.refresh(comment)
     return comment
@@ -43,8 +47,14 @@ def update_comment(
 
 
 def delete_comment(db: Session, *, comment: Comment) -> Comment:
-    comment.status = CommentStatus.deleted.value
-    db.add(comment)
+    result = db.execute(
+        update(Comment)
+        .where(Comment.id == comment.id, Comment.status == CommentStatus.active.value)
+        .values(status=CommentStatus.deleted.value)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        ContentService.adjust_engagement_counts(db, content_id=comment.content_id, comments=-1)
     db.commit()
     db.refresh(comment)
     return comment
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy import exists, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from ..category_catalog import get_category_catalog
 from ..config import get_settings
 from ..models.category import Category
+from ..models.comment import Comment, CommentStatus
 from ..models.content import ContentItem, ContentStatus
+from ..models.like import Like
 from ..models.user import User
+from ..response_cache import mark_catalog_changed
 from ..services.audit_service import log_action
 from ..services.notification_service import broadcast_content_published
-from ..utils.files import remove_file, save_content_file
+from ..utils.files import remove_file, save_content_stream
 
 ALLOWED_CONTENT_TYPES = {
     "application/pdf": "pdf",
@@ -25,6 +33,40 @@ ALLOWED_CONTENT_TYPES = {
     "image/jpeg": "jpg",
     "video/mp4": "mp4",
 }
+MEDIA_TYPES_BY_EXTENSION = {extension: media for media, extension in ALLOWED_CONTENT_TYPES.items()}
+MAX_DETAIL_BATCH = 100
+
+
+@dataclass(frozen=True)
+class ContentDetail:
+    content: ContentItem
+    category_name: Optional[str]
+    owner_name: Optional[str]
+    liked_by_me: bool
+
+
+@dataclass(frozen=True)
+class ContentWrite:
+    content: ContentItem
+    broadcast_id: Optional[str] = None
+
+
+@contextmanager
+def _missing_category_as_not_found(db: Session, category_id: Optional[UUID]) -> Iterator[None]:
+    """Report a write's foreign key failure on a vanished category as ``category_not_found``.
+
+    Validation reads the category catalog, which can still list a category another process
+    has just deleted; the write then fails on flush or commit instead.
+    """
+
+    try:
+        yield
+    except IntegrityError as exc:
+        db.rollback()
+        if category_id is not None and db.get(Category, category_id) is None:
+            get_category_catalog().invalidate()
+            raise ValueError("category_not_found") from exc
+        raise
 
 
 class ContentService:
@@ -36,16 +78,17 @@ class ContentService:
         description: Optional[str],
         category_id: Optional[UUID],
         status: ContentStatus,
-        file_bytes: bytes,
+        file_obj: BinaryIO,
         content_type: str,
         owner: User,
-    ) -> ContentItem:
-        ContentService._validate_file_size(file_bytes)
+    ) -> ContentWrite:
         extension = ContentService._ensure_allowed_type(content_type)
         category_uuid = ContentService._validate_category(db, category_id) if category_id else None
 
-        filename, saved_path, file_size = save_content_file(file_bytes, extension)
         settings = get_settings()
+        filename, saved_path, file_size, checksum = save_content_stream(
+            file_obj, extension, max_bytes=ContentService.max_file_size_bytes()
+        )
         relative_path = f"{settings.content_subdir}/{filename}"
 
         content = ContentItem(
@@ -56,26 +99,33 @@ class ContentService:
             file_path=relative_path,
             file_type=extension,
             file_size=file_size,
+            file_checksum=checksum,
             owner_id=owner.id,
             published_at=datetime.now(timezone.utc) if status == ContentStatus.published else None,
         )
-        db.add(content)
-
-        log_action(
-            db,
-            actor_id=owner.id,
-            action_type="content.create",
-            target_type="content_item",
-            target_id=str(content.id),
-            metadata={"title": title, "file": relative_path},
-        )
-
-        db.commit()
+        broadcast_id = None
+        try:
+            with _missing_category_as_not_found(db, category_uuid):
+                db.add(content)
+                log_action(
+                    db,
+                    actor_id=owner.id,
+                    action_type="content.create",
+                    target_type="content_item",
+                    target_id=str(content.id),
+                    metadata={"title": title, "file": relative_path},
+                )
+                if status == ContentStatus.published:
+                    broadcast_id = broadcast_content_published(
+                        db, content=content, actor_id=owner.id
+                    )
+                db.commit()
+        except Exception:
+            db.rollback()
+            remove_file(saved_path)
+            raise
         db.refresh(content)
-
-        if status == ContentStatus.published:
-            broadcast_content_published(db, content=content, actor_id=owner.id)
-        return content
+        return ContentWrite(content=content, broadcast_id=broadcast_id)
 
     @staticmethod
     def update_content(
@@ -87,10 +137,11 @@ class ContentService:
         description: Optional[str] = None,
         category_id: Optional[UUID] = None,
         status: Optional[ContentStatus] = None,
-    ) -> ContentItem:
+    ) -> ContentWrite:
         updates: dict[str, object] = {}
         original_status = ContentStatus(content.status)
         publish_now = False
+        broadcast_id = None
 
         if title is not None:
             content.title = title
@@ -114,22 +165,24 @@ class ContentService:
             updates["status"] = status.value
 
         if updates:
-            db.add(content)
-            log_action(
-                db,
-                actor_id=actor.id,
-                action_type="content.update",
-                target_type="content_item",
-                target_id=str(content.id),
-                metadata=updates,
-            )
-            db.commit()
+            with _missing_category_as_not_found(db, category_id):
+                db.add(content)
+                log_action(
+                    db,
+                    actor_id=actor.id,
+                    action_type="content.update",
+                    target_type="content_item",
+                    target_id=str(content.id),
+                    metadata=updates,
+                )
+                if publish_now:
+                    broadcast_id = broadcast_content_published(
+                        db, content=content, actor_id=actor.id
+                    )
+                db.commit()
             db.refresh(content)
 
-            if publish_now:
-                broadcast_content_published(db, content=content, actor_id=actor.id)
-
-        return content
+        return ContentWrite(content=content, broadcast_id=broadcast_id)
 
     @staticmethod
     def archive_content(db: Session, *, content: ContentItem, actor: User) -> ContentItem:
@@ -138,7 +191,156 @@ class ContentService:
             content=content,
             actor=actor,
             status=ContentStatus.archived,
+        ).content
+
+    @staticmethod
+    def get_published_detail(
+        db: Session, *, content_id: UUID, viewer_id: UUID
+    ) -> Optional[ContentDetail]:
+        """Load a published item for the member detail view in a single statement.
+
+        Category and owner names come from outer joins and ``liked_by_me`` from an EXISTS
+        probe; like/comment totals are the denormalized counters on the row itself.
+        """
+
+        details = ContentService.get_published_details(
+            db, content_ids=[content_id], viewer_id=viewer_id
         )
+        return details[0] if details else None
+
+    @staticmethod
+    def get_published_details(
+        db: Session, *, content_ids: Sequence[UUID], viewer_id: UUID
+    ) -> list[ContentDetail]:
+        """Batch form of :meth:`get_published_detail`, still one statement for any count.
+
+        Results follow the order of ``content_ids``; unknown or unpublished ids are skipped
+        and duplicates are returned once.
+        """
+
+        wanted = list(dict.fromkeys(content_ids))
+        if not wanted:
+            return []
+        if len(wanted) > MAX_DETAIL_BATCH:
+            raise ValueError("too_many_ids")
+
+        liked_by_me = (
+            exists()
+            .where(Like.content_id == ContentItem.id, Like.user_id == viewer_id)
+            .label("liked_by_me")
+        )
+        rows = db.execute(
+            select(
+                ContentItem,
+                Category.name,
+                User.first_name,
+                User.last_name,
+                User.email,
+                liked_by_me,
+            )
+            .outerjoin(Category, Category.id == ContentItem.category_id)
+            .outerjoin(User, User.id == ContentItem.owner_id)
+            .where(
+                ContentItem.id.in_(wanted),
+                ContentItem.status == ContentStatus.published.value,
+            )
+        ).all()
+
+        details = {}
+        for content, category_name, first_name, last_name, email, liked in rows:
+            owner_name = " ".join(filter(None, [first_name, last_name])).strip() or email
+            details[content.id] = ContentDetail(
+                content=content,
+                category_name=category_name,
+                owner_name=owner_name,
+                liked_by_me=bool(liked),
+            )
+        return [details[content_id] for content_id in wanted if content_id in details]
+
+    @staticmethod
+    def adjust_engagement_counts(
+        db: Session,
+        *,
+        content_id: UUID,
+        likes: int = 0,
+        comments: int = 0,
+    ) -> None:
+        """Atomically shift the denormalized like/comment counters of a content item.
+
+        Runs as a single ``UPDATE ... SET x = x + n`` in the caller's transaction so
+        concurrent writers never lose increments. ``updated_at`` is left untouched since
+        engagement is not an edit of the item itself.
+        """
+
+        values: dict[str, object] = {"updated_at": ContentItem.updated_at}
+        if likes:
+            values["likes_count"] = ContentItem.likes_count + likes
+        if comments:
+            values["comments_count"] = ContentItem.comments_count + comments
+        if len(values) == 1:
+            return
+        mark_catalog_changed(db)
+        db.execute(
+            update(ContentItem)
+            .where(ContentItem.id == content_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def repair_engagement_counts(db: Session) -> int:
+        """Recompute denormalized counters from ``likes``/``comments``.
+
+        Only rows that drifted are rewritten. Returns the number of repaired items.
+        """
+
+        likes_total = (
+            select(func.count(Like.id))
+            .where(Like.content_id == ContentItem.id)
+            .correlate(ContentItem)
+            .scalar_subquery()
+        )
+        comments_total = (
+            select(func.count(Comment.id))
+            .where(
+                Comment.content_id == ContentItem.id,
+                Comment.status == CommentStatus.active.value,
+            )
+            .correlate(ContentItem)
+            .scalar_subquery()
+        )
+        mark_catalog_changed(db)
+        result = db.execute(
+            update(ContentItem)
+            .where(
+                or_(
+                    ContentItem.likes_count != likes_total,
+                    ContentItem.comments_count != comments_total,
+                )
+            )
+            .values(
+                likes_count=likes_total,
+                comments_count=comments_total,
+                updated_at=ContentItem.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def resolve_content_file(relative_path: str) -> Optional[Path]:
+        """Return the absolute path of a stored content file, or None if it is missing.
+
+        Paths that would escape the content directory are treated as missing.
+        """
+
+        settings = get_settings()
+        content_dir = (Path(settings.media_root) / settings.content_subdir).resolve()
+        absolute_path = (Path(settings.media_root) / relative_path).resolve()
+        if content_dir not in absolute_path.parents or not absolute_path.is_file():
+            return None
+        return absolute_path
 
     @staticmethod
     def remove_content_file(relative_path: str) -> None:
@@ -153,17 +355,19 @@ class ContentService:
         return ALLOWED_CONTENT_TYPES[content_type]
 
     @staticmethod
-    def _validate_file_size(file_bytes: bytes) -> None:
+    def max_file_size_bytes() -> int:
         settings = get_settings()
-        limit = settings.content_max_file_size_mb * 1024 * 1024
-        if len(file_bytes) > limit:
-            raise ValueError("file_too_large")
+        return settings.content_max_file_size_mb * 1024 * 1024
 
     @staticmethod
     def _validate_category(db: Session, category_id: UUID) -> Optional[UUID]:
         if category_id is None:
             return None
-        category = db.get(Category, category_id)
-        if not category:
-            raise ValueError("category_not_found")
-        return category.id
+        catalog = get_category_catalog()
+        if category_id in catalog.snapshot(db).by_id:
+            return category_id
+        # Possibly created by another process since the last version check; reload once.
+        catalog.invalidate()
+        if category_id in catalog.snapshot(db).by_id:
+            return category_id
+        raise ValueError("category_not_found")
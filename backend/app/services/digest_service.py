@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..models.content import ContentItem, ContentStatus
+from ..models.notification_digest import NotificationDigestEntry
+from ..models.preference import ContentDigest
+from ..models.user import User, UserStatus
+
+
+@dataclass(frozen=True)
+class DigestItem:
+    content_id: UUID
+    title: str
+
+
+@dataclass(frozen=True)
+class DueDigest:
+    user_id: UUID
+    email: str
+    # Distinct, still-published items in the order they were published.
+    items: tuple[DigestItem, ...]
+    # Every buffered row covered by this digest, including duplicates and withdrawn items.
+    entry_ids: tuple[UUID, ...]
+
+
+def window_start(frequency: ContentDigest, now: Optional[datetime] = None) -> datetime:
+    """Start of the current digest window; entries created before it are due (UTC)."""
+
+    now = now or datetime.now(timezone.utc)
+    now = now.astimezone(timezone.utc)
+    if frequency == ContentDigest.hourly:
+        return now.replace(minute=0, second=0, microsecond=0)
+    if frequency == ContentDigest.daily:
+        return now.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError("invalid_digest_frequency")
+
+
+def buffer_content_published(
+    db: Session,
+    recipients: Iterable[tuple[UUID, str]],
+    payload: dict,
+    *,
+    now: Optional[datetime] = None,
+) -> int:
+    """Hold a content.published event for ``(user_id, frequency)`` recipients; no commit."""
+
+    created_at = now or datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "frequency": frequency,
+            "content_id": UUID(payload["content_id"]),
+            "title": payload["title"][:255],
+            "broadcast_id": payload["broadcast_id"],
+            "created_at": created_at,
+        }
+        for user_id, frequency in recipients
+    ]
+    if rows:
+        db.execute(insert(NotificationDigestEntry), rows)
+    return len(rows)
+
+
+def load_due_digests(
+    db: Session,
+    frequency: ContentDigest,
+    *,
+    before: datetime,
+    after_user_id: Optional[UUID] = None,
+    limit: int = 500,
+) -> list[DueDigest]:
+    """Return the next ``limit`` members (by id) with entries created before ``before``."""
+
+    due = (
+        NotificationDigestEntry.frequency == frequency.value,
+        NotificationDigestEntry.created_at < before,
+    )
+    user_ids = select(NotificationDigestEntry.user_id).where(*due).distinct()
+    if after_user_id is not None:
+        user_ids = user_ids.where(NotificationDigestEntry.user_id > after_user_id)
+    user_ids = user_ids.order_by(NotificationDigestEntry.user_id).limit(limit)
+    page = db.execute(user_ids).scalars().all()
+    if not page:
+        return []
+
+    rows = db.execute(
+        select(
+            NotificationDigestEntry.id,
+            NotificationDigestEntry.user_id,
+            NotificationDigestEntry.content_id,
+            User.email,
+            User.status,
+            ContentItem.title,
+            ContentItem.status.label("content_status"),
+        )
+        .join(User, User.id == NotificationDigestEntry.user_id)
+        .outerjoin(ContentItem, ContentItem.id == NotificationDigestEntry.content_id)
+        .where(*due, NotificationDigestEntry.user_id.in_(page))
+        .order_by(NotificationDigestEntry.user_id, NotificationDigestEntry.created_at)
+    ).all()
+
+    digests: list[DueDigest] = []
+    by_user: dict[UUID, list] = {}
+    for row in rows:
+        by_user.setdefault(row.user_id, []).append(row)
+    for user_id in page:
+        user_rows = by_user.get(user_id, [])
+        if not user_rows:
+            continue
+        items: dict[UUID, DigestItem] = {}
+        for row in user_rows:
+            if row.content_status == ContentStatus.published.value:
+                items.setdefault(row.content_id, DigestItem(row.content_id, row.title))
+        # Members who left or were suspended keep no buffered events.
+        active = user_rows[0].status == UserStatus.active.value
+        digests.append(
+            DueDigest(
+                user_id=user_id,
+                email=user_rows[0].email,
+                items=tuple(items.values()) if active else (),
+                entry_ids=tuple(row.id for row in user_rows),
+            )
+        )
+    return digests
+
+
+def delete_entries(db: Session, entry_ids: Sequence[UUID]) -> None:
+    if entry_ids:
+        db.execute(
+            delete(NotificationDigestEntry)
+            .where(NotificationDigestEntry.id.in_(entry_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+
+def pending_counts(db: Session) -> dict[str, int]:
+    """Buffered entries per frequency."""
+
+    rows = db.execute(
+        select(NotificationDigestEntry.frequency, func.count(NotificationDigestEntry.id)).group_by(
+            NotificationDigestEntry.frequency
+        )
+    ).all()
+    return {frequency: count for frequency, count in rows}
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from jose import jwt
+from jose import JWTError, jwt
 
 from ..config import get_settings
 
@@ -19,3 +19,21 @@ def generate_download_token(*, content_id: UUID, actor_id: UUID) -> str:
         "exp": int((now + timedelta(minutes=5)).timestamp()),
     }
     return jwt.encode(payload, settings.secret_key, algorithm="HS256")
+
+
+def verify_download_token(token: str, *, content_id: UUID) -> dict:
+    """Validate a download token minted for ``content_id``.
+
+    Raises ValueError("invalid_token") if the token is expired, tampered with, or was
+    issued for different content.
+    """
+
+    settings = get_settings()
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+    except JWTError as exc:
+        raise ValueError("invalid_token") from exc
+
+    if payload.get("type") != "download" or payload.get("sub") != str(content_id):
+        raise ValueError("invalid_token")
+    return payload
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from ..models.like import Like
 from ..models.content import ContentItem
+from ..services.content_service import ContentService
 
 
 def add_like(db: Session, *, content: ContentItem, user_id: UUID) -> Like:
@@ -17,16 +18,20 @@ def add_like(db: Session, *, content: ContentItem, user_id: UUID) -> Like:
         return existing
     like = Like(content_id=content.id, user_id=user_id)
     db.add(like)
+    db.flush()
+    ContentService.adjust_engagement_counts(db, content_id=content.id, likes=1)
     db.commit()
     db.refresh(like)
     return like
 
 
 def remove_like(db: Session, *, content: ContentItem, user_id: UUID) -> None:
-    like = db.execute(
-        select(Like).where(Like.content_id == content.id, Like.user_id == user_id)
-    ).scalar_one_or_none()
-    if not like:
+    result = db.execute(
+        delete(Like)
+        .where(Like.content_id == content.id, Like.user_id == user_id)
+        .execution_options(synchronize_session="fetch")
+    )
+    if not result.rowcount:
         return
-    db.delete(like)
+    ContentService.adjust_engagement_counts(db, content_id=content.id, likes=-1)
     db.commit()
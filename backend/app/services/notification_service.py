@@ -1,21 +1,38 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Protocol, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import event, func, literal, select, true
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
 
 from ..config import get_settings
 from ..models.content import ContentItem
+from ..models.preference import ContentDigest, UserPreference
 from ..models.user import User, UserStatus
+from . import digest_service, outbox_service
 
 
 logger = logging.getLogger(__name__)
 
+TOPIC_PASSWORD_RESET = "auth.password_reset"
+TOPIC_VERIFY_EMAIL = "auth.verify_email"
+TOPIC_ACCOUNT_VERIFIED = "auth.account_verified"
+TOPIC_CONTENT_PUBLISHED = "content.published"
+
+_PENDING_NOTIFICATIONS = "pending_notifications"
+
 
 class NotificationChannel(str, Enum):
     EMAIL = "email"
@@ -32,11 +49,65 @@ class NotificationMessage:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class DeliveryResult:
+    recipient: str
+    delivered: bool
+    error: Optional[str] = None
+
+
 class NotificationProvider(Protocol):
     def send(self, message: NotificationMessage) -> None:
         """Dispatch a notification message via the provider."""
 
 
+class BatchNotificationProvider(NotificationProvider, Protocol):
+    """A provider that can deliver several messages in one call.
+
+    ``send_batch`` receives at most ``max_batch_size`` messages sharing a channel and
+    template, and returns one :class:`DeliveryResult` per message, in order. Raising means
+    the whole batch failed.
+    """
+
+    max_batch_size: int
+
+    def send_batch(self, messages: Sequence[NotificationMessage]) -> list[DeliveryResult]:
+        """Dispatch ``messages`` in a single provider call."""
+
+
+class SingleSendBatchAdapter:
+    """Expose a ``send``-only provider as a :class:`BatchNotificationProvider`.
+
+    Batches hold a single message so the dispatcher's sender pool keeps sending
+    concurrently, exactly as it did before batching existed.
+    """
+
+    max_batch_size = 1
+
+    def __init__(self, provider: NotificationProvider) -> None:
+        self.provider = provider
+
+    def send(self, message: NotificationMessage) -> None:
+        self.provider.send(message)
+
+    def send_batch(self, messages: Sequence[NotificationMessage]) -> list[DeliveryResult]:
+        results = []
+        for message in messages:
+            try:
+                self.provider.send(message)
+            except Exception as exc:
+                results.append(DeliveryResult(message.recipient, False, repr(exc)))
+            else:
+                results.append(DeliveryResult(message.recipient, True))
+        return results
+
+
+def as_batch_provider(provider: NotificationProvider) -> BatchNotificationProvider:
+    if callable(getattr(provider, "send_batch", None)) and getattr(provider, "max_batch_size", 0):
+        return provider  # type: ignore[return-value]
+    return SingleSendBatchAdapter(provider)
+
+
 class LoggingNotificationProvider:
     """Default provider that logs notification payloads for development."""
 
@@ -56,6 +127,51 @@ class LoggingNotificationProvider:
         )
 
 
+class FakeNotificationProvider:
+    """Local provider that only sleeps, for benchmarking fan-out without a real API.
+
+    Every call, single or batched, costs one ``latency_seconds`` round trip plus
+    ``per_message_seconds`` per message. Recipients listed in ``failing_recipients`` are
+    reported as undelivered.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_seconds: float = 0.05,
+        per_message_seconds: float = 0.0,
+        max_batch_size: int = 1000,
+        failing_recipients: Iterable[str] = (),
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.per_message_seconds = per_message_seconds
+        self.max_batch_size = max_batch_size
+        self.failing_recipients = frozenset(failing_recipients)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.messages_sent = 0
+
+    def send(self, message: NotificationMessage) -> None:
+        result = self.send_batch([message])[0]
+        if not result.delivered:
+            raise RuntimeError(result.error)
+
+    def send_batch(self, messages: Sequence[NotificationMessage]) -> list[DeliveryResult]:
+        time.sleep(self.latency_seconds + self.per_message_seconds * len(messages))
+        results = [
+            (
+                DeliveryResult(message.recipient, False, "recipient_rejected")
+                if message.recipient in self.failing_recipients
+                else DeliveryResult(message.recipient, True)
+            )
+            for message in messages
+        ]
+        with self._lock:
+            self.calls += 1
+            self.messages_sent += sum(result.delivered for result in results)
+        return results
+
+
 _provider: Optional[NotificationProvider] = None
 
 
@@ -66,6 +182,11 @@ def get_notification_provider() -> NotificationProvider:
         provider_name = settings.notification_provider.lower()
         if provider_name in {"logging", "stub", "development"}:
             _provider = LoggingNotificationProvider()
+        elif provider_name == "fake":
+            _provider = FakeNotificationProvider(
+                latency_seconds=settings.notification_fake_latency_ms / 1000,
+                max_batch_size=settings.notification_fake_batch_size,
+            )
         else:  # pragma: no cover - defensive branch for future providers
             logger.warning(
                 "Unknown notification provider '%s', falling back to logging stub", provider_name
@@ -86,32 +207,85 @@ def send_message(message: NotificationMessage) -> None:
     provider.send(message)
 
 
-def send_password_reset_email(email: str, token: str) -> None:
-    """Dispatch password reset notification through the active provider."""
+def send_messages(messages: Iterable[NotificationMessage]) -> list[DeliveryResult]:
+    """Send ``messages`` through the active provider, batched where it supports it.
+
+    Results are returned per recipient in delivery-batch order; a batch the provider
+    rejects outright is reported as failed for each of its recipients.
+    """
+
+    provider = as_batch_provider(get_notification_provider())
+    results: list[DeliveryResult] = []
+    for batch in batch_messages(messages, provider.max_batch_size):
+        results.extend(_send_batch_quietly(provider, batch))
+    return results
+
+
+def batch_messages(
+    messages: Iterable[NotificationMessage], max_batch_size: int
+) -> Iterator[list[NotificationMessage]]:
+    """Group messages by channel and template and split the groups into provider batches."""
 
-    message = NotificationMessage(
+    groups: Dict[tuple[NotificationChannel, str], list[NotificationMessage]] = {}
+    for message in messages:
+        groups.setdefault((message.channel, message.template), []).append(message)
+    size = max(max_batch_size, 1)
+    for group in groups.values():
+        for start in range(0, len(group), size):
+            yield group[start : start + size]
+
+
+def _password_reset_message(payload: dict) -> NotificationMessage:
+    return NotificationMessage(
         channel=NotificationChannel.EMAIL,
-        recipient=email,
+        recipient=payload["email"],
         template="auth.password_reset",
         subject="Community App Password Reset",
-        context={"token": token},
+        context={"token": payload["token"]},
         metadata={"event": "auth.password_reset"},
     )
-    send_message(message)
 
 
-def _allows_account_notifications(user: User) -> bool:
-    preferences = getattr(user, "preferences", None)
-    if preferences is None:
-        return True
-    return getattr(preferences, "notify_account", True)
+def _verification_message(payload: dict) -> NotificationMessage:
+    return NotificationMessage(
+        channel=NotificationChannel.EMAIL,
+        recipient=payload["email"],
+        template="auth.verify_email",
+        subject="Verify your Community App account",
+        context={"token": payload["token"], "user_id": payload["user_id"]},
+        metadata={"event": "auth.verify_requested"},
+    )
+
+
+def _account_verified_message(payload: dict) -> NotificationMessage:
+    return NotificationMessage(
+        channel=NotificationChannel.EMAIL,
+        recipient=payload["email"],
+        template="auth.account_verified",
+        subject="Your Community App account is verified",
+        context={"user_id": payload["user_id"]},
+        metadata={"event": "auth.account_verified"},
+    )
+
+
+_MESSAGE_BUILDERS = {
+    TOPIC_PASSWORD_RESET: _password_reset_message,
+    TOPIC_VERIFY_EMAIL: _verification_message,
+    TOPIC_ACCOUNT_VERIFIED: _account_verified_message,
+}
+
 
+def send_password_reset_email(email: str, token: str) -> None:
+    """Dispatch password reset notification through the active provider."""
+
+    send_message(_password_reset_message({"email": email, "token": token}))
 
-def _allows_content_notifications(user: User) -> bool:
+
+def _allows_account_notifications(user: User) -> bool:
     preferences = getattr(user, "preferences", None)
     if preferences is None:
         return True
-    return getattr(preferences, "notify_content", True)
+    return getattr(preferences, "notify_account", True)
 
 
 def send_verification_email(user: User, token: str) -> None:
@@ -119,16 +293,9 @@ def send_verification_email(user: User, token: str) -> None:
 
     if not _allows_account_notifications(user):
         return
-
-    message = NotificationMessage(
-        channel=NotificationChannel.EMAIL,
-        recipient=user.email,
-        template="auth.verify_email",
-        subject="Verify your Community App account",
-        context={"token": token, "user_id": str(user.id)},
-        metadata={"event": "auth.verify_requested"},
+    send_message(
+        _verification_message({"email": user.email, "token": token, "user_id": str(user.id)})
     )
-    send_message(message)
 
 
 def send_account_verified_email(user: User) -> None:
@@ -136,62 +303,469 @@ def send_account_verified_email(user: User) -> None:
 
     if not _allows_account_notifications(user):
         return
+    send_message(_account_verified_message({"email": user.email, "user_id": str(user.id)}))
 
-    message = NotificationMessage(
-        channel=NotificationChannel.EMAIL,
-        recipient=user.email,
-        template="auth.account_verified",
-        subject="Your Community App account is verified",
-        context={"user_id": str(user.id)},
-        metadata={"event": "auth.account_verified"},
+
+def queue_notification(
+    db: Session, topic: str, payload: dict[str, Any], *, idempotency_key: str
+) -> None:
+    """Deliver a notification once ``db``'s current transaction commits.
+
+    With ``notification_outbox_enabled`` the notification is written to the outbox in the
+    same transaction and sent by ``backend.scripts.notification_worker``; otherwise it is
+    sent in-process right after the commit. Either way a rollback discards it.
+    """
+
+    if get_settings().notification_outbox_enabled:
+        outbox_service.enqueue(db, topic=topic, payload=payload, idempotency_key=idempotency_key)
+    else:
+        # Make sure a transaction is open so a later rollback() fires the discard hook.
+        db.connection()
+        db.info.setdefault(_PENDING_NOTIFICATIONS, []).append((topic, payload))
+
+
+def queue_password_reset_email(db: Session, *, email: str, token: str, token_id: str) -> None:
+    queue_notification(
+        db,
+        TOPIC_PASSWORD_RESET,
+        {"email": email, "token": token},
+        idempotency_key=f"{TOPIC_PASSWORD_RESET}:{token_id}",
     )
-    send_message(message)
 
 
-def broadcast_content_published(
-    db: Session,
-    *,
-    content: ContentItem,
-    actor_id: Optional[UUID] = None,
-) -> int:
-    """Notify opted-in members when new content is published."""
-
-    recipients = (
-        db.execute(
-            select(User)
-            .options(selectinload(User.preferences))
-            .where(User.status == UserStatus.active.value)
-        )
-        .scalars()
-        .all()
+def queue_verification_email(db: Session, user: User, token: str) -> None:
+    if not _allows_account_notifications(user):
+        return
+    token_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+    queue_notification(
+        db,
+        TOPIC_VERIFY_EMAIL,
+        {"email": user.email, "token": token, "user_id": str(user.id)},
+        idempotency_key=f"{TOPIC_VERIFY_EMAIL}:{user.id}:{token_digest}",
     )
 
-    delivered = 0
-    for user in recipients:
-        if actor_id and user.id == actor_id:
-            continue
-        if not _allows_content_notifications(user):
-            continue
-        if not user.email:
-            continue
 
-        message = NotificationMessage(
+def queue_account_verified_email(db: Session, user: User) -> None:
+    if not _allows_account_notifications(user):
+        return
+    queue_notification(
+        db,
+        TOPIC_ACCOUNT_VERIFIED,
+        {"email": user.email, "user_id": str(user.id)},
+        idempotency_key=f"{TOPIC_ACCOUNT_VERIFIED}:{user.id}",
+    )
+
+
+def deliver_notification(
+    topic: str,
+    payload: dict,
+    *,
+    bind: Engine,
+    background: bool,
+    progress: Optional[outbox_service.OutboxProgress] = None,
+) -> None:
+    """Send a queued notification now.
+
+    Content broadcasts fan out to many members: with ``background`` they are handed to the
+    dispatcher thread, otherwise they run to completion in the calling thread. With an
+    outbox ``progress`` the broadcast resumes from its saved cursor and saves a new one
+    (renewing the row's lease) after every recipient batch.
+    """
+
+    builder = _MESSAGE_BUILDERS.get(topic)
+    if builder is not None:
+        send_message(builder(payload))
+    elif topic == TOPIC_CONTENT_PUBLISHED:
+        dispatcher = get_notification_dispatcher()
+        if background:
+            dispatcher.submit_content_published(bind, payload)
+        elif progress is not None:
+            dispatcher.run_content_published(
+                bind, payload, resume_after=progress.cursor, checkpoint=progress.advance
+            )
+        else:
+            dispatcher.run_content_published(bind, payload)
+    else:
+        raise ValueError("unknown_topic")
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending_notifications(session: Session) -> None:
+    pending = session.info.pop(_PENDING_NOTIFICATIONS, None)
+    if not pending:
+        return
+    bind = session.get_bind()
+    for topic, payload in pending:
+        try:
+            deliver_notification(topic, payload, bind=bind, background=True)
+        except Exception:
+            logger.exception("Notification delivery failed", extra={"topic": topic})
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_notifications(session: Session, previous: SessionTransaction) -> None:
+    if previous.parent is None:
+        session.info.pop(_PENDING_NOTIFICATIONS, None)
+
+
+@dataclass(frozen=True)
+class BroadcastResult:
+    broadcast_id: str
+    delivered: int
+    failed: int
+    failures: tuple[DeliveryResult, ...] = ()
+    # Recipients whose notification was buffered for their hourly/daily digest.
+    digested: int = 0
+
+
+class NotificationDispatcher:
+    """Runs content broadcasts off the request path.
+
+    Broadcasts run one at a time on a dedicated thread. Recipients are read in keyset
+    batches of ``batch_size`` (id/email only, opt-outs filtered in SQL), split into
+    provider batches (see :func:`batch_messages`) and sent through a pool of
+    ``send_concurrency`` threads, so memory and provider load stay bounded no matter how
+    many members there are.
+    """
+
+    _RESULTS_KEPT = 256
+    # Failed deliveries kept on a BroadcastResult; the rest are only counted and logged.
+    _FAILURES_KEPT = 100
+
+    def __init__(self, *, batch_size: int, send_concurrency: int) -> None:
+        self.batch_size = batch_size
+        self.send_concurrency = send_concurrency
+        self._broadcasts = ThreadPoolExecutor(max_workers=1, thread_name_prefix="broadcast")
+        self._senders = ThreadPoolExecutor(
+            max_workers=send_concurrency, thread_name_prefix="notify-send"
+        )
+        self._lock = threading.Lock()
+        self._futures: OrderedDict[str, Future[BroadcastResult]] = OrderedDict()
+
+    def submit_content_published(self, bind: Engine, payload: dict) -> str:
+        broadcast_id = payload["broadcast_id"]
+        future = self._broadcasts.submit(self.run_content_published, bind, payload)
+        with self._lock:
+            self._futures[broadcast_id] = future
+            while len(self._futures) > self._RESULTS_KEPT:
+                self._futures.popitem(last=False)
+        return broadcast_id
+
+    def wait(self, broadcast_id: str, timeout: Optional[float] = None) -> BroadcastResult:
+        with self._lock:
+            future = self._futures[broadcast_id]
+        return future.result(timeout=timeout)
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            futures = list(self._futures.values())
+        for future in futures:
+            future.result(timeout=timeout)
+
+    def shutdown(self) -> None:
+        self._broadcasts.shutdown(wait=True)
+        self._senders.shutdown(wait=True)
+
+    def run_content_published(
+        self,
+        bind: Engine,
+        payload: dict,
+        *,
+        resume_after: Optional[str] = None,
+        checkpoint: Optional[Callable[[str], None]] = None,
+    ) -> BroadcastResult:
+        """Send one broadcast, optionally starting after recipient id ``resume_after``.
+
+        ``checkpoint`` is called with the last recipient id once each batch is sent; the
+        counts on the result cover only the recipients handled by this call.
+        """
+
+        broadcast_id = payload["broadcast_id"]
+        actor_id = UUID(payload["actor_id"]) if payload.get("actor_id") else None
+        template = NotificationMessage(
             channel=NotificationChannel.EMAIL,
-            recipient=user.email,
+            recipient="",
             template="content.published",
-            subject=f"New content available: {content.title}",
+            subject=f"New content available: {payload['title']}",
             context={
-                "content_id": str(content.id),
-                "title": content.title,
-                "description": content.description,
-                "owner_id": str(content.owner_id) if content.owner_id else None,
+                "content_id": payload["content_id"],
+                "title": payload["title"],
+                "description": payload["description"],
+                "owner_id": payload["owner_id"],
             },
             metadata={
                 "event": "content.published",
-                "content_id": str(content.id),
+                "content_id": payload["content_id"],
+                "broadcast_id": broadcast_id,
+            },
+        )
+
+        provider = as_batch_provider(get_notification_provider())
+        delivered = failed = digested = 0
+        failures: list[DeliveryResult] = []
+        session_factory = sessionmaker(bind=bind)
+        last_id = UUID(resume_after) if resume_after else None
+        while True:
+            with session_factory() as db:
+                batch = db.execute(_content_recipients_query(actor_id, last_id, self.batch_size))
+                recipients = batch.all()
+                if not recipients:
+                    break
+                last_id = recipients[-1].id
+                buffered = [
+                    (recipient.id, recipient.content_digest)
+                    for recipient in recipients
+                    if recipient.content_digest != ContentDigest.immediate.value
+                ]
+                if buffered:
+                    digested += digest_service.buffer_content_published(db, buffered, payload)
+                    db.commit()
+
+            messages = [
+                NotificationMessage(
+                    channel=template.channel,
+                    recipient=recipient.email,
+                    template=template.template,
+                    subject=template.subject,
+                    context=template.context,
+                    metadata=template.metadata,
+                )
+                for recipient in recipients
+                if recipient.content_digest == ContentDigest.immediate.value
+            ]
+            batches = batch_messages(messages, provider.max_batch_size)
+            for results in self._senders.map(
+                lambda batch: _send_batch_quietly(provider, batch), batches
+            ):
+                for result in results:
+                    if result.delivered:
+                        delivered += 1
+                        continue
+                    failed += 1
+                    if len(failures) < self._FAILURES_KEPT:
+                        failures.append(result)
+            if checkpoint is not None:
+                checkpoint(str(last_id))
+
+        logger.info(
+            "Content broadcast finished",
+            extra={
+                "broadcast_id": broadcast_id,
+                "delivered": delivered,
+                "failed": failed,
+                "digested": digested,
             },
         )
-        send_message(message)
-        delivered += 1
+        return BroadcastResult(
+            broadcast_id=broadcast_id,
+            delivered=delivered,
+            failed=failed,
+            failures=tuple(failures),
+            digested=digested,
+        )
 
-    return delivered
+
+def _content_recipients_query(actor_id: Optional[UUID], after_id: Optional[UUID], limit: int):
+    query = (
+        select(
+            User.id,
+            User.email,
+            func.coalesce(
+                UserPreference.content_digest, literal(ContentDigest.immediate.value)
+            ).label("content_digest"),
+        )
+        .outerjoin(UserPreference, UserPreference.user_id == User.id)
+        .where(
+            User.status == UserStatus.active.value,
+            User.email.is_not(None),
+            # Members without a preferences row get the default (opted in).
+            func.coalesce(UserPreference.notify_content, true()),
+        )
+        .order_by(User.id)
+        .limit(limit)
+    )
+    if actor_id is not None:
+        query = query.where(User.id != actor_id)
+    if after_id is not None:
+        query = query.where(User.id > after_id)
+    return query
+
+
+def _send_batch_quietly(
+    provider: BatchNotificationProvider, messages: Sequence[NotificationMessage]
+) -> list[DeliveryResult]:
+    try:
+        results = provider.send_batch(messages)
+    except Exception as exc:
+        logger.exception(
+            "Notification batch delivery failed",
+            extra={"template": messages[0].template, "recipients": len(messages)},
+        )
+        return [DeliveryResult(message.recipient, False, repr(exc)) for message in messages]
+    if len(results) != len(messages):
+        logger.error(
+            "Notification provider returned %d results for %d messages",
+            len(results),
+            len(messages),
+        )
+        return [DeliveryResult(message.recipient, False, "missing_result") for message in messages]
+    for result in results:
+        if not result.delivered:
+            logger.warning(
+                "Notification delivery failed",
+                extra={
+                    "recipient": result.recipient,
+                    "template": messages[0].template,
+                    "error": result.error,
+                },
+            )
+    return results
+
+
+@dataclass(frozen=True)
+class DigestFlushResult:
+    frequency: str
+    # content.published events collapsed into the digests (duplicates included).
+    events: int
+    delivered: int
+    failed: int
+
+    @property
+    def messages_saved(self) -> int:
+        return max(self.events - self.delivered - self.failed, 0)
+
+
+def _digest_message(digest: digest_service.DueDigest, frequency: ContentDigest):
+    count = len(digest.items)
+    return NotificationMessage(
+        channel=NotificationChannel.EMAIL,
+        recipient=digest.email,
+        template="content.digest",
+        subject=(
+            f"New content available: {digest.items[0].title}"
+            if count == 1
+            else f"{count} new items in the Community App"
+        ),
+        context={
+            "frequency": frequency.value,
+            "items": [
+                {"content_id": str(item.content_id), "title": item.title} for item in digest.items
+            ],
+        },
+        metadata={"event": "content.digest", "user_id": str(digest.user_id)},
+    )
+
+
+def flush_content_digests(
+    session_factory: sessionmaker,
+    frequency: ContentDigest,
+    *,
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+) -> DigestFlushResult:
+    """Send one combined message per member for events buffered before the current window.
+
+    Entries are deleted once their digest is delivered (or turns out to be empty because
+    every item was withdrawn); members whose delivery failed keep theirs for the next run.
+    """
+
+    before = digest_service.window_start(frequency, now)
+    batch_size = batch_size or get_settings().notification_batch_size
+    events = delivered = failed = 0
+    last_user_id: Optional[UUID] = None
+    while True:
+        with session_factory() as db:
+            digests = digest_service.load_due_digests(
+                db, frequency, before=before, after_user_id=last_user_id, limit=batch_size
+            )
+            if not digests:
+                break
+            last_user_id = digests[-1].user_id
+
+            sendable = [digest for digest in digests if digest.items]
+            results = send_messages(_digest_message(digest, frequency) for digest in sendable)
+            # send_messages groups by template, and all digests share one, so order holds.
+            done = [digest for digest in digests if not digest.items]
+            for digest, result in zip(sendable, results):
+                events += len(digest.entry_ids)
+                if result.delivered:
+                    delivered += 1
+                    done.append(digest)
+                else:
+                    failed += 1
+            digest_service.delete_entries(
+                db, [entry_id for digest in done for entry_id in digest.entry_ids]
+            )
+            db.commit()
+
+    result = DigestFlushResult(
+        frequency=frequency.value, events=events, delivered=delivered, failed=failed
+    )
+    logger.info(
+        "Content digests flushed",
+        extra={
+            "frequency": result.frequency,
+            "events": result.events,
+            "delivered": result.delivered,
+            "failed": result.failed,
+            "messages_saved": result.messages_saved,
+        },
+    )
+    return result
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            settings = get_settings()
+            _dispatcher = NotificationDispatcher(
+                batch_size=settings.notification_batch_size,
+                send_concurrency=settings.notification_send_concurrency,
+            )
+        return _dispatcher
+
+
+def shutdown_notification_dispatcher() -> None:
+    """Finish queued broadcasts and stop the dispatcher threads."""
+
+    global _dispatcher
+    with _dispatcher_lock:
+        dispatcher, _dispatcher = _dispatcher, None
+    if dispatcher is not None:
+        dispatcher.shutdown()
+
+
+def broadcast_content_published(
+    db: Session,
+    *,
+    content: ContentItem,
+    actor_id: Optional[UUID] = None,
+) -> str:
+    """Queue a notification to opted-in members that ``content`` is published.
+
+    Delivery starts once ``db`` commits (see :func:`queue_notification`); the returned
+    broadcast id tags every message of the fan-out.
+    """
+
+    broadcast_id = uuid.uuid4().hex
+    published_at = content.published_at.isoformat() if content.published_at else ""
+    queue_notification(
+        db,
+        TOPIC_CONTENT_PUBLISHED,
+        {
+            "broadcast_id": broadcast_id,
+            "content_id": str(content.id),
+            "title": content.title,
+            "description": content.description,
+            "owner_id": str(content.owner_id) if content.owner_id else None,
+            "actor_id": str(actor_id) if actor_id else None,
+        },
+        # One broadcast per publication, even if the same publish is retried.
+        idempotency_key=f"{TOPIC_CONTENT_PUBLISHED}:{content.id}:{published_at}",
+    )
+    return broadcast_id
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import logging
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..config import get_settings
+from ..models.notification_outbox import NotificationOutbox, OutboxStatus
+
+logger = logging.getLogger(__name__)
+
+# Payload keys holding live credentials (reset/verification tokens). They are dropped once
+# a row is finished, since sent and dead rows are kept around for inspection.
+SECRET_PAYLOAD_KEYS = frozenset({"token"})
+
+
+class OutboxLeaseLost(Exception):
+    """The worker's lease on a row expired or was taken over by another worker."""
+
+
+class OutboxProgress:
+    """Resume point of the row being handled.
+
+    Handlers that fan out in chunks call :meth:`advance` after each one; it persists the
+    cursor and renews the lease, so a long fan-out keeps its row and a retry (or the worker
+    that takes over after a crash) resumes after the last finished chunk.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        entry_id: uuid.UUID,
+        *,
+        worker_id: str,
+        lease_seconds: int,
+        cursor: Optional[str],
+    ) -> None:
+        self._db = db
+        self.entry_id = entry_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.cursor = cursor
+
+    def advance(self, cursor: str) -> None:
+        renew_lease(
+            self._db,
+            self.entry_id,
+            worker_id=self.worker_id,
+            lease_seconds=self.lease_seconds,
+            cursor=cursor,
+        )
+        self.cursor = cursor
+
+
+OutboxHandler = Callable[[str, dict, OutboxProgress], None]
+
+
+@dataclass(frozen=True)
+class OutboxBatchResult:
+    claimed: int
+    sent: int
+    retried: int
+    dead: int
+    # Seconds between enqueue and successful delivery for the oldest row in the batch.
+    max_lag_seconds: float
+    # Rows whose lease ran out before they were finished; their new owner records them.
+    lost: int = 0
+
+
+def enqueue(db: Session, *, topic: str, payload: dict[str, Any], idempotency_key: str) -> None:
+    """Add an outbox row to ``db``'s transaction; a row with the same key is kept as is."""
+
+    values = {
+        "id": uuid.uuid4(),
+        "topic": topic,
+        "payload": payload,
+        "idempotency_key": idempotency_key,
+        "status": OutboxStatus.pending.value,
+        "attempts": 0,
+        "available_at": datetime.now(timezone.utc),
+    }
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(NotificationOutbox).values(values)
+        statement = statement.on_conflict_do_nothing(index_elements=["idempotency_key"])
+    elif dialect == "sqlite":
+        statement = sqlite.insert(NotificationOutbox).values(values)
+        statement = statement.on_conflict_do_nothing(index_elements=["idempotency_key"])
+    else:
+        exists = db.execute(
+            select(NotificationOutbox.id).where(
+                NotificationOutbox.idempotency_key == idempotency_key
+            )
+        ).first()
+        if exists:
+            return
+        statement = insert(NotificationOutbox).values(values)
+    db.execute(statement)
+
+
+def claim_batch(db: Session, *, worker_id: str, limit: int, lease_seconds: int) -> Sequence[Row]:
+    """Lease up to ``limit`` due rows to ``worker_id`` and commit the lease.
+
+    On Postgres concurrent workers skip each other's rows via ``FOR UPDATE SKIP LOCKED``;
+    SQLite serializes writers, and on both the lease lets another worker take over rows
+    whose worker died. :func:`process_batch` renews the lease before each row, so rows
+    near the end of a slow batch are skipped rather than handled on an expired lease.
+    """
+
+    now = datetime.now(timezone.utc)
+    due = (
+        select(NotificationOutbox.id)
+        .where(
+            NotificationOutbox.status == OutboxStatus.pending.value,
+            NotificationOutbox.available_at <= now,
+            or_(NotificationOutbox.leased_until.is_(None), NotificationOutbox.leased_until < now),
+        )
+        .order_by(NotificationOutbox.available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = db.execute(
+        update(NotificationOutbox)
+        .where(NotificationOutbox.id.in_(due.scalar_subquery()))
+        .values(leased_until=now + timedelta(seconds=lease_seconds), lease_owner=worker_id)
+        .returning(
+            NotificationOutbox.id,
+            NotificationOutbox.topic,
+            NotificationOutbox.payload,
+            NotificationOutbox.attempts,
+            NotificationOutbox.created_at,
+            NotificationOutbox.resume_cursor,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    return rows
+
+
+def renew_lease(
+    db: Session,
+    entry_id: uuid.UUID,
+    *,
+    worker_id: str,
+    lease_seconds: int,
+    cursor: Optional[str] = None,
+) -> None:
+    """Extend ``worker_id``'s unexpired lease (saving ``cursor`` if given) and commit.
+
+    Raises OutboxLeaseLost when the lease already expired or belongs to another worker.
+    """
+
+    now = datetime.now(timezone.utc)
+    values: dict[str, Any] = {"leased_until": now + timedelta(seconds=lease_seconds)}
+    if cursor is not None:
+        values["resume_cursor"] = cursor
+    _update_leased(db, entry_id, worker_id=worker_id, now=now, values=values)
+
+
+def mark_sent(
+    db: Session,
+    entry_id: uuid.UUID,
+    *,
+    worker_id: str,
+    payload: Optional[dict[str, Any]] = None,
+) -> None:
+    """Record delivery and strip secrets from the payload (loaded if not passed in)."""
+
+    now = datetime.now(timezone.utc)
+    _update_leased(
+        db,
+        entry_id,
+        worker_id=worker_id,
+        now=now,
+        values={
+            "status": OutboxStatus.sent.value,
+            "sent_at": now,
+            "leased_until": None,
+            "last_error": None,
+            "payload": _redact(db, entry_id, payload),
+        },
+    )
+
+
+def mark_failed(
+    db: Session,
+    entry_id: uuid.UUID,
+    *,
+    worker_id: str,
+    attempts: int,
+    error: str,
+    payload: Optional[dict[str, Any]] = None,
+) -> bool:
+    """Schedule a retry with exponential backoff; returns True if the row is now dead.
+
+    The resume cursor is kept, so the retry continues a partly delivered fan-out. A dead
+    row has its payload secrets stripped like a sent one.
+    """
+
+    settings = get_settings()
+    attempts += 1
+    dead = attempts >= settings.notification_outbox_max_attempts
+    delay = min(
+        settings.notification_outbox_retry_base_seconds * 2 ** (attempts - 1),
+        settings.notification_outbox_retry_max_seconds,
+    )
+    # Jitter spreads retries of a batch that failed together (e.g. provider outage).
+    delay *= random.uniform(0.8, 1.2)
+    now = datetime.now(timezone.utc)
+    values: dict[str, Any] = {
+        "status": OutboxStatus.dead.value if dead else OutboxStatus.pending.value,
+        "attempts": attempts,
+        "available_at": now + timedelta(seconds=delay),
+        "leased_until": None,
+        "last_error": error[:1000],
+    }
+    if dead:
+        values["payload"] = _redact(db, entry_id, payload)
+    _update_leased(db, entry_id, worker_id=worker_id, now=now, values=values)
+    return dead
+
+
+def process_batch(
+    session_factory: sessionmaker,
+    handler: OutboxHandler,
+    *,
+    worker_id: str,
+    limit: int,
+    lease_seconds: int,
+) -> OutboxBatchResult:
+    """Claim one batch, hand every row to ``handler`` and record the outcome.
+
+    Each row's lease is renewed right before its handler runs. A row whose lease ran out
+    in the meantime is left to whichever worker holds it now.
+    """
+
+    sent = retried = dead = lost = 0
+    max_lag = 0.0
+    with session_factory() as db:
+        rows = claim_batch(db, worker_id=worker_id, limit=limit, lease_seconds=lease_seconds)
+        for row in rows:
+            try:
+                renew_lease(db, row.id, worker_id=worker_id, lease_seconds=lease_seconds)
+                progress = OutboxProgress(
+                    db,
+                    row.id,
+                    worker_id=worker_id,
+                    lease_seconds=lease_seconds,
+                    cursor=row.resume_cursor,
+                )
+                try:
+                    handler(row.topic, row.payload, progress)
+                except OutboxLeaseLost:
+                    raise
+                except Exception as exc:
+                    logger.warning(
+                        "Outbox delivery failed",
+                        extra={"outbox_id": str(row.id), "topic": row.topic, "error": str(exc)},
+                    )
+                    if mark_failed(
+                        db,
+                        row.id,
+                        worker_id=worker_id,
+                        attempts=row.attempts,
+                        error=repr(exc),
+                        payload=row.payload,
+                    ):
+                        dead += 1
+                    else:
+                        retried += 1
+                    continue
+
+                mark_sent(db, row.id, worker_id=worker_id, payload=row.payload)
+            except OutboxLeaseLost:
+                db.rollback()
+                logger.warning(
+                    "Outbox lease lost; leaving the row to its current owner",
+                    extra={"outbox_id": str(row.id), "topic": row.topic, "worker_id": worker_id},
+                )
+                lost += 1
+                continue
+            sent += 1
+            max_lag = max(max_lag, _age_seconds(row.created_at))
+
+    return OutboxBatchResult(
+        claimed=len(rows),
+        sent=sent,
+        retried=retried,
+        dead=dead,
+        max_lag_seconds=max_lag,
+        lost=lost,
+    )
+
+
+def purge_sent(db: Session, *, now: Optional[datetime] = None) -> int:
+    """Delete rows sent more than ``notification_outbox_sent_retention_hours`` ago."""
+
+    hours = get_settings().notification_outbox_sent_retention_hours
+    if hours <= 0:
+        return 0
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(hours=hours)
+    result = db.execute(
+        delete(NotificationOutbox)
+        .where(
+            NotificationOutbox.status == OutboxStatus.sent.value,
+            NotificationOutbox.sent_at < cutoff,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def backlog_stats(db: Session) -> dict[str, Optional[float]]:
+    """Pending/dead row counts and the age in seconds of the oldest pending row."""
+
+    pending, oldest = db.execute(
+        select(func.count(NotificationOutbox.id), func.min(NotificationOutbox.created_at)).where(
+            NotificationOutbox.status == OutboxStatus.pending.value
+        )
+    ).one()
+    dead = db.execute(
+        select(func.count(NotificationOutbox.id)).where(
+            NotificationOutbox.status == OutboxStatus.dead.value
+        )
+    ).scalar_one()
+    return {
+        "pending": pending,
+        "dead": dead,
+        "oldest_pending_seconds": _age_seconds(oldest) if oldest else None,
+    }
+
+
+def _redact(db: Session, entry_id: uuid.UUID, payload: Optional[dict[str, Any]]) -> dict[str, Any]:
+    if payload is None:
+        payload = db.execute(
+            select(NotificationOutbox.payload).where(NotificationOutbox.id == entry_id)
+        ).scalar_one()
+    return {key: value for key, value in payload.items() if key not in SECRET_PAYLOAD_KEYS}
+
+
+def _update_leased(
+    db: Session,
+    entry_id: uuid.UUID,
+    *,
+    worker_id: str,
+    now: datetime,
+    values: dict[str, Any],
+) -> None:
+    result = db.execute(
+        update(NotificationOutbox)
+        .where(
+            NotificationOutbox.id == entry_id,
+            NotificationOutbox.status == OutboxStatus.pending.value,
+            NotificationOutbox.lease_owner == worker_id,
+            NotificationOutbox.leased_until > now,
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    if result.rowcount != 1:
+        raise OutboxLeaseLost(str(entry_id))
+
+
+def _age_seconds(created_at: datetime) -> float:
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return max((datetime.now(timezone.utc) - created_at).total_seconds(), 0.0)
@@ -10,8 +10,9 @@ from sqlalchemy.orm import Session
 from pathlib import Path
 
 from ..models.profile import UserProfile
-from ..models.preference import PrivacyLevel, UserPreference
+from ..models.preference import ContentDigest, PrivacyLevel, UserPreference
 from ..models.user import User
+from ..principal_cache import invalidate_principal
 from ..services.audit_service import log_action
 from ..utils.files import remove_file, save_avatar
 
@@ -83,6 +84,7 @@ class ProfileService:
         )
 
         db.commit()
+        invalidate_principal(user.id)
         db.refresh(user)
         db.refresh(profile)
         return profile
@@ -157,6 +159,7 @@ class ProfileService:
         notify_content: Optional[bool] = None,
         notify_community: Optional[bool] = None,
         notify_account: Optional[bool] = None,
+        content_digest: Optional[ContentDigest] = None,
     ) -> UserPreference:
         preferences = ProfileService._ensure_preferences(db, user)
 
@@ -170,6 +173,9 @@ class ProfileService:
         if notify_account is not None:
             preferences.notify_account = notify_account
             updates["notify_account"] = notify_account
+        if content_digest is not None:
+            preferences.content_digest = content_digest.value
+            updates["content_digest"] = content_digest.value
 
         if updates:
             db.add(preferences)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Sequence
+
+from sqlalchemy import Date, cast, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..models.audit import AuditLog
+from ..models.audit_rollup import AuditDailyRollup, RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+AUDIT_DAILY = "audit_daily"
+_WINDOW = timedelta(days=7)
+
+# Dashboard metric name -> audit action it counts.
+DASHBOARD_ACTIONS = {
+    "logins": "auth.login",
+    "registrations": "auth.register",
+    "likes": "content.like",
+    "comments": "content.comment.create",
+    "downloads": "content.download.request",
+}
+
+
+@dataclass(frozen=True)
+class RollupRunResult:
+    windows: int
+    rows_counted: int
+    high_water: Optional[datetime]
+
+
+def refresh_audit_rollups(db: Session, *, now: Optional[datetime] = None) -> RollupRunResult:
+    """Fold audit rows created since the watermark into ``audit_daily_rollups``.
+
+    Rows newer than ``now - audit_rollup_lag_seconds`` are left for a later run so that
+    late commits (long transactions, the buffered audit sink) are not skipped. Each window
+    advances the watermark with a compare-and-set in the same transaction as its counts,
+    so a crashed or concurrent run can neither skip nor double-count rows.
+    """
+
+    now = now or datetime.now(timezone.utc)
+    upper = now - timedelta(seconds=get_settings().audit_rollup_lag_seconds)
+    start = _load_watermark(db, upper)
+    windows = rows_counted = 0
+    while start < upper:
+        end = min(start + _WINDOW, upper)
+        claimed = db.execute(
+            update(RollupWatermark)
+            .where(RollupWatermark.name == AUDIT_DAILY, RollupWatermark.high_water == start)
+            .values(high_water=end)
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount != 1:
+            db.rollback()
+            logger.warning("Audit rollup watermark moved by another run; stopping")
+            break
+
+        counts = db.execute(
+            select(
+                _day(db),
+                AuditLog.action_type,
+                AuditLog.target_type,
+                func.count(AuditLog.id),
+            )
+            .where(AuditLog.created_at >= start, AuditLog.created_at < end)
+            .group_by(_day(db), AuditLog.action_type, AuditLog.target_type)
+        ).all()
+        for day, action_type, target_type, count in counts:
+            _add_count(db, _as_date(day), action_type, target_type, count)
+            rows_counted += count
+        db.commit()
+        windows += 1
+        start = end
+
+    return RollupRunResult(windows=windows, rows_counted=rows_counted, high_water=start)
+
+
+def high_water(db: Session) -> Optional[datetime]:
+    watermark = db.get(RollupWatermark, AUDIT_DAILY)
+    return _aware(watermark.high_water) if watermark else None
+
+
+def daily_counts(
+    db: Session,
+    *,
+    start: date,
+    end: date,
+    action_types: Sequence[str],
+) -> list[AuditDailyRollup]:
+    """Rollup rows for ``start <= day <= end`` and the given actions, oldest day first."""
+
+    if end < start:
+        raise ValueError("invalid_date_range")
+    return (
+        db.execute(
+            select(AuditDailyRollup)
+            .where(
+                AuditDailyRollup.day >= start,
+                AuditDailyRollup.day <= end,
+                AuditDailyRollup.action_type.in_(action_types),
+            )
+            .order_by(AuditDailyRollup.day, AuditDailyRollup.action_type)
+        )
+        .scalars()
+        .all()
+    )
+
+
+def _load_watermark(db: Session, upper: datetime) -> datetime:
+    current = high_water(db)
+    if current is not None:
+        return current
+
+    oldest = db.execute(select(func.min(AuditLog.created_at))).scalar()
+    initial = _aware(oldest) if oldest else upper
+    try:
+        db.add(RollupWatermark(name=AUDIT_DAILY, high_water=initial))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+    db.expire_all()
+    return high_water(db)
+
+
+def _add_count(db: Session, day: date, action_type: str, target_type: str, count: int) -> None:
+    values = {"day": day, "action_type": action_type, "target_type": target_type, "count": count}
+    dialect = db.get_bind().dialect.name
+    if dialect in {"postgresql", "sqlite"}:
+        module = postgresql if dialect == "postgresql" else sqlite
+        statement = module.insert(AuditDailyRollup).values(values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["day", "action_type", "target_type"],
+            set_={"count": AuditDailyRollup.count + statement.excluded.count},
+        )
+        db.execute(statement)
+        return
+
+    updated = db.execute(
+        update(AuditDailyRollup)
+        .where(
+            AuditDailyRollup.day == day,
+            AuditDailyRollup.action_type == action_type,
+            AuditDailyRollup.target_type == target_type,
+        )
+        .values(count=AuditDailyRollup.count + count)
+        .execution_options(synchronize_session=False)
+    )
+    if updated.rowcount == 0:
+        db.execute(insert(AuditDailyRollup).values(values))
+
+
+def _day(db: Session):
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(func.timezone("UTC", AuditLog.created_at), Date)
+    # SQLite stores UTC timestamps as text; date() returns 'YYYY-MM-DD'.
+    return func.date(AuditLog.created_at)
+
+
+def _as_date(value) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import func, literal, literal_column, select, table
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import CTE
+
+from ..models.content import ContentItem
+
+# The database wraps matches in private-use sentinels rather than markup, so the snippet can
+# be HTML-escaped before the sentinels become <mark> tags (see render_highlight).
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_END = "\ue001"
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_MAX_TOKENS = 8
+
+_sqlite_fts = table("content_items_fts")
+_sqlite_fts_ref = literal_column("content_items_fts")
+_postgres_vector = literal_column("content_items.search_vector")
+
+
+@dataclass(frozen=True)
+class ContentSearch:
+    """Dialect-specific pieces needed to filter, rank and highlight content matches.
+
+    ``rank`` always sorts best-first when used with ``ORDER BY rank DESC``.
+    """
+
+    dialect: str
+    match_query: str
+    rank: ColumnElement[Any]
+    snippet: ColumnElement[Any]
+    matches: Optional[CTE] = None
+
+    def apply(self, query: Query) -> Query:
+        """Restrict an ORM query over ``ContentItem`` to rows matching the search."""
+
+        if self.matches is not None:
+            return query.join(
+                self.matches, self.matches.c.rowid == literal_column("content_items.rowid")
+            )
+        if self.dialect == "postgresql":
+            return query.filter(
+                _postgres_vector.op("@@")(func.to_tsquery("english", self.match_query))
+            )
+        pattern = f"%{self.match_query}%"
+        return query.filter(
+            ContentItem.title.ilike(pattern) | ContentItem.description.ilike(pattern)
+        )
+
+    def apply_filter(self, query: Query) -> Query:
+        """Like :meth:`apply` but without rank/snippet columns; cheaper for counting."""
+
+        if self.dialect == "sqlite":
+            matching_rowids = (
+                select(literal_column("content_items_fts.rowid"))
+                .select_from(_sqlite_fts)
+                .where(_sqlite_fts_ref.op("MATCH")(self.match_query))
+            )
+            return query.filter(literal_column("content_items.rowid").in_(matching_rowids))
+        return self.apply(query)
+
+
+def render_highlight(snippet: Optional[str]) -> Optional[str]:
+    """Escape a search snippet's text and turn its match sentinels into ``<mark>`` tags."""
+
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet, quote=False)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_END, "</mark>")
+    )
+
+
+def tokenize(term: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(term.lower())[:_MAX_TOKENS]
+
+
+def build_content_search(db: Session, term: str) -> Optional[ContentSearch]:
+    """Build a ranked prefix search for ``term`` on the session's database.
+
+    Every token must match, and the last characters typed match as a prefix so results
+    update while the user is still typing. Returns None when the term has no searchable
+    tokens.
+    """
+
+    tokens = tokenize(term)
+    if not tokens:
+        return None
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        match_query = " ".join(f'"{token}"*' for token in tokens)
+        # Resolve matches inside the FTS index first and join back by rowid; putting MATCH
+        # in the outer WHERE lets the planner probe the index once per content row.
+        matches = (
+            select(
+                literal_column("content_items_fts.rowid").label("rowid"),
+                # bm25() is lower-is-better; negate so callers can always sort descending.
+                (-func.bm25(_sqlite_fts_ref, 10.0, 1.0)).label("rank"),
+                func.snippet(_sqlite_fts_ref, -1, HIGHLIGHT_START, HIGHLIGHT_END, "…", 16).label(
+                    "snippet"
+                ),
+            )
+            .select_from(_sqlite_fts)
+            .where(_sqlite_fts_ref.op("MATCH")(match_query))
+            .cte("content_search")
+            .prefix_with("MATERIALIZED")
+        )
+        return ContentSearch(
+            dialect=dialect,
+            match_query=match_query,
+            rank=matches.c.rank,
+            snippet=matches.c.snippet,
+            matches=matches,
+        )
+
+    if dialect == "postgresql":
+        match_query = " & ".join(f"{token}:*" for token in tokens)
+        ts_query = func.to_tsquery("english", match_query)
+        return ContentSearch(
+            dialect=dialect,
+            match_query=match_query,
+            rank=func.ts_rank_cd(_postgres_vector, ts_query),
+            snippet=func.ts_headline(
+                "english",
+                # Highlight over the same text the vector indexes, so title-only matches
+                # still get a marked snippet.
+                ContentItem.title + " " + func.coalesce(ContentItem.description, ""),
+                ts_query,
+                f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=24, MinWords=8",
+            ),
+        )
+
+    # Unknown backends keep the historical substring behaviour without ranking.
+    return ContentSearch(
+        dialect=dialect,
+        match_query=term,
+        rank=literal(0),
+        snippet=literal(None),
+    )
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from io import BytesIO
+import hashlib
+import os
 import secrets
+import tempfile
+from io import BytesIO
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO, Tuple
 
 from PIL import Image
 
 from ..config import get_settings
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _media_root() -> Path:
     settings = get_settings()
@@ -43,16 +48,47 @@ def save_avatar(image_data: bytes, filename_suffix: str | None = None) -> Tuple[
     return unique_name, output_path
 
 
-def save_content_file(file_bytes: bytes, extension: str) -> Tuple[str, Path, int]:
+def save_content_stream(
+    stream: BinaryIO, extension: str, *, max_bytes: int
+) -> Tuple[str, Path, int, str]:
+    """Copy an upload stream to the content directory in fixed-size chunks.
+
+    The size limit is enforced as bytes arrive and a SHA-256 checksum is computed on the
+    fly. Data lands in a temporary file in the destination directory and is renamed into
+    place only once complete, so readers never observe a partial file. Memory use is
+    bounded by ``UPLOAD_CHUNK_SIZE`` regardless of the upload size.
+
+    Returns ``(filename, path, size, sha256_hex)``. Raises ValueError("file_too_large").
+    """
+
     settings = get_settings()
     content_dir = get_media_subdir(settings.content_subdir)
     unique_name = f"{secrets.token_hex(16)}.{extension}"
     output_path = content_dir / unique_name
 
-    with output_path.open("wb") as file_obj:
-        file_obj.write(file_bytes)
-
-    return unique_name, output_path, len(file_bytes)
+    digest = hashlib.sha256()
+    size = 0
+    fd, temp_name = tempfile.mkstemp(prefix=".upload-", suffix=".part", dir=content_dir)
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as file_obj:
+            while True:
+                chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError("file_too_large")
+                digest.update(chunk)
+                file_obj.write(chunk)
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+        os.replace(temp_path, output_path)
+    except BaseException:
+        remove_file(temp_path)
+        raise
+
+    return unique_name, output_path, size, digest.hexdigest()
 
 
 def remove_file(path: Path) -> None:
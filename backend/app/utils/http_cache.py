@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from version fields (timestamps, counters, ids).
+
+    Callers pass whatever identifies the state of the resource, so the tag is known before
+    the response is loaded or rendered.
+    """
+
+    raw = "|".join(_encode_part(part) for part in parts).encode("utf-8")
+    return f'W/"{hashlib.blake2b(raw, digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header (RFC 9110 13.1.2)."""
+
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def not_modified(
+    request: Request, response: Response, *, etag: str, cache_control: str
+) -> Optional[Response]:
+    """Set validator headers on ``response``; return a 304 if the client's copy is current."""
+
+    response.headers["etag"] = etag
+    response.headers["cache-control"] = cache_control
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"etag": etag, "cache-control": cache_control},
+        )
+    return None
+
+
+def _encode_part(part: Any) -> str:
+    if part is None:
+        return ""
+    if isinstance(part, datetime):
+        return part.isoformat()
+    return str(part)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor string."""
+
+    payload = [_encode_value(value) for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, size: int) -> list[Optional[str]]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises ValueError("invalid_cursor") when the cursor is malformed.
+    """
+
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("invalid_cursor") from exc
+
+    if not isinstance(payload, list) or len(payload) != size:
+        raise ValueError("invalid_cursor")
+    if not all(value is None or isinstance(value, str) for value in payload):
+        raise ValueError("invalid_cursor")
+    return payload
+
+
+def parse_cursor_datetime(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise ValueError("invalid_cursor") from exc
+
+
+def parse_cursor_uuid(value: Optional[str]) -> UUID:
+    if value is None:
+        raise ValueError("invalid_cursor")
+    try:
+        return UUID(value)
+    except ValueError as exc:
+        raise ValueError("invalid_cursor") from exc
+
+
+def _encode_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
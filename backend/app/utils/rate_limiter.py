@@ -1,19 +1,65 @@
 from __future__ import annotations
 
+import logging
+import random
+import sqlite3
 import threading
 import time
-from collections import deque
-from typing import Deque, Dict, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Protocol
 
-from ..config import get_settings
 
+from ..config import Settings, get_settings
 
-class InMemoryRateLimiter:
-    def __init__(self, limit: int, window_seconds: int) -> None:
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(Protocol):
+    # True when ``check`` does I/O, so async callers must run it off the event loop.
+    blocking: bool
+
+    def check(self, key: str) -> Optional[float]:
+        """Register a request for ``key``; return retry-after seconds if it is over limit."""
+
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+
+
+class _Shard:
+    __slots__ = ("lock", "entries")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Keys ordered by last activity, oldest first, so idle keys sit at the front. Hit
+        # timestamps live in plain lists: at most ``limit`` floats, far smaller than a deque.
+        self.entries: OrderedDict[str, List[float]] = OrderedDict()
+
+
+class ShardedRateLimiter:
+    """Sliding-window rate limiter with lock striping and bounded memory.
+
+    Keys are spread over ``shards`` independently locked buckets. Each check also drops
+    keys whose whole window has expired, and a shard that grows past its share of
+    ``max_keys`` evicts its least recently active keys, so rotating client addresses
+    cannot grow the store without bound.
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: int,
+        *,
+        shards: int = 16,
+        max_keys: int = 100_000,
+    ) -> None:
         self.limit = limit
         self.window_seconds = window_seconds
-        self._lock = threading.Lock()
-        self._entries: Dict[str, Deque[float]] = {}
+        self.max_keys_per_shard = max(1, -(-max_keys // shards))
+        self._shards: List[_Shard] = [_Shard() for _ in range(shards)]
+        self._shard_count = shards
 
     def check(self, key: str) -> Optional[float]:
         """Register a request for the key.
@@ -21,31 +67,158 @@ class InMemoryRateLimiter:
         Returns the retry-after seconds if the limit is exceeded, otherwise None.
         """
         now = time.monotonic()
-        with self._lock:
-            queue = self._entries.setdefault(key, deque())
-            cutoff = now - self.window_seconds
-            while queue and queue[0] <= cutoff:
-                queue.popleft()
-
-            if len(queue) >= self.limit:
-                retry_after = (
-                    self.window_seconds - (now - queue[0]) if queue else self.window_seconds
-                )
+        cutoff = now - self.window_seconds
+        shard = self._shards[hash(key) % self._shard_count]
+        with shard.lock:
+            entries = shard.entries
+            hits = entries.get(key)
+            if hits is None:
+                # Only new keys grow the shard, so this is the only place that must evict.
+                self._evict(entries, cutoff)
+                entries[key] = [now]
+                return None
+
+            entries.move_to_end(key)
+            while hits and hits[0] <= cutoff:
+                del hits[0]
+
+            if len(hits) >= self.limit:
+                retry_after = self.window_seconds - (now - hits[0])
                 return max(retry_after, 1.0)
 
-            queue.append(now)
+            hits.append(now)
+            return None
+
+    def _evict(self, entries: OrderedDict[str, List[float]], cutoff: float) -> None:
+        # The front key is the least recently active; once its newest hit is outside the
+        # window it holds no state worth keeping.
+        while entries:
+            oldest = next(iter(entries.values()))
+            if oldest and oldest[-1] > cutoff:
+                break
+            entries.popitem(last=False)
+        while len(entries) >= self.max_keys_per_shard:
+            entries.popitem(last=False)
+
+    def key_count(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def reset(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+
+
+class SqliteGcraRateLimiter:
+    """GCRA rate limiter whose state lives in a SQLite file shared by all worker processes.
+
+    Each key stores a single theoretical arrival time (TAT), so memory per key is constant,
+    and every decision is one ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` statement
+    (SQLite >= 3.35). ``limit`` requests may arrive back to back; after that one request
+    is admitted every ``window_seconds / limit`` seconds.
+
+    Checks block on the database file; if it stays locked past ``busy_timeout`` seconds
+    the check falls back to a per-process sliding window with the same limit, so a burst
+    that contends for the file is still limited instead of holding up workers.
+    """
+
+    blocking = True
+
+    _CHECK_SQL = """
+        INSERT INTO rate_limits (key, tat, allowed) VALUES (:key, :now + :interval, 1)
+        ON CONFLICT (key) DO UPDATE SET
+            allowed = max(tat, :now) + :interval - :now <= :window,
+            tat = CASE
+                WHEN max(tat, :now) + :interval - :now <= :window THEN max(tat, :now) + :interval
+                ELSE tat
+            END
+        RETURNING tat, allowed
+    """
+    _PURGE_PROBABILITY = 0.001
+
+    def __init__(
+        self, path: str, limit: int, window_seconds: float, *, busy_timeout: float = 0.25
+    ) -> None:
+        self.path = path
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.busy_timeout = busy_timeout
+        self._fallback = ShardedRateLimiter(limit, window_seconds)
+        self.emission_interval = window_seconds / limit
+        self._local = threading.local()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "key TEXT PRIMARY KEY, tat REAL NOT NULL, allowed INTEGER NOT NULL"
+                ") WITHOUT ROWID"
+            )
+
+    def check(self, key: str) -> Optional[float]:
+        """Register a request for the key.
+
+        Returns the retry-after seconds if the limit is exceeded, otherwise None.
+        """
+        now = time.time()
+        connection = self._connection()
+        try:
+            with connection:
+                tat, allowed = connection.execute(
+                    self._CHECK_SQL,
+                    {
+                        "key": key,
+                        "now": now,
+                        "interval": self.emission_interval,
+                        "window": self.window_seconds,
+                    },
+                ).fetchone()
+                if random.random() < self._PURGE_PROBABILITY:
+                    # Keys whose TAT has passed are indistinguishable from unseen keys.
+                    connection.execute("DELETE FROM rate_limits WHERE tat < ?", (now,))
+        except sqlite3.OperationalError:
+            logger.warning("Rate limit store unavailable; using per-process limit", exc_info=True)
+            return self._fallback.check(key)
+
+        if allowed:
             return None
+        return max(tat + self.emission_interval - self.window_seconds - now, 1.0)
 
     def reset(self) -> None:
-        with self._lock:
-            self._entries.clear()
+        self._fallback.reset()
+        with self._connection() as connection:
+            connection.execute("DELETE FROM rate_limits")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+
+def build_rate_limiter(settings: Settings) -> RateLimitBackend:
+    """Create the auth rate limiter selected by ``settings.auth_rate_limit_backend``."""
+
+    window_seconds = settings.auth_rate_limit_window_minutes * 60
+    if settings.auth_rate_limit_backend == "sqlite":
+        return SqliteGcraRateLimiter(
+            settings.auth_rate_limit_sqlite_path,
+            limit=settings.auth_rate_limit_attempts,
+            window_seconds=window_seconds,
+        )
+    return ShardedRateLimiter(
+        limit=settings.auth_rate_limit_attempts,
+        window_seconds=window_seconds,
+        max_keys=settings.auth_rate_limit_max_keys,
+    )
 
 
-_settings = get_settings()
-auth_rate_limiter = InMemoryRateLimiter(
-    limit=_settings.auth_rate_limit_attempts,
-    window_seconds=_settings.auth_rate_limit_window_minutes * 60,
-)
+auth_rate_limiter = build_rate_limiter(get_settings())
 
 
 def reset_auth_rate_limiter() -> None:
@@ -0,0 +1,84 @@
+"""Archive expired audit logs and query archived months.
+
+Usage:
+    python -m backend.scripts.audit_archive run
+    python -m backend.scripts.audit_archive list
+    python -m backend.scripts.audit_archive query 2025-01 [--action-type auth.login]
+        [--actor-id UUID] [--limit 100]
+
+``run`` creates upcoming monthly partitions (Postgres), then writes every month older than
+AUDIT_RETENTION_MONTHS to ``<media_root>/<audit_archive_subdir>/YYYY-MM.ndjson.gz`` and
+drops it from the database. ``query`` prints matching archived entries as NDJSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import date, datetime
+
+from dotenv import load_dotenv
+
+from backend.app.database import session_scope
+from backend.app.services import audit_archive_service
+
+
+def _month(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("expected YYYY-MM") from exc
+
+
+def run() -> None:
+    with session_scope() as session:
+        created = audit_archive_service.ensure_partitions(session)
+        archived = audit_archive_service.archive_expired(session)
+    for name in created:
+        print(f"created partition {name}")
+    for month in archived:
+        print(f"archived {month.month:%Y-%m}: {month.rows} row(s)")
+    if not archived:
+        print("No expired audit months.")
+
+
+def list_months() -> None:
+    for month, paths in audit_archive_service.list_archives().items():
+        size = sum(path.stat().st_size for path in paths)
+        print(f"{month:%Y-%m}  {len(paths)} file(s)  {size / 1024:.1f} KiB")
+
+
+def query(args: argparse.Namespace) -> None:
+    entries = audit_archive_service.read_archive(
+        args.month, action_type=args.action_type, actor_id=args.actor_id
+    )
+    for index, entry in enumerate(entries):
+        if args.limit and index >= args.limit:
+            break
+        sys.stdout.write(json.dumps(entry) + "\n")
+
+
+def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("run", help="Create partitions and archive expired months")
+    commands.add_parser("list", help="List archived months")
+    query_parser = commands.add_parser("query", help="Print archived entries for a month")
+    query_parser.add_argument("month", type=_month, help="Month to read, as YYYY-MM")
+    query_parser.add_argument("--action-type")
+    query_parser.add_argument("--actor-id")
+    query_parser.add_argument("--limit", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        run()
+    elif args.command == "list":
+        list_months()
+    else:
+        query(args)
+
+
+if __name__ == "__main__":
+    main()
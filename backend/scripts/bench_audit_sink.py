@@ -0,0 +1,74 @@
+"""Compare inline audit inserts with the buffered audit sink on a member hot path.
+
+Usage:
+    python -m backend.scripts.bench_audit_sink --transactions 5000
+
+Each transaction mimics ``POST /content/{id}/like``: one row written plus a
+``content.like`` audit entry, then a commit. Runs against a throwaway SQLite file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+from backend.app.audit_sink import get_audit_sink, shutdown_audit_sink
+from backend.app.config import get_settings
+from backend.app.database import Base
+from backend.app.models.audit import AuditLog
+from backend.app.models.category import Category
+from backend.app.services.audit_service import log_action
+
+
+def run(session_factory, transactions: int) -> float:
+    started = time.perf_counter()
+    for index in range(transactions):
+        with session_factory() as db:
+            db.add(Category(name=f"category-{index}-{time.perf_counter_ns()}"))
+            log_action(
+                db,
+                actor_id=None,
+                action_type="content.like",
+                target_type="content_item",
+                target_id=str(index),
+            )
+            db.commit()
+    return transactions / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=5000)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'bench.sqlite3'}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        print(f"{'audit writes':<14}{'tx/s':>10}")
+        for name, buffered in (("inline", False), ("buffered", True)):
+            settings.audit_buffer_enabled = buffered
+            rate = run(session_factory, args.transactions)
+            print(f"{name:<14}{rate:>10.0f}")
+
+        stats = get_audit_sink().stats()
+        shutdown_audit_sink()
+        with engine.connect() as connection:
+            rows = connection.execute(select(func.count(AuditLog.id))).scalar_one()
+        print(
+            f"sink: {stats['flushes']} flushes, max {stats['max_flush_ms']:.1f} ms; "
+            f"{rows} audit rows written"
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Compare the legacy ILIKE content search against the full-text search service.
+
+Usage:
+    python -m backend.scripts.bench_content_search --items 100000
+
+By default a throwaway SQLite database (FTS5) is created in a temporary directory. Pass
+``--database-url`` pointing at an empty Postgres database to benchmark the tsvector path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.orm import Session
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+from backend.app.database import Base
+from backend.app.models.content import ContentItem, ContentStatus
+from backend.app.services.search_service import build_content_search
+
+SYLLABLES = ("ka", "lo", "mi", "ren", "tor", "vas", "qui", "ble", "dan", "fex", "sol", "ume")
+DOMAIN_WORDS = (
+    "sales playbook onboarding launch enablement pricing objection discovery renewal "
+    "partner webinar roadmap security compliance analytics dashboard training pipeline "
+    "forecast territory quarterly strategy messaging competitive battlecard persona"
+).split()
+
+TERMS = ("onboard", "pricing objection", "quarterly forecast", "zzz-no-match", "sec")
+
+
+def _vocabulary(rng: random.Random, size: int = 20_000) -> tuple[list[str], list[float]]:
+    words = list(DOMAIN_WORDS)
+    while len(words) < size:
+        words.append("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    # Zipf-like frequencies so domain words are common but not in every document.
+    weights = [1.0 / (rank + 10) for rank in range(len(words))]
+    return words, weights
+
+
+def _sentence(rng: random.Random, vocabulary, length: int) -> str:
+    words, weights = vocabulary
+    return " ".join(rng.choices(words, weights=weights, k=length))
+
+
+def seed(session: Session, items: int, batch_size: int = 5000) -> None:
+    rng = random.Random(42)
+    vocabulary = _vocabulary(rng)
+    now = datetime.now(timezone.utc)
+    for start in range(0, items, batch_size):
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "title": _sentence(rng, vocabulary, 4).title(),
+                "description": _sentence(rng, vocabulary, 30),
+                "file_path": "content/bench.pdf",
+                "file_type": "pdf",
+                "status": ContentStatus.published.value,
+                "published_at": now - timedelta(minutes=index),
+                "created_at": now - timedelta(minutes=index),
+                "updated_at": now - timedelta(minutes=index),
+            }
+            for index in range(start, min(start + batch_size, items))
+        ]
+        session.execute(insert(ContentItem), rows)
+        session.commit()
+
+
+def ilike_search(session: Session, term: str) -> int:
+    """Mirror the old GET /content search: total count plus the first page."""
+
+    pattern = f"%{term}%"
+    filters = (
+        ContentItem.status == ContentStatus.published.value,
+        ContentItem.title.ilike(pattern) | ContentItem.description.ilike(pattern),
+    )
+    total = session.query(func.count(ContentItem.id)).filter(*filters).scalar()
+    session.query(ContentItem.id).filter(*filters).order_by(ContentItem.published_at.desc()).limit(
+        12
+    ).all()
+    return total
+
+
+def fts_search(session: Session, term: str) -> int:
+    """Mirror the current GET /content search: total count plus the first ranked page."""
+
+    content_search = build_content_search(session, term)
+    status_filter = ContentItem.status == ContentStatus.published.value
+    total = content_search.apply_filter(
+        session.query(func.count(ContentItem.id)).filter(status_filter)
+    ).scalar()
+    query = session.query(ContentItem.id, content_search.snippet).filter(status_filter)
+    content_search.apply(query).order_by(content_search.rank.desc()).limit(12).all()
+    return total
+
+
+def time_it(fn: Callable[[Session, str], int], session: Session, term: str, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(session, term)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite+pysqlite:///{Path(tmp) / 'bench.sqlite3'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            if not session.query(func.count(ContentItem.id)).scalar():
+                started = time.perf_counter()
+                seed(session, args.items)
+                print(f"Seeded {args.items} items in {time.perf_counter() - started:.1f}s")
+
+            header = f"{'term':<22}{'matches':>9}{'ilike ms':>12}{'fts ms':>12}{'speedup':>10}"
+            print(header)
+            for term in TERMS:
+                matches = fts_search(session, term)
+                ilike_ms = time_it(ilike_search, session, term, args.repeat)
+                fts_ms = time_it(fts_search, session, term, args.repeat)
+                print(
+                    f"{term:<22}{matches:>9}{ilike_ms:>12.2f}{fts_ms:>12.2f}"
+                    f"{ilike_ms / fts_ms:>9.1f}x"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
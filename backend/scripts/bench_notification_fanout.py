@@ -0,0 +1,98 @@
+"""Measure content-broadcast fan-out with a send-only provider and a batch provider.
+
+Usage:
+    python -m backend.scripts.bench_notification_fanout --members 5000 --latency-ms 50
+
+Both variants use the sleeping FakeNotificationProvider, so only the number of provider
+round trips differs: the send-only variant goes through SingleSendBatchAdapter (one call
+per recipient), the batch variant sends up to ``--provider-batch-size`` recipients per call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import StaticPool
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+from backend.app.database import Base
+from backend.app.models.user import User, UserStatus
+from backend.app.services.notification_service import (
+    FakeNotificationProvider,
+    NotificationDispatcher,
+    NotificationMessage,
+    set_notification_provider,
+)
+
+
+class SendOnlyProvider:
+    def __init__(self, fake: FakeNotificationProvider) -> None:
+        self.fake = fake
+
+    def send(self, message: NotificationMessage) -> None:
+        self.fake.send(message)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--provider-batch-size", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User),
+            [
+                {
+                    "email": f"member{index}@example.com",
+                    "password_hash": "x",
+                    "first_name": "Member",
+                    "last_name": str(index),
+                    "status": UserStatus.active.value,
+                }
+                for index in range(args.members)
+            ],
+        )
+    payload = {
+        "broadcast_id": "bench",
+        "content_id": "bench",
+        "title": "Benchmark",
+        "description": None,
+        "owner_id": None,
+        "actor_id": None,
+    }
+
+    print(f"{'provider':<12}{'calls':>10}{'seconds':>10}{'msgs/s':>12}")
+    for name in ("send-only", "batch"):
+        fake = FakeNotificationProvider(
+            latency_seconds=args.latency_ms / 1000, max_batch_size=args.provider_batch_size
+        )
+        set_notification_provider(SendOnlyProvider(fake) if name == "send-only" else fake)
+        dispatcher = NotificationDispatcher(
+            batch_size=args.batch_size, send_concurrency=args.concurrency
+        )
+        try:
+            started = time.perf_counter()
+            result = dispatcher.run_content_published(engine, payload)
+            elapsed = time.perf_counter() - started
+        finally:
+            dispatcher.shutdown()
+            set_notification_provider(None)
+        print(f"{name:<12}{fake.calls:>10}{elapsed:>10.2f}{result.delivered / elapsed:>12.0f}")
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measure GET /content latency with and without the auth rate-limit middleware.
+
+Usage:
+    python -m backend.scripts.bench_rate_limit_middleware --requests 2000
+
+Requests are driven in-process through httpx's ASGI transport against an in-memory SQLite
+database, so the numbers isolate framework and middleware overhead from the network.
+The BaseHTTPMiddleware variant reproduces the middleware as it was before the pure-ASGI
+rewrite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+from backend.app.api.routes import content as content_routes
+from backend.app.database import Base, get_db
+from backend.app.dependencies import get_current_principal
+from backend.app.middleware.rate_limit import AuthRateLimitMiddleware
+from backend.app.models.content import ContentItem, ContentStatus
+from backend.app.principal_cache import Principal
+from backend.app.utils.rate_limiter import auth_rate_limiter
+
+
+class BaseHTTPAuthRateLimitMiddleware(BaseHTTPMiddleware):
+    _LIMITED_PATHS = AuthRateLimitMiddleware._LIMITED_PATHS
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+        if (request.method, request.url.path) in self._LIMITED_PATHS:
+            client_host = request.client.host if request.client else "unknown"
+            retry_after = auth_rate_limiter.check(f"{client_host}:{request.url.path}")
+            if retry_after is not None:
+                return JSONResponse(status_code=429, content={"detail": "Too many requests."})
+        return await call_next(request)
+
+
+def build_app(middleware: Optional[type], session_factory) -> FastAPI:
+    app = FastAPI()
+    app.include_router(content_routes.router)
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    principal = Principal(
+        id=uuid.uuid4(), email="bench@example.com", status="active", is_admin=False
+    )
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get("/content")
+        samples = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get("/content")
+            samples.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        db.add_all(
+            ContentItem(
+                title=f"Item {index}",
+                file_path="content/bench.pdf",
+                file_type="pdf",
+                status=ContentStatus.published.value,
+            )
+            for index in range(12)
+        )
+        db.commit()
+
+    variants = {
+        "no middleware": None,
+        "BaseHTTPMiddleware": BaseHTTPAuthRateLimitMiddleware,
+        "pure ASGI": AuthRateLimitMiddleware,
+    }
+    print(f"{'variant':<20}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, middleware in variants.items():
+        samples = asyncio.run(measure(build_app(middleware, session_factory), args.requests))
+        quantiles = statistics.quantiles(samples, n=100)
+        print(f"{name:<20}{quantiles[49]:>10.3f}{quantiles[98]:>10.3f}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
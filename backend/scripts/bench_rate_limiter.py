@@ -0,0 +1,99 @@
+"""Compare the sharded auth rate limiter against the previous single-lock limiter.
+
+Usage:
+    python -m backend.scripts.bench_rate_limiter --requests 200000 --threads 8
+
+Simulates a credential-stuffing run in which every request comes from a new client address,
+and reports throughput, tracked keys and retained memory for each limiter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+from backend.app.utils.rate_limiter import ShardedRateLimiter
+
+
+class SingleLockRateLimiter:
+    """The limiter used before ShardedRateLimiter: one lock, keys are never dropped."""
+
+    def __init__(self, limit: int, window_seconds: int) -> None:
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Deque[float]] = {}
+
+    def check(self, key: str) -> Optional[float]:
+        now = time.monotonic()
+        with self._lock:
+            queue = self._entries.setdefault(key, deque())
+            cutoff = now - self.window_seconds
+            while queue and queue[0] <= cutoff:
+                queue.popleft()
+
+            if len(queue) >= self.limit:
+                retry_after = (
+                    self.window_seconds - (now - queue[0]) if queue else self.window_seconds
+                )
+                return max(retry_after, 1.0)
+
+            queue.append(now)
+            return None
+
+    def key_count(self) -> int:
+        return len(self._entries)
+
+
+def run(limiter, requests: int, threads: int) -> float:
+    per_thread = requests // threads
+
+    def worker(thread_index: int) -> None:
+        for index in range(per_thread):
+            address = thread_index * per_thread + index
+            limiter.check(f"10.{address >> 16 & 255}.{address >> 8 & 255}.{address & 255}:/login")
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def retained_memory(factory: Callable[[], object], requests: int) -> tuple[int, int]:
+    """Replay the run single-threaded under tracemalloc (which skews timings)."""
+
+    tracemalloc.start()
+    limiter = factory()
+    run(limiter, requests, 1)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, limiter.key_count()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--max-keys", type=int, default=10_000)
+    args = parser.parse_args()
+
+    factories: Dict[str, Callable[[], object]] = {
+        "single-lock": lambda: SingleLockRateLimiter(limit=5, window_seconds=900),
+        "sharded": lambda: ShardedRateLimiter(limit=5, window_seconds=900, max_keys=args.max_keys),
+    }
+    print(f"{'limiter':<14}{'checks/s':>12}{'keys':>10}{'retained MiB':>14}")
+    for name, factory in factories.items():
+        rate = run(factory(), args.requests, args.threads)
+        retained, keys = retained_memory(factory, args.requests)
+        print(f"{name:<14}{rate:>12.0f}{keys:>10}{retained / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
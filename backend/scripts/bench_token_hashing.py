@@ -0,0 +1,81 @@
+"""Measure refresh-token rotation throughput with bcrypt and HMAC token digests.
+
+Usage:
+    python -m backend.scripts.bench_token_hashing --iterations 20
+
+Each iteration runs ``AuthService.refresh`` end to end against a throwaway SQLite database:
+JWT decode, session lookup, digest verification, rotation and the audit insert.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+import backend.app.services.auth_service as auth_service
+from backend.app.database import Base
+from backend.app.models.user import User, UserStatus
+from backend.app.security import hash_password, pwd_context
+from backend.app.services.auth_service import AuthService
+
+
+@contextmanager
+def legacy_bcrypt_digests() -> Iterator[None]:
+    """Swap the token digest back to bcrypt, as it was before the HMAC scheme."""
+
+    original = auth_service.hash_token
+    auth_service.hash_token = pwd_context.hash
+    try:
+        yield
+    finally:
+        auth_service.hash_token = original
+
+
+def run_refreshes(session: Session, iterations: int) -> float:
+    user = AuthService.get_user_by_email(session, "bench@example.com")
+    _, _, refresh_token, _ = AuthService.start_session(session, user)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        _, _, refresh_token, _ = AuthService.refresh(session, refresh_token=refresh_token)
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            User(
+                email="bench@example.com",
+                password_hash=hash_password("Password123!"),
+                first_name="Bench",
+                last_name="User",
+                status=UserStatus.active.value,
+            )
+        )
+        session.commit()
+
+        with legacy_bcrypt_digests():
+            bcrypt_rate = run_refreshes(session, args.iterations)
+        hmac_rate = run_refreshes(session, args.iterations)
+
+    engine.dispose()
+    print(f"{'digest':<14}{'refresh/s':>12}{'ms/refresh':>14}")
+    for name, rate in (("bcrypt", bcrypt_rate), ("hmac-sha256", hmac_rate)):
+        print(f"{name:<14}{rate:>12.1f}{1000 / rate:>14.2f}")
+    print(f"speedup: {hmac_rate / bcrypt_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
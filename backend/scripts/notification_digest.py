@@ -0,0 +1,65 @@
+"""Flush hourly and daily content digests when their window closes.
+
+Usage:
+    python -m backend.scripts.notification_digest [--once] [--poll-interval 60]
+
+Run a single instance: members are flushed in id order and their buffered entries are
+deleted after delivery, so two schedulers flushing the same window could both send.
+Every flush logs how many content.published events were collapsed (``messages_saved``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+from backend.app.config import get_settings
+from backend.app.database import SessionLocal
+from backend.app.logging_config import configure_logging
+from backend.app.models.preference import ContentDigest
+from backend.app.services import digest_service
+from backend.app.services.notification_service import flush_content_digests
+
+logger = logging.getLogger("backend.scripts.notification_digest")
+
+FREQUENCIES = (ContentDigest.hourly, ContentDigest.daily)
+
+
+def flush_closed_windows(flushed: Dict[ContentDigest, Optional[datetime]]) -> None:
+    """Flush each frequency once per window; ``flushed`` remembers the last window done."""
+
+    now = datetime.now(timezone.utc)
+    for frequency in FREQUENCIES:
+        window = digest_service.window_start(frequency, now)
+        if flushed.get(frequency) == window:
+            continue
+        flush_content_digests(SessionLocal, frequency, now=now)
+        flushed[frequency] = window
+
+
+def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="Flush due digests once and exit")
+    parser.add_argument("--poll-interval", type=float, default=60.0)
+    args = parser.parse_args()
+
+    configure_logging(get_settings().log_level)
+    # Start empty so windows that closed while the scheduler was down are flushed now.
+    flushed: Dict[ContentDigest, Optional[datetime]] = {}
+    while True:
+        flush_closed_windows(flushed)
+        if args.once:
+            with SessionLocal() as db:
+                logger.info("Digest entries pending", extra=digest_service.pending_counts(db))
+            break
+        time.sleep(args.poll_interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Deliver notifications written to the outbox (NOTIFICATION_OUTBOX_ENABLED=true).
+
+Usage:
+    python -m backend.scripts.notification_worker [--once] [--poll-interval 1.0]
+
+Several workers may run side by side: rows are leased per worker, so each row is handled
+by one worker at a time and rows held by a crashed worker become claimable again once
+their lease expires. Leases are renewed before each row and after each broadcast batch,
+and a broadcast taken over by another worker resumes after its last finished batch. Sent
+rows older than NOTIFICATION_OUTBOX_SENT_RETENTION_HOURS are purged at every report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import socket
+import time
+
+from dotenv import load_dotenv
+
+from backend.app.config import get_settings
+from backend.app.database import SessionLocal, engine
+from backend.app.logging_config import configure_logging
+from backend.app.services import outbox_service
+from backend.app.services.notification_service import deliver_notification
+
+logger = logging.getLogger("backend.scripts.notification_worker")
+
+
+def handle(topic: str, payload: dict, progress: outbox_service.OutboxProgress) -> None:
+    deliver_notification(topic, payload, bind=engine, background=False, progress=progress)
+
+
+def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="Drain due rows once and exit")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--report-interval", type=float, default=30.0)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    configure_logging(settings.log_level)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    window_started = time.monotonic()
+    window_sent = window_failed = window_lost = 0
+    max_lag = 0.0
+
+    while True:
+        result = outbox_service.process_batch(
+            SessionLocal,
+            handle,
+            worker_id=worker_id,
+            limit=settings.notification_outbox_batch_size,
+            lease_seconds=settings.notification_outbox_lease_seconds,
+        )
+        window_sent += result.sent
+        window_failed += result.retried + result.dead
+        window_lost += result.lost
+        max_lag = max(max_lag, result.max_lag_seconds)
+
+        elapsed = time.monotonic() - window_started
+        if elapsed >= args.report_interval or (args.once and not result.claimed):
+            with SessionLocal() as db:
+                purged = outbox_service.purge_sent(db)
+                backlog = outbox_service.backlog_stats(db)
+            logger.info(
+                "Outbox worker throughput",
+                extra={
+                    "worker_id": worker_id,
+                    "sent_per_second": round(window_sent / elapsed, 2) if elapsed else 0.0,
+                    "failed": window_failed,
+                    "lost_leases": window_lost,
+                    "purged": purged,
+                    "max_lag_seconds": round(max_lag, 3),
+                    **backlog,
+                },
+            )
+            window_started = time.monotonic()
+            window_sent = window_failed = window_lost = 0
+            max_lag = 0.0
+
+        if not result.claimed:
+            if args.once:
+                break
+            time.sleep(args.poll_interval)
+
+
+if __name__ == "__main__":
+    main()
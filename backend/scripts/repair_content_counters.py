@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from dotenv import load_dotenv
+
+from backend.app.database import session_scope
+from backend.app.services.content_service import ContentService
+
+
+def main() -> None:
+    load_dotenv()
+    with session_scope() as session:
+        repaired = ContentService.repair_engagement_counts(session)
+    print(f"Content engagement counters repaired: {repaired} item(s) updated.")
+
+
+if __name__ == "__main__":
+    main()
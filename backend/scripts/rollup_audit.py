@@ -0,0 +1,53 @@
+"""Keep the daily audit rollups behind GET /admin/stats/daily up to date.
+
+Usage:
+    python -m backend.scripts.rollup_audit [--once] [--interval 60]
+
+Each run only reads audit rows created since the stored watermark, so it is cheap to run
+every minute; the first run backfills from the oldest audit row.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from dotenv import load_dotenv
+
+from backend.app.config import get_settings
+from backend.app.database import SessionLocal
+from backend.app.logging_config import configure_logging
+from backend.app.services.rollup_service import refresh_audit_rollups
+
+logger = logging.getLogger("backend.scripts.rollup_audit")
+
+
+def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="Run one refresh and exit")
+    parser.add_argument("--interval", type=float, default=60.0)
+    args = parser.parse_args()
+
+    configure_logging(get_settings().log_level)
+    while True:
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            result = refresh_audit_rollups(db)
+        logger.info(
+            "Audit rollups refreshed",
+            extra={
+                "windows": result.windows,
+                "rows_counted": result.rows_counted,
+                "high_water": result.high_water.isoformat() if result.high_water else None,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            },
+        )
+        if args.once:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
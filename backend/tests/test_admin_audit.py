@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import csv
+import gzip
+import io
+import json
 from datetime import datetime, timedelta, timezone
 
 import backend.app.models  # noqa: F401 - ensure metadata import
@@ -15,6 +19,8 @@ from backend.app.dependencies import get_current_admin
 from backend.app.main import app
 from backend.app.models.audit import AuditLog
 from backend.app.models.user import User, UserStatus
+from backend.app.services import rollup_service
+from backend.app.services.audit_service import clear_count_cache
 
 
 engine = create_engine(
@@ -160,3 +166,195 @@ def test_audit_logs_forbidden_for_non_admin(client: TestClient):
     assert response.status_code == 403
 
     app.dependency_overrides.pop(get_current_admin, None)
+
+
+def test_audit_logs_cursor_paging_and_estimated_total(client: TestClient, session):
+    admin = _create_user(session)
+    member = _create_user(session, email="member@example.com", is_admin=False)
+    now = datetime.now(timezone.utc)
+    for index in range(5):
+        _create_log(
+            session,
+            actor_id=member.id if index % 2 else admin.id,
+            action_type="content.like",
+            target_type="content_item",
+            created_at=now - timedelta(minutes=index),
+        )
+    app.dependency_overrides[get_current_admin] = lambda: session.get(User, admin.id)
+    clear_count_cache()
+    try:
+        seen = []
+        params = {"page_size": 2}
+        while True:
+            body = client.get("/admin/audit/logs", params=params).json()
+            seen.extend(item["created_at"] for item in body["items"])
+            if not body["next_cursor"]:
+                break
+            params = {"page_size": 2, "cursor": body["next_cursor"]}
+        assert len(seen) == 5
+        assert seen == sorted(seen, reverse=True)
+
+        member_logs = client.get(
+            "/admin/audit/logs", params={"actor_id": str(member.id), "total_mode": "estimated"}
+        ).json()
+        assert member_logs["total"] == 2
+        assert member_logs["total_is_estimate"] is True
+        assert {item["actor"]["email"] for item in member_logs["items"]} == {member.email}
+
+        # Estimated totals come from a short-lived cache outside Postgres.
+        _create_log(
+            session,
+            actor_id=member.id,
+            action_type="content.like",
+            target_type="content_item",
+            created_at=now,
+        )
+        cached = client.get(
+            "/admin/audit/logs", params={"actor_id": str(member.id), "total_mode": "estimated"}
+        ).json()
+        assert cached["total"] == 2
+        exact = client.get("/admin/audit/logs", params={"actor_id": str(member.id)}).json()
+        assert (exact["total"], exact["total_is_estimate"]) == (3, False)
+
+        invalid = client.get("/admin/audit/logs", params={"cursor": "not-a-cursor"})
+        assert invalid.status_code == 400
+    finally:
+        clear_count_cache()
+        app.dependency_overrides.pop(get_current_admin, None)
+
+
+def test_admin_can_stream_audit_export(client: TestClient, session):
+    admin = _create_user(session)
+    member = _create_user(session, email="member@example.com", is_admin=False)
+    now = datetime.now(timezone.utc)
+    for index in range(5):
+        _create_log(
+            session,
+            actor_id=member.id if index else None,
+            action_type="content.download.request" if index else "auth.login",
+            target_type="content_item",
+            created_at=now - timedelta(days=5 - index),
+            metadata={"n": index, "note": 'quoted "value", with comma'},
+        )
+    app.dependency_overrides[get_current_admin] = lambda: session.get(User, admin.id)
+    try:
+        response = client.get(
+            "/admin/audit/export",
+            params={"start_at": (now - timedelta(days=4, hours=12)).isoformat()},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert 'filename="audit-logs.csv.gz"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode())))
+        # The export records itself before streaming, so it is the newest row.
+        assert rows[-1]["action_type"] == "admin.audit.export"
+        assert [json.loads(row["metadata"])["n"] for row in rows[:-1]] == [1, 2, 3, 4]
+        assert rows[0]["actor_email"] == member.email
+        assert json.loads(rows[0]["metadata"])["note"] == 'quoted "value", with comma'
+
+        response = client.get(
+            "/admin/audit/export",
+            params={"format": "ndjson", "compress": "false", "action_type": "auth.login"},
+        )
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["actor"] is None
+
+        exports = session.query(AuditLog).filter(AuditLog.action_type == "admin.audit.export")
+        assert sorted(entry.metadata_json["format"] for entry in exports) == ["csv", "ndjson"]
+    finally:
+        app.dependency_overrides.pop(get_current_admin, None)
+
+
+def test_audit_csv_export_neutralizes_formula_cells(client: TestClient, session):
+    admin = _create_user(session)
+    member = _create_user(session, email="@member@example.com", is_admin=False)
+    member.first_name = '=HYPERLINK("http://evil")'
+    member.last_name = "-2+3"
+    session.commit()
+    entry = _create_log(
+        session,
+        actor_id=member.id,
+        action_type="profile.update",
+        target_type="user",
+        created_at=datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+    entry.target_id = "+cmd|' /C calc'!A0"
+    session.commit()
+    app.dependency_overrides[get_current_admin] = lambda: session.get(User, admin.id)
+    try:
+        response = client.get(
+            "/admin/audit/export", params={"compress": "false", "action_type": "profile.update"}
+        )
+        (row,) = list(csv.DictReader(io.StringIO(response.text)))
+        assert row["target_id"] == "'+cmd|' /C calc'!A0"
+        assert row["actor_email"] == "'@member@example.com"
+        assert row["actor_first_name"] == '\'=HYPERLINK("http://evil")'
+        assert row["actor_last_name"] == "'-2+3"
+        assert row["action_type"] == "profile.update"
+    finally:
+        app.dependency_overrides.pop(get_current_admin, None)
+
+
+def test_daily_stats_come_from_incremental_rollups(client: TestClient, session):
+    admin = _create_user(session)
+    day = datetime(2026, 10, 10, 12, tzinfo=timezone.utc)
+
+    def log(action_type: str, created_at: datetime, target_type: str = "content_item"):
+        _create_log(
+            session,
+            actor_id=admin.id,
+            action_type=action_type,
+            target_type=target_type,
+            created_at=created_at,
+        )
+
+    log("auth.login", day - timedelta(days=20), target_type="session")
+    log("auth.login", day, target_type="session")
+    log("auth.login", day + timedelta(hours=1), target_type="session")
+    log("content.like", day)
+    log("content.download.request", day + timedelta(days=1))
+
+    first = rollup_service.refresh_audit_rollups(session, now=day + timedelta(days=2))
+    assert first.rows_counted == 5
+    assert rollup_service.refresh_audit_rollups(session, now=day + timedelta(days=2)).windows == 0
+
+    # Only rows past the watermark are read; a later run adds to existing days.
+    log("auth.login", day + timedelta(days=2), target_type="session")
+    log("content.like", day + timedelta(days=2, hours=1))
+    second = rollup_service.refresh_audit_rollups(
+        session, now=day + timedelta(days=2, hours=1, minutes=1)
+    )
+    assert second.rows_counted == 1  # the like is newer than now - lag and waits a run
+
+    app.dependency_overrides[get_current_admin] = lambda: session.get(User, admin.id)
+    try:
+        response = client.get(
+            "/admin/stats/daily",
+            params={"start": (day - timedelta(days=1)).date().isoformat(), "end": "2026-10-13"},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert [entry["day"] for entry in body["days"]] == [
+            "2026-10-10",
+            "2026-10-11",
+            "2026-10-12",
+        ]
+        assert body["days"][0]["counts"]["logins"] == 2
+        assert body["days"][0]["counts"]["likes"] == 1
+        assert body["days"][1]["counts"] == {
+            "logins": 0,
+            "registrations": 0,
+            "likes": 0,
+            "comments": 0,
+            "downloads": 1,
+        }
+        assert body["days"][2]["counts"]["logins"] == 1
+        assert body["totals"]["logins"] == 3
+        assert body["up_to"].startswith("2026-10-12T12:56")
+
+        bad = client.get("/admin/stats/daily", params={"start": "2026-10-13", "end": "2026-10-01"})
+        assert bad.status_code == 400
+    finally:
+        app.dependency_overrides.pop(get_current_admin, None)
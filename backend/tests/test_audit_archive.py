@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import gzip
+import json
+import uuid
+from datetime import date, datetime, timezone
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.config import get_settings
+from backend.app.database import Base
+from backend.app.models.audit import AuditLog
+from backend.app.services import audit_archive_service
+
+engine = create_engine(
+    "sqlite+pysqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def archive_settings(tmp_path):
+    settings = get_settings()
+    original = settings.media_root, settings.audit_retention_months
+    settings.media_root = str(tmp_path)
+    settings.audit_retention_months = 3
+    yield settings
+    settings.media_root, settings.audit_retention_months = original
+
+
+@pytest.fixture
+def session():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _entry(created_at: datetime, action_type: str = "auth.login") -> AuditLog:
+    return AuditLog(
+        id=uuid.uuid4(),
+        action_type=action_type,
+        target_type="session",
+        target_id="t",
+        metadata_json={"k": "v"},
+        created_at=created_at,
+    )
+
+
+def test_archive_expired_streams_old_months_and_drops_them(session):
+    session.add_all(
+        [
+            _entry(datetime(2026, 5, 3, tzinfo=timezone.utc)),
+            _entry(datetime(2026, 5, 30, tzinfo=timezone.utc), action_type="content.like"),
+            _entry(datetime(2026, 6, 30, 23, 59, tzinfo=timezone.utc)),
+            _entry(datetime(2026, 7, 1, tzinfo=timezone.utc)),
+            _entry(datetime(2026, 10, 1, tzinfo=timezone.utc)),
+        ]
+    )
+    session.commit()
+
+    archived = audit_archive_service.archive_expired(session, now=NOW)
+
+    assert [(month.month, month.rows) for month in archived] == [
+        (date(2026, 5, 1), 2),
+        (date(2026, 6, 1), 1),
+    ]
+    remaining = sorted(entry.created_at.month for entry in session.query(AuditLog))
+    assert remaining == [7, 10]
+
+    with gzip.open(archived[0].path, "rt", encoding="utf-8") as handle:
+        lines = [json.loads(line) for line in handle]
+    assert [line["action_type"] for line in lines] == ["auth.login", "content.like"]
+    assert lines[0]["metadata"] == {"k": "v"}
+    assert audit_archive_service.archive_expired(session, now=NOW) == []
+
+    assert list(audit_archive_service.list_archives()) == [date(2026, 5, 1), date(2026, 6, 1)]
+    likes = list(audit_archive_service.read_archive(date(2026, 5, 1), action_type="content.like"))
+    assert [entry["id"] for entry in likes] == [lines[1]["id"]]
+
+
+def test_rearchived_month_adds_a_part_and_reads_deduplicate(session):
+    may = date(2026, 5, 1)
+    first = _entry(datetime(2026, 5, 3, tzinfo=timezone.utc))
+    first_id, first_created_at = first.id, first.created_at
+    session.add(first)
+    session.commit()
+    audit_archive_service.archive_month(session, may)
+    session.expunge_all()
+
+    # A late row, plus a copy of one already archived (as after an interrupted run).
+    session.add_all(
+        [
+            _entry(datetime(2026, 5, 4, tzinfo=timezone.utc)),
+            AuditLog(
+                id=first_id,
+                action_type="auth.login",
+                target_type="session",
+                created_at=first_created_at,
+            ),
+        ]
+    )
+    session.commit()
+    second = audit_archive_service.archive_month(session, may)
+
+    assert second.path.name == "2026-05.1.ndjson.gz"
+    assert len(list(audit_archive_service.read_archive(may))) == 2
+
+
+def test_retention_zero_keeps_everything(session, archive_settings):
+    archive_settings.audit_retention_months = 0
+    session.add(_entry(datetime(2020, 1, 1, tzinfo=timezone.utc)))
+    session.commit()
+
+    assert audit_archive_service.archive_expired(session, now=NOW) == []
+    assert session.query(AuditLog).count() == 1
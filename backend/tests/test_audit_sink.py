@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import uuid
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.audit_sink import BufferedAuditSink, get_audit_sink, shutdown_audit_sink
+from backend.app.config import get_settings
+from backend.app.database import Base
+from backend.app.models.audit import AuditLog
+from backend.app.services.audit_service import log_action
+
+engine = create_engine(
+    "sqlite+pysqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def audit_buffer_enabled():
+    settings = get_settings()
+    original = (
+        settings.audit_buffer_enabled,
+        settings.audit_buffer_flush_size,
+        settings.audit_buffer_flush_interval_ms,
+        settings.audit_buffer_max_queue,
+    )
+    settings.audit_buffer_enabled = True
+    # Flushes are driven by the tests; the writer thread would share the StaticPool connection.
+    settings.audit_buffer_flush_size = 1000
+    settings.audit_buffer_flush_interval_ms = 60_000
+    shutdown_audit_sink()
+    yield settings
+    shutdown_audit_sink()
+    (
+        settings.audit_buffer_enabled,
+        settings.audit_buffer_flush_size,
+        settings.audit_buffer_flush_interval_ms,
+        settings.audit_buffer_max_queue,
+    ) = original
+
+
+@pytest.fixture
+def session():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _like(db, target_id: str) -> None:
+    log_action(
+        db,
+        actor_id=None,
+        action_type="content.like",
+        target_type="content_item",
+        target_id=target_id,
+    )
+
+
+def test_buffered_actions_are_written_after_commit_in_one_flush(session):
+    for index in range(3):
+        _like(session, str(index))
+    log_action(session, actor_id=None, action_type="auth.login", target_type="session")
+    session.commit()
+
+    # Security-relevant actions stay synchronous.
+    assert [entry.action_type for entry in session.query(AuditLog)] == ["auth.login"]
+    sink = get_audit_sink()
+    assert sink.stats()["queue_depth"] == 3
+
+    assert sink.flush() == 3
+    stats = sink.stats()
+    assert (stats["queue_depth"], stats["written"], stats["flushes"]) == (0, 3, 1)
+    liked = session.query(AuditLog).filter(AuditLog.action_type == "content.like").all()
+    assert sorted(entry.target_id for entry in liked) == ["0", "1", "2"]
+    assert all(entry.created_at is not None for entry in liked)
+
+
+def test_buffered_actions_are_dropped_on_rollback(session):
+    _like(session, "rolled-back")
+    session.rollback()
+    session.commit()
+
+    assert get_audit_sink().stats()["submitted"] == 0
+
+
+def test_full_queue_falls_back_to_synchronous_writes(session, audit_buffer_enabled):
+    audit_buffer_enabled.audit_buffer_max_queue = 1
+    _like(session, "queued")
+    _like(session, "direct")
+    session.commit()
+
+    assert [entry.target_id for entry in session.query(AuditLog)] == ["direct"]
+    assert get_audit_sink().stats()["rejected"] == 1
+
+
+def test_failing_row_does_not_drop_the_batch():
+    sink = BufferedAuditSink(flush_size=100, flush_interval_seconds=60, max_queue=100)
+    duplicate_id = uuid.uuid4()
+    for target_id, entry_id in (("a", duplicate_id), ("b", duplicate_id), ("c", uuid.uuid4())):
+        sink.submit(
+            engine,
+            {
+                "id": entry_id,
+                "actor_id": None,
+                "action_type": "content.like",
+                "target_type": "content_item",
+                "target_id": target_id,
+                "metadata": {},
+            },
+        )
+    try:
+        assert sink.flush() == 2
+        assert sink.stats()["failed"] == 1
+    finally:
+        sink.shutdown()
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import os
+import time
+from uuid import UUID, uuid4
+
 import backend.app.models  # noqa: F401 - ensure models are imported for metadata
+import backend.app.security as security
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -8,7 +13,12 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from backend.app.database import Base, get_db
+from backend.app.hashing_pool import HashingPool, HashingPoolSaturated
 from backend.app.main import app
+from backend.app.models.session import UserSession
+from backend.app.models.user import User, UserStatus
+from backend.app.principal_cache import Principal, PrincipalCache, get_principal_cache
+from backend.app.security import TOKEN_DIGEST_PREFIX, pwd_context
 from backend.app.config import get_settings
 from backend.app.utils.rate_limiter import reset_auth_rate_limiter
 from backend.app.services.notification_service import (
@@ -153,6 +163,31 @@ def test_login_refresh_logout_flow(client: TestClient):
     assert client.cookies.get(settings.refresh_token_cookie_name) is None
 
 
+def test_refresh_accepts_legacy_bcrypt_hash_and_rotates_to_hmac(client: TestClient):
+    settings = get_settings()
+    email = "legacy@example.com"
+    _bootstrap_active_user(client, email)
+    assert client.post("/auth/login", json={"email": email, "password": "Password123!"})
+
+    legacy_cookie = client.cookies.get(settings.refresh_token_cookie_name)
+    db = TestingSessionLocal()
+    session_row = db.query(UserSession).one()
+    assert session_row.refresh_token_hash.startswith(TOKEN_DIGEST_PREFIX)
+    session_row.refresh_token_hash = pwd_context.hash(legacy_cookie)
+    db.commit()
+
+    assert client.post("/auth/refresh").status_code == 200
+    db.expire_all()
+    assert db.query(UserSession).one().refresh_token_hash.startswith(TOKEN_DIGEST_PREFIX)
+
+    # A rotated-out token must not verify against the new digest.
+    client.cookies.set(settings.refresh_token_cookie_name, legacy_cookie)
+    assert client.post("/auth/refresh").status_code == 401
+    db.expire_all()
+    assert db.query(UserSession).count() == 0
+    db.close()
+
+
 def test_login_requires_active_user(client: TestClient):
     email = "pending@example.com"
     payload = {
@@ -285,3 +320,96 @@ def notification_recorder():
         yield provider
     finally:
         set_notification_provider(None)
+
+
+def test_hashing_pool_rejects_work_beyond_pending_limit():
+    pool = HashingPool(workers=1, queue_size=1)
+    try:
+        running = pool.submit(time.sleep, 0.3)
+        queued = pool.submit(time.sleep, 0)
+        with pytest.raises(HashingPoolSaturated) as excinfo:
+            pool.submit(time.sleep, 0)
+        assert excinfo.value.pending == 2
+
+        running.result(timeout=10)
+        queued.result(timeout=10)
+        stats = pool.stats()
+        assert stats["pending"] == 0
+        assert stats["completed"] == 2
+        assert stats["rejected"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_hashing_pool_prewarm_starts_workers_outside_the_pending_count():
+    pool = HashingPool(workers=2, queue_size=0)
+    try:
+        pool.prewarm(timeout=30)
+        assert pool.stats()["pending"] == 0
+
+        worker_pid = pool.submit(os.getpid).result(timeout=10)
+        assert worker_pid != os.getpid()
+        assert pool.stats()["completed"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_login_returns_503_when_hashing_pool_saturated(client: TestClient, monkeypatch):
+    email = "busy@example.com"
+    _bootstrap_active_user(client, email)
+
+    class SaturatedPool:
+        async def run(self, fn, *args):
+            raise HashingPoolSaturated(7)
+
+    monkeypatch.setattr(security, "get_hashing_pool", lambda: SaturatedPool())
+
+    response = client.post("/auth/login", json={"email": email, "password": "Password123!"})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.headers["x-hashing-queue-depth"] == "7"
+
+    metrics = client.get("/metrics").json()
+    assert metrics["password_hashing"]["max_pending"] >= 1
+
+
+def test_principal_cache_serves_repeat_requests_and_drops_on_invalidation(client: TestClient):
+    email = "cached@example.com"
+    _bootstrap_active_user(client, email)
+    login = client.post("/auth/login", json={"email": email, "password": "Password123!"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    user_id = login.json()["user"]["id"]
+
+    cache = get_principal_cache()
+    before = cache.stats()
+    assert client.get("/content", headers=headers).status_code == 200
+    assert client.get("/content", headers=headers).status_code == 200
+    after = cache.stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+    # Suspending the user out of band is only seen once the snapshot is invalidated.
+    db = TestingSessionLocal()
+    user = db.get(User, UUID(user_id))
+    user.status = UserStatus.suspended.value
+    db.commit()
+    db.close()
+    assert client.get("/content", headers=headers).status_code == 200
+    cache.invalidate(UUID(user_id))
+    assert client.get("/content", headers=headers).status_code == 403
+
+
+def test_principal_cache_expires_and_evicts():
+    cache = PrincipalCache(ttl_seconds=0.05, max_entries=2)
+    principals = [
+        Principal(id=uuid4(), email=f"user{index}@example.com", status="active", is_admin=False)
+        for index in range(3)
+    ]
+    for principal in principals:
+        cache.put(principal)
+
+    assert cache.get(principals[0].id) is None  # evicted as least recently used
+    assert cache.get(principals[2].id) == principals[2]
+    time.sleep(0.06)
+    assert cache.get(principals[2].id) is None
+    assert cache.stats()["entries"] == 1
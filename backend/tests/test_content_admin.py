@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import io
 from pathlib import Path
+from typing import Optional
 
 import backend.app.models  # noqa: F401 - ensure metadata import
 import pytest
@@ -18,9 +22,11 @@ from backend.app.models.category import Category
 from backend.app.models.content import ContentItem, ContentStatus
 from backend.app.models.preference import PrivacyLevel, UserPreference
 from backend.app.models.user import User, UserStatus
+from backend.app.utils.files import save_content_stream
 from backend.app.services.notification_service import (
     NotificationMessage,
     NotificationProvider,
+    get_notification_dispatcher,
     set_notification_provider,
 )
 
@@ -144,12 +150,16 @@ def test_admin_can_create_content(client: TestClient, session, notification_reco
     assert stored.category_id == category.id
 
     settings = get_settings()
-    assert (Path(settings.media_root) / stored.file_path).exists()
+    assert (Path(settings.media_root) / stored.file_path).read_bytes() == pdf_bytes
+    assert stored.file_checksum == hashlib.sha256(pdf_bytes).hexdigest()
+    assert body["file_checksum"] == stored.file_checksum
 
+    get_notification_dispatcher().drain(timeout=10)
     assert len(notification_recorder.messages) == 1
     message = notification_recorder.messages[0]
     assert message.recipient == "member@example.com"
     assert message.template == "content.published"
+    assert body["broadcast_id"] == message.metadata["broadcast_id"]
 
     app.dependency_overrides.pop(get_current_admin, None)
 
@@ -220,6 +230,7 @@ def test_update_content_publish_triggers_notifications(
         data={"title": "Draft", "status_value": "draft"},
         files={"file": ("draft.pdf", b"%PDF", "application/pdf")},
     )
+    assert create_response.json()["broadcast_id"] is None
     content_id = create_response.json()["id"]
 
     update_response = client.patch(
@@ -228,9 +239,12 @@ def test_update_content_publish_triggers_notifications(
     )
 
     assert update_response.status_code == 200
+    get_notification_dispatcher().drain(timeout=10)
     assert len(notification_recorder.messages) == 1
     assert notification_recorder.messages[0].recipient == "notify@example.com"
     assert notification_recorder.messages[0].template == "content.published"
+    broadcast_id = update_response.json()["broadcast_id"]
+    assert broadcast_id == notification_recorder.messages[0].metadata["broadcast_id"]
 
     app.dependency_overrides.pop(get_current_admin, None)
 
@@ -271,6 +285,118 @@ def test_create_content_invalid_type(client: TestClient, session):
     app.dependency_overrides.pop(get_current_admin, None)
 
 
+def test_create_content_rejects_oversized_upload(client: TestClient, session):
+    admin = _create_user(session)
+    app.dependency_overrides[get_current_admin] = lambda: session.get(User, admin.id)
+
+    settings = get_settings()
+    original_limit = settings.content_max_file_size_mb
+    settings.content_max_file_size_mb = 1
+    try:
+        response = client.post(
+            "/admin/content",
+            data={"title": "Huge"},
+            files={"file": ("huge.pdf", b"0" * (1024 * 1024 + 1), "application/pdf")},
+        )
+    finally:
+        settings.content_max_file_size_mb = original_limit
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "File exceeds 1MB limit"
+    assert session.query(ContentItem).count() == 0
+
+    app.dependency_overrides.pop(get_current_admin, None)
+
+
+def _post_streamed_upload(declared_length: Optional[int], total_bytes: int):
+    """Send a multipart upload to the app in 64KB messages; return (status, messages read)."""
+
+    boundary = "upload-boundary"
+    head = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="title"\r\n\r\nHuge\r\n'
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="huge.pdf"'
+        "\r\nContent-Type: application/pdf\r\n\r\n"
+    ).encode()
+    chunk = b"0" * (64 * 1024)
+    messages = [head] + [chunk] * (total_bytes // len(chunk))
+    messages.append(f"\r\n--{boundary}--\r\n".encode())
+    headers = [(b"content-type", f"multipart/form-data; boundary={boundary}".encode())]
+    if declared_length is not None:
+        headers.append((b"content-length", str(declared_length).encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/admin/content",
+        "raw_path": b"/admin/content",
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    read = 0
+    sent: list[dict] = []
+
+    async def receive():
+        nonlocal read
+        if read < len(messages):
+            read += 1
+            return {
+                "type": "http.request",
+                "body": messages[read - 1],
+                "more_body": read < len(messages),
+            }
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent[0]["status"], read, len(messages)
+
+
+def test_upload_over_the_cap_is_cut_off_before_it_is_read(session):
+    settings = get_settings()
+    original_limit = settings.content_max_file_size_mb
+    settings.content_max_file_size_mb = 1
+    try:
+        status_code, read, total = _post_streamed_upload(None, 8 * 1024 * 1024)
+        assert status_code == 413
+        assert read < total // 2
+
+        status_code, read, _ = _post_streamed_upload(8 * 1024 * 1024, 8 * 1024 * 1024)
+        assert status_code == 413
+        assert read == 0
+    finally:
+        settings.content_max_file_size_mb = original_limit
+    assert session.query(ContentItem).count() == 0
+
+
+def test_save_content_stream_enforces_limit_while_streaming(tmp_path):
+    settings = get_settings()
+    original_media_root = settings.media_root
+    settings.media_root = str(tmp_path)
+    try:
+        payload = b"x" * (3 * 1024 * 1024 + 17)
+        name, path, size, checksum = save_content_stream(
+            io.BytesIO(payload), "pdf", max_bytes=len(payload)
+        )
+        assert path.read_bytes() == payload
+        assert size == len(payload)
+        assert checksum == hashlib.sha256(payload).hexdigest()
+
+        with pytest.raises(ValueError, match="file_too_large"):
+            save_content_stream(io.BytesIO(payload), "pdf", max_bytes=len(payload) - 1)
+
+        content_dir = tmp_path / settings.content_subdir
+        assert sorted(p.name for p in content_dir.iterdir()) == [name]
+    finally:
+        settings.media_root = original_media_root
+
+
 class RecordingProvider(NotificationProvider):
     def __init__(self) -> None:
         self.messages: list[NotificationMessage] = []
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Optional
-from uuid import UUID
+from typing import Iterator, Optional
+from uuid import UUID, uuid4
 
 import backend.app.models  # noqa: F401 - ensure metadata import
 import pytest
 from fastapi.testclient import TestClient
 from jose import jwt
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from backend.app.category_catalog import get_category_catalog
 from backend.app.config import get_settings
 from backend.app.database import Base, get_db
-from backend.app.dependencies import get_current_user
+from backend.app.dependencies import get_current_principal
 from backend.app.main import app
 from backend.app.models.audit import AuditLog
 from backend.app.models.category import Category
@@ -22,6 +26,9 @@ from backend.app.models.comment import Comment, CommentStatus
 from backend.app.models.content import ContentItem, ContentStatus
 from backend.app.models.like import Like
 from backend.app.models.user import User, UserStatus
+from backend.app.principal_cache import Principal
+from backend.app.response_cache import ResponseCache, get_content_listing_cache
+from backend.app.services.content_service import ContentService
 
 
 engine = create_engine(
@@ -36,6 +43,8 @@ TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=Fals
 def prepare_database():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    get_content_listing_cache().clear()
+    get_category_catalog().invalidate()
     yield
     Base.metadata.drop_all(bind=engine)
 
@@ -79,6 +88,22 @@ def _create_user(session) -> User:
     return user
 
 
+@contextmanager
+def _count_statements() -> Iterator[list[str]]:
+    """Collect the SQL statements executed on the test engine inside the block."""
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 def _create_content(
     session,
     *,
@@ -107,7 +132,9 @@ def _create_content(
 
 def test_list_content_defaults(client: TestClient, session):
     user = _create_user(session)
-    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
 
     _create_content(session, title="Doc A", status=ContentStatus.published)
     _create_content(session, title="Doc B", status=ContentStatus.published)
@@ -123,12 +150,74 @@ def test_list_content_defaults(client: TestClient, session):
     assert all(item["likes_count"] == 0 and item["comments_count"] == 0 for item in body["items"])
     assert all("updated_at" in item for item in body["items"])
 
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_list_content_is_cached_until_the_catalog_changes(client: TestClient, session):
+    user = _create_user(session)
+    principal = Principal.from_user(user)
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    content = _create_content(session, title="Cached", status=ContentStatus.published)
+    cache = get_content_listing_cache()
+
+    first = client.get("/content")
+    before = cache.stats()
+    second = client.get("/content", params={"content_type": "PDF"})
+    third = client.get("/content", params={"content_type": "pdf"})
+    assert first.json() == client.get("/content").json()
+    assert second.json() == third.json()
+    assert cache.stats()["hits"] == before["hits"] + 2
+
+    assert client.post(f"/content/{content.id}/likes").status_code == 201
+    assert client.get("/content").json()["items"][0]["likes_count"] == 1
+
+    metrics = client.get("/metrics").json()["content_listing_cache"]
+    assert metrics["misses"] == before["misses"] + 2
+    assert 0 < metrics["hit_ratio"] <= 1
+
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_response_cache_caps_bytes_and_coalesces_concurrent_misses():
+    cache = ResponseCache(ttl_seconds=60, max_entries=10, max_bytes=10)
+    cache.get_or_load("a", lambda: b"aaaa")
+    cache.get_or_load("b", lambda: b"bbbb")
+    cache.get_or_load("a", lambda: b"unused")
+    cache.get_or_load("c", lambda: b"cccc")
+    assert cache.stats()["bytes"] == 8
+    assert cache.get_or_load("b", lambda: b"BBBB").body == b"BBBB"
+    assert cache.stats()["evictions"] == 2
+
+    release = threading.Event()
+    calls = []
+
+    def slow_loader() -> bytes:
+        calls.append(1)
+        release.wait(5)
+        return b"slow"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("s", slow_loader).body))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats()["coalesced"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [b"slow"] * 4
+    assert len(calls) == 1
 
 
 def test_list_content_filters_and_search(client: TestClient, session):
     user = _create_user(session)
-    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
 
     marketing = Category(name="Marketing")
     sales = Category(name="Sales")
@@ -178,12 +267,94 @@ def test_list_content_filters_and_search(client: TestClient, session):
     assert response.status_code == 200
     assert response.json()["total"] == 1
 
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_list_content_full_text_search(client: TestClient, session):
+    user = _create_user(session)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
+
+    body_match = _create_content(session, title="Quarterly Update", status=ContentStatus.published)
+    body_match.description = "Notes from the onboarding workshop"
+    _create_content(session, title="Onboarding Checklist", status=ContentStatus.published)
+    _create_content(session, title="Unrelated", status=ContentStatus.published)
+    session.commit()
+
+    response = client.get("/content", params={"search": "onboard"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    titles = [item["title"] for item in body["items"]]
+    # Title matches are weighted above description matches.
+    assert titles == ["Onboarding Checklist", "Quarterly Update"]
+    assert all("<mark>" in item["highlight"] for item in body["items"])
+    assert body["next_cursor"] is None
+
+    response = client.get("/content", params={"search": "onboarding workshop"})
+    assert [item["title"] for item in response.json()["items"]] == ["Quarterly Update"]
+
+    _create_content(
+        session, title='Payload <img src=x onerror="alert(1)">', status=ContentStatus.published
+    )
+    response = client.get("/content", params={"search": "payload"})
+    highlight = response.json()["items"][0]["highlight"]
+    assert "<img" not in highlight
+    assert "<mark>Payload</mark> &lt;img" in highlight
+
+    response = client.get("/content", params={"search": "onboard", "cursor": "abc"})
+    assert response.status_code == 400
+
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_list_content_cursor_pagination(client: TestClient, session):
+    user = _create_user(session)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
+
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for index in range(5):
+        content = _create_content(
+            session,
+            title=f"Doc {index}",
+            status=ContentStatus.published,
+            created_at=base + timedelta(hours=index),
+        )
+        # The last two items share a publish timestamp so created_at decides their order.
+        content.published_at = base + timedelta(days=min(index, 3))
+        session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"page_size": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/content", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 5
+        seen.extend(item["title"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == ["Doc 4", "Doc 3", "Doc 2", "Doc 1", "Doc 0"]
+
+    response = client.get("/content", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    app.dependency_overrides.pop(get_current_principal, None)
 
 
 def test_content_detail_and_download(client: TestClient, session):
     user = _create_user(session)
-    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
 
     content = _create_content(session, title="Reference Guide", status=ContentStatus.published)
 
@@ -209,12 +380,186 @@ def test_content_detail_and_download(client: TestClient, session):
     )
     assert len(audit_entries) == 1
 
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_content_detail_loads_in_a_single_query(client: TestClient, session):
+    user = _create_user(session)
+    principal = Principal.from_user(user)
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    category = Category(name="Guides", description=None)
+    session.add(category)
+    session.commit()
+    content = _create_content(
+        session, title="Joined", status=ContentStatus.published, category=category
+    )
+    content.owner_id = user.id
+    session.add(Like(content_id=content.id, user_id=user.id))
+    session.commit()
+    content_id = content.id
+    session.expunge_all()
+
+    with _count_statements() as statements:
+        response = client.get(f"/content/{content_id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["category_name"] == "Guides"
+    assert body["owner_name"] == "Member User"
+    assert body["liked_by_me"] is True
+    assert len(statements) == 1, statements
+
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_content_batch_returns_details_in_request_order(client: TestClient, session):
+    user = _create_user(session)
+    principal = Principal.from_user(user)
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    category = Category(name="Guides", description=None)
+    session.add(category)
+    session.commit()
+    first = _create_content(session, title="First", status=ContentStatus.published)
+    second = _create_content(
+        session, title="Second", status=ContentStatus.published, category=category
+    )
+    draft = _create_content(session, title="Draft", status=ContentStatus.draft)
+    session.add(Like(content_id=second.id, user_id=user.id))
+    session.commit()
+    ids = [second.id, draft.id, first.id, second.id]
+    session.expunge_all()
+
+    with _count_statements() as statements:
+        response = client.get("/content/batch", params={"ids": ",".join(map(str, ids))})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["title"] for item in items] == ["Second", "First"]
+    assert [item["liked_by_me"] for item in items] == [True, False]
+    assert items[0]["category_name"] == "Guides"
+    assert len(statements) == 1, statements
+
+    assert client.get("/content/batch", params={"ids": "nope"}).status_code == 400
+    too_many = ",".join(str(uuid4()) for _ in range(101))
+    assert client.get("/content/batch", params={"ids": too_many}).status_code == 400
+
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_member_reads_answer_304_for_current_etags(client: TestClient, session):
+    user = _create_user(session)
+    principal = Principal.from_user(user)
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    session.add(Category(name="Guides", description=None))
+    session.commit()
+    content = _create_content(session, title="Polled", status=ContentStatus.published)
+
+    for path in ("/content", f"/content/{content.id}", "/content/categories"):
+        first = client.get(path)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        repeat = client.get(path, headers={"If-None-Match": etag})
+        assert repeat.status_code == 304, path
+        assert repeat.headers["etag"] == etag
+    assert client.get("/content/categories").headers["cache-control"] == "private, max-age=60"
+
+    detail_etag = client.get(f"/content/{content.id}").headers["etag"]
+    listing_etag = client.get("/content").headers["etag"]
+    assert client.post(f"/content/{content.id}/likes").status_code == 201
+    liked = client.get(f"/content/{content.id}", headers={"If-None-Match": detail_etag})
+    assert liked.status_code == 200
+    assert liked.json()["liked_by_me"] is True
+    assert client.get("/content", headers={"If-None-Match": listing_etag}).status_code == 200
+
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_listing_revalidation_skips_loading_the_page(client: TestClient, session):
+    user = _create_user(session)
+    principal = Principal.from_user(user)
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    _create_content(session, title="Stable", status=ContentStatus.published)
+
+    etag = client.get("/content").headers["etag"]
+    cache = get_content_listing_cache()
+    cache.clear()
+    misses = cache.stats()["misses"]
+
+    revalidated = client.get("/content", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert cache.stats()["misses"] == misses
+
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_download_content_file_with_token(client: TestClient, session, tmp_path):
+    user = _create_user(session)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
+
+    settings = get_settings()
+    original_media_root = settings.media_root
+    settings.media_root = str(tmp_path)
+    payload = bytes(range(256)) * 40
+    (tmp_path / settings.content_subdir).mkdir()
+    (tmp_path / settings.content_subdir / "Clip.pdf").write_bytes(payload)
+
+    try:
+        content = _create_content(session, title="Clip", status=ContentStatus.published)
+        content.file_checksum = "a" * 64
+        session.commit()
+        token = client.post(f"/content/{content.id}/download").json()["token"]
+        url = f"/content/{content.id}/file"
+
+        full = client.get(url, params={"token": token})
+        assert full.status_code == 200
+        assert full.content == payload
+        assert full.headers["etag"] == f'"{"a" * 64}"'
+        assert full.headers["accept-ranges"] == "bytes"
+        assert full.headers["content-type"] == "application/pdf"
+        assert "attachment" in full.headers["content-disposition"]
+
+        partial = client.get(url, params={"token": token}, headers={"Range": "bytes=100-199"})
+        assert partial.status_code == 206
+        assert partial.content == payload[100:200]
+        assert partial.headers["content-range"] == f"bytes 100-199/{len(payload)}"
+
+        stale = client.get(
+            url, params={"token": token}, headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+        )
+        assert stale.status_code == 200
+        assert stale.content == payload
+
+        head = client.head(url, params={"token": token})
+        assert head.status_code == 200
+        assert head.headers["content-length"] == str(len(payload))
+        assert head.content == b""
+
+        cached = client.get(
+            url, params={"token": token}, headers={"If-None-Match": full.headers["etag"]}
+        )
+        assert cached.status_code == 304
+
+        other = _create_content(session, title="Other", status=ContentStatus.published)
+        assert client.get(f"/content/{other.id}/file", params={"token": token}).status_code == 401
+        assert client.get(url, params={"token": "not-a-token"}).status_code == 401
+        assert client.get(url).status_code == 422
+
+        other_token = client.post(f"/content/{other.id}/download").json()["token"]
+        missing = client.get(f"/content/{other.id}/file", params={"token": other_token})
+        assert missing.status_code == 404
+    finally:
+        settings.media_root = original_media_root
+        app.dependency_overrides.pop(get_current_principal, None)
 
 
 def test_unpublished_content_not_accessible(client: TestClient, session):
     user = _create_user(session)
-    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
 
     content = _create_content(session, title="Draft Only", status=ContentStatus.draft)
 
@@ -224,12 +569,14 @@ def test_unpublished_content_not_accessible(client: TestClient, session):
     response = client.post(f"/content/{content.id}/download")
     assert response.status_code == 404
 
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_principal, None)
 
 
 def test_like_and_unlike_content(client: TestClient, session):
     user = _create_user(session)
-    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
 
     content = _create_content(session, title="Likeable", status=ContentStatus.published)
 
@@ -240,24 +587,33 @@ def test_like_and_unlike_content(client: TestClient, session):
 
     likes = session.query(Like).filter(Like.content_id == content.id).all()
     assert len(likes) == 1
+    assert client.get(f"/content/{content.id}").json()["likes_count"] == 1
+
+    # Liking twice is idempotent and must not inflate the counter.
+    assert client.post(f"/content/{content.id}/likes").status_code == 201
+    assert client.get("/content").json()["items"][0]["likes_count"] == 1
 
     unlike_response = client.delete(f"/content/{content.id}/likes")
     assert unlike_response.status_code == 204
     assert session.query(Like).filter(Like.content_id == content.id).count() == 0
+    assert client.delete(f"/content/{content.id}/likes").status_code == 204
+    assert client.get(f"/content/{content.id}").json()["likes_count"] == 0
 
     like_logs = (
         session.query(AuditLog)
         .filter(AuditLog.action_type.in_(["content.like", "content.unlike"]))
         .all()
     )
-    assert len(like_logs) == 2
+    assert len(like_logs) == 4
 
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_principal, None)
 
 
 def test_list_categories(client: TestClient, session):
     user = _create_user(session)
-    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
 
     marketing = Category(name="Marketing")
     sales = Category(name="Sales")
@@ -270,12 +626,75 @@ def test_list_categories(client: TestClient, session):
     names = {item["name"] for item in body["items"]}
     assert names == {"Marketing", "Sales"}
 
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_category_catalog_serves_reads_and_follows_writes(client: TestClient, session):
+    user = _create_user(session)
+    principal = Principal.from_user(user)
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    catalog = get_category_catalog()
+    marketing = Category(name="Marketing")
+    session.add(marketing)
+    session.commit()
+    marketing_id = marketing.id
+    assert client.get("/content/categories").status_code == 200
+
+    with _count_statements() as statements:
+        cached = client.get("/content/categories")
+        assert ContentService._validate_category(session, marketing_id) == marketing_id
+    assert [item["name"] for item in cached.json()["items"]] == ["Marketing"]
+    assert statements == []
+
+    # Committed ORM writes in this process drop the snapshot immediately.
+    session.add(Category(name="Events"))
+    session.commit()
+    names = [item["name"] for item in client.get("/content/categories").json()["items"]]
+    assert names == ["Events", "Marketing"]
+
+    # Writes from elsewhere show up after the next version check.
+    with engine.begin() as connection:
+        connection.execute(Category.__table__.insert().values(id=uuid4(), name="Sales"))
+    assert len(client.get("/content/categories").json()["items"]) == 2
+    original = catalog.check_seconds
+    catalog.check_seconds = 0
+    try:
+        assert len(client.get("/content/categories").json()["items"]) == 3
+    finally:
+        catalog.check_seconds = original
+
+    # A category deleted elsewhere can still pass validation against the snapshot; the
+    # foreign key failure on commit is reported as a missing category.
+    content_id = _create_content(session, title="Filed", status=ContentStatus.draft).id
+    user_id = user.id
+    session.close()
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+    try:
+        with engine.begin() as connection:
+            connection.execute(Category.__table__.delete().where(Category.id == marketing_id))
+        assert marketing_id in catalog.snapshot(session).by_id
+        with pytest.raises(ValueError, match="category_not_found"):
+            ContentService.update_content(
+                session,
+                content=session.get(ContentItem, content_id),
+                actor=session.get(User, user_id),
+                category_id=marketing_id,
+            )
+        assert marketing_id not in catalog.snapshot(session).by_id
+    finally:
+        session.close()
+        with engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+
+    app.dependency_overrides.pop(get_current_principal, None)
 
 
 def test_comment_lifecycle(client: TestClient, session):
     user = _create_user(session)
-    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    app.dependency_overrides[get_current_principal] = lambda: Principal.from_user(
+        session.get(User, user.id)
+    )
 
     content = _create_content(session, title="Commentable", status=ContentStatus.published)
 
@@ -290,6 +709,7 @@ def test_comment_lifecycle(client: TestClient, session):
     list_response = client.get(f"/content/{content.id}/comments")
     assert list_response.status_code == 200
     assert len(list_response.json()["items"]) == 1
+    assert client.get(f"/content/{content.id}").json()["comments_count"] == 1
 
     update_response = client.patch(
         f"/content/comments/{comment_id}",
@@ -300,6 +720,7 @@ def test_comment_lifecycle(client: TestClient, session):
 
     delete_response = client.delete(f"/content/comments/{comment_id}")
     assert delete_response.status_code == 204
+    assert client.get(f"/content/{content.id}").json()["comments_count"] == 0
     comment_uuid = UUID(comment_id)
     assert (
         session.query(Comment)
@@ -310,4 +731,30 @@ def test_comment_lifecycle(client: TestClient, session):
     audit_actions = session.query(AuditLog).filter(AuditLog.action_type.like("content.comment%"))
     assert audit_actions.count() == 3
 
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_principal, None)
+
+
+def test_repair_engagement_counts(session):
+    user = _create_user(session)
+    content = _create_content(session, title="Drifted", status=ContentStatus.published)
+    session.add_all(
+        [
+            Like(content_id=content.id, user_id=user.id),
+            Comment(content_id=content.id, author_id=user.id, body="Active"),
+            Comment(
+                content_id=content.id,
+                author_id=user.id,
+                body="Removed",
+                status=CommentStatus.deleted.value,
+            ),
+        ]
+    )
+    content.comments_count = 7
+    session.commit()
+
+    assert ContentService.repair_engagement_counts(session) == 1
+    session.refresh(content)
+    assert content.likes_count == 1
+    assert content.comments_count == 1
+
+    assert ContentService.repair_engagement_counts(session) == 0
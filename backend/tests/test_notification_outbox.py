@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import backend.app.models  # noqa: F401 - ensure metadata import
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.config import get_settings
+from backend.app.database import Base
+from backend.app.models.content import ContentItem, ContentStatus
+from backend.app.models.notification_outbox import NotificationOutbox, OutboxStatus
+from backend.app.models.user import User, UserStatus
+from backend.app.services import outbox_service
+from backend.app.services.auth_service import AuthService
+from backend.app.services.notification_service import (
+    NotificationMessage,
+    broadcast_content_published,
+    deliver_notification,
+    set_notification_provider,
+)
+
+engine = create_engine(
+    "sqlite+pysqlite:///:memory:",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+class RecordingProvider:
+    def __init__(self) -> None:
+        self.messages: list[NotificationMessage] = []
+
+    def send(self, message: NotificationMessage) -> None:
+        self.messages.append(message)
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def outbox_enabled():
+    settings = get_settings()
+    original = settings.notification_outbox_enabled, settings.notification_outbox_max_attempts
+    settings.notification_outbox_enabled = True
+    yield settings
+    settings.notification_outbox_enabled, settings.notification_outbox_max_attempts = original
+
+
+@pytest.fixture
+def provider():
+    recorder = RecordingProvider()
+    set_notification_provider(recorder)
+    yield recorder
+    set_notification_provider(None)
+
+
+@pytest.fixture
+def session():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _deliver(topic: str, payload: dict, progress: outbox_service.OutboxProgress) -> None:
+    deliver_notification(topic, payload, bind=engine, background=False, progress=progress)
+
+
+def _process(handler=_deliver, worker_id: str = "worker-1"):
+    return outbox_service.process_batch(
+        TestingSessionLocal, handler, worker_id=worker_id, limit=10, lease_seconds=60
+    )
+
+
+def _create_user(session, email: str = "member@example.com") -> User:
+    user = User(
+        email=email,
+        password_hash="hashed",
+        first_name="Member",
+        last_name="User",
+        status=UserStatus.active.value,
+    )
+    session.add(user)
+    session.commit()
+    return user
+
+
+def test_notification_is_written_with_the_transaction_and_sent_by_worker(session, provider):
+    _create_user(session)
+
+    token = AuthService.request_password_reset(session, email="member@example.com")
+
+    assert provider.messages == []
+    entry = session.query(NotificationOutbox).one()
+    assert entry.topic == "auth.password_reset"
+    assert entry.status == OutboxStatus.pending.value
+
+    result = _process()
+    assert (result.claimed, result.sent) == (1, 1)
+    assert provider.messages[0].recipient == "member@example.com"
+    assert provider.messages[0].context == {"token": token}
+
+    session.expire_all()
+    entry = session.query(NotificationOutbox).one()
+    assert entry.status == OutboxStatus.sent.value
+    assert entry.sent_at is not None
+    assert entry.payload == {"email": "member@example.com"}
+    assert _process().claimed == 0
+
+
+def test_enqueue_deduplicates_on_idempotency_key(session):
+    for _ in range(2):
+        outbox_service.enqueue(
+            session, topic="auth.password_reset", payload={}, idempotency_key="reset:abc"
+        )
+        session.commit()
+
+    assert session.query(NotificationOutbox).count() == 1
+
+
+def test_failed_delivery_is_retried_with_backoff_then_marked_dead(session, outbox_enabled):
+    outbox_enabled.notification_outbox_max_attempts = 2
+    outbox_service.enqueue(
+        session,
+        topic="auth.password_reset",
+        payload={"email": "member@example.com", "token": "live-token"},
+        idempotency_key="reset:flaky",
+    )
+    session.commit()
+
+    def failing_handler(topic: str, payload: dict, progress) -> None:
+        raise RuntimeError("provider unavailable")
+
+    result = _process(failing_handler)
+    assert (result.claimed, result.retried, result.dead) == (1, 1, 0)
+    entry = session.query(NotificationOutbox).one()
+    assert entry.attempts == 1
+    assert entry.status == OutboxStatus.pending.value
+    assert "provider unavailable" in entry.last_error
+    # The retry still needs the token.
+    assert entry.payload["token"] == "live-token"
+    # Not due again until the backoff delay has passed.
+    assert _process(failing_handler).claimed == 0
+
+    session.execute(
+        update(NotificationOutbox).values(
+            available_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+    )
+    session.commit()
+    result = _process(failing_handler)
+    assert result.dead == 1
+    session.expire_all()
+    entry = session.query(NotificationOutbox).one()
+    assert entry.status == OutboxStatus.dead.value
+    assert entry.payload == {"email": "member@example.com"}
+    assert outbox_service.backlog_stats(session)["dead"] == 1
+
+
+def test_leased_rows_are_not_claimed_by_other_workers(session):
+    outbox_service.enqueue(
+        session, topic="auth.password_reset", payload={}, idempotency_key="reset:leased"
+    )
+    session.commit()
+
+    claimed = outbox_service.claim_batch(session, worker_id="a", limit=10, lease_seconds=60)
+    assert len(claimed) == 1
+    assert outbox_service.claim_batch(session, worker_id="b", limit=10, lease_seconds=60) == []
+
+    session.execute(
+        update(NotificationOutbox).values(
+            leased_until=datetime.now(timezone.utc) - timedelta(seconds=1)
+        )
+    )
+    session.commit()
+    assert len(outbox_service.claim_batch(session, worker_id="b", limit=10, lease_seconds=60)) == 1
+
+
+def test_content_broadcast_runs_from_the_outbox(session, provider):
+    admin = _create_user(session, email="admin@example.com")
+    _create_user(session, email="reader@example.com")
+    content = ContentItem(
+        title="Launch Kit",
+        file_path="content/kit.pdf",
+        file_type="pdf",
+        status=ContentStatus.published.value,
+        published_at=datetime.now(timezone.utc),
+    )
+    session.add(content)
+    session.flush()
+    broadcast_content_published(session, content=content, actor_id=admin.id)
+    session.commit()
+
+    result = _process()
+    assert result.sent == 1
+    assert [message.recipient for message in provider.messages] == ["reader@example.com"]
+
+
+def test_expired_lease_is_not_marked_by_the_old_worker(session, provider):
+    outbox_service.enqueue(
+        session, topic="auth.password_reset", payload={}, idempotency_key="reset:slow"
+    )
+    session.commit()
+
+    def slow_handler(topic: str, payload: dict, progress) -> None:
+        # Simulate a handler outliving its lease while another worker takes the row over.
+        session.execute(
+            update(NotificationOutbox).values(
+                leased_until=datetime.now(timezone.utc) + timedelta(seconds=60),
+                lease_owner="worker-2",
+            )
+        )
+        session.commit()
+
+    result = _process(slow_handler)
+    assert (result.claimed, result.sent, result.lost) == (1, 0, 1)
+    entry = session.query(NotificationOutbox).one()
+    assert entry.status == OutboxStatus.pending.value
+    assert entry.lease_owner == "worker-2"
+
+    with pytest.raises(outbox_service.OutboxLeaseLost):
+        outbox_service.mark_sent(session, entry.id, worker_id="worker-1")
+
+
+def test_content_broadcast_resumes_after_the_saved_cursor(session, provider):
+    admin = _create_user(session, email="admin@example.com")
+    for index in range(3):
+        _create_user(session, email=f"reader{index}@example.com")
+    content = ContentItem(
+        title="Launch Kit",
+        file_path="content/kit.pdf",
+        file_type="pdf",
+        status=ContentStatus.published.value,
+        published_at=datetime.now(timezone.utc),
+    )
+    session.add(content)
+    session.flush()
+    broadcast_content_published(session, content=content, actor_id=admin.id)
+    session.commit()
+
+    readers = session.query(User).filter(User.id != admin.id).order_by(User.id).all()
+    # A previous worker finished the batch that ended with the first reader.
+    session.execute(update(NotificationOutbox).values(resume_cursor=str(readers[0].id)))
+    session.commit()
+
+    assert _process().sent == 1
+    assert sorted(message.recipient for message in provider.messages) == sorted(
+        reader.email for reader in readers[1:]
+    )
+    session.expire_all()
+    assert session.query(NotificationOutbox).one().resume_cursor == str(readers[-1].id)
+
+
+def test_purge_sent_drops_old_sent_rows_only(session, outbox_enabled):
+    now = datetime.now(timezone.utc)
+    for key, status, sent_at in [
+        ("old", OutboxStatus.sent, now - timedelta(days=30)),
+        ("recent", OutboxStatus.sent, now - timedelta(hours=1)),
+        ("pending", OutboxStatus.pending, None),
+    ]:
+        session.add(
+            NotificationOutbox(
+                topic="auth.password_reset",
+                payload={},
+                idempotency_key=key,
+                status=status.value,
+                available_at=now,
+                sent_at=sent_at,
+            )
+        )
+    session.commit()
+
+    assert outbox_service.purge_sent(session) == 1
+    keys = sorted(entry.idempotency_key for entry in session.query(NotificationOutbox))
+    assert keys == ["pending", "recent"]
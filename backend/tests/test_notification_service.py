@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import create_engine
@@ -10,15 +11,25 @@ from sqlalchemy.pool import StaticPool
 
 from backend.app.database import Base
 from backend.app.models.content import ContentItem, ContentStatus
-from backend.app.models.preference import PrivacyLevel, UserPreference
+from backend.app.models.notification_digest import NotificationDigestEntry
+from backend.app.models.preference import ContentDigest, PrivacyLevel, UserPreference
 from backend.app.models.user import User, UserStatus
 from backend.app.services.notification_service import (
+    FakeNotificationProvider,
     LoggingNotificationProvider,
     NotificationChannel,
     NotificationMessage,
     NotificationProvider,
+    NotificationDispatcher,
+    SingleSendBatchAdapter,
+    as_batch_provider,
+    batch_messages,
     broadcast_content_published,
+    flush_content_digests,
+    get_notification_dispatcher,
+    queue_password_reset_email,
     send_account_verified_email,
+    send_messages,
     send_password_reset_email,
     send_verification_email,
     set_notification_provider,
@@ -194,10 +205,303 @@ def test_broadcast_content_published_notifies_only_opted_in(session):
         session.commit()
         session.refresh(content)
 
-        delivered = broadcast_content_published(session, content=content, actor_id=admin.id)
-        assert delivered == 1
+        broadcast_id = broadcast_content_published(session, content=content, actor_id=admin.id)
+        assert dummy.messages == []  # delivery waits for the transaction to commit
+        session.commit()
+        result = get_notification_dispatcher().wait(broadcast_id, timeout=10)
+        assert result.delivered == 1
+        assert result.failed == 0
         assert len(dummy.messages) == 1
         assert dummy.messages[0].recipient == member_opt_in.email
         assert dummy.messages[0].template == "content.published"
     finally:
         set_notification_provider(None)
+
+
+class FlakyProvider(DummyProvider):
+    def send(self, message: NotificationMessage) -> None:
+        if message.recipient.startswith("bounce"):
+            raise RuntimeError("mailbox unavailable")
+        super().send(message)
+
+
+def test_dispatcher_streams_recipients_in_batches(session):
+    provider = FlakyProvider()
+    set_notification_provider(provider)
+    dispatcher = NotificationDispatcher(batch_size=2, send_concurrency=3)
+    try:
+        emails = [f"member{index}@example.com" for index in range(5)] + ["bounce@example.com"]
+        users = [
+            User(
+                email=email,
+                password_hash="hashed",
+                first_name="Member",
+                last_name=str(index),
+                status=UserStatus.active.value,
+            )
+            for index, email in enumerate(emails)
+        ]
+        pending = User(
+            email="pending@example.com",
+            password_hash="hashed",
+            first_name="Pending",
+            last_name="Member",
+            status=UserStatus.pending.value,
+        )
+        session.add_all([*users, pending])
+        session.commit()
+        session.add(
+            UserPreference(
+                user_id=users[0].id,
+                privacy_level=PrivacyLevel.private.value,
+                notify_content=False,
+            )
+        )
+        content = ContentItem(
+            title="Launch Kit",
+            file_path="content/kit.pdf",
+            file_type="pdf",
+            status=ContentStatus.published.value,
+        )
+        session.add(content)
+        session.commit()
+
+        broadcast_id = "b" * 32
+        result = dispatcher.run_content_published(
+            session.get_bind(),
+            {
+                "broadcast_id": broadcast_id,
+                "content_id": str(content.id),
+                "title": content.title,
+                "description": content.description,
+                "owner_id": None,
+                "actor_id": str(users[1].id),
+            },
+        )
+
+        assert result.broadcast_id == broadcast_id
+        assert result.delivered == 3
+        assert result.failed == 1
+        assert sorted(message.recipient for message in provider.messages) == emails[2:5]
+        assert {message.metadata["broadcast_id"] for message in provider.messages} == {broadcast_id}
+    finally:
+        dispatcher.shutdown()
+        set_notification_provider(None)
+
+
+def test_queued_notifications_are_dropped_on_rollback(session):
+    dummy = DummyProvider()
+    set_notification_provider(dummy)
+    try:
+        queue_password_reset_email(session, email="a@example.com", token="t1", token_id="j1")
+        session.rollback()
+        session.commit()
+        assert dummy.messages == []
+
+        queue_password_reset_email(session, email="b@example.com", token="t2", token_id="j2")
+        session.commit()
+        assert [message.recipient for message in dummy.messages] == ["b@example.com"]
+    finally:
+        set_notification_provider(None)
+
+
+def _message(recipient: str, template: str = "content.published", channel=None):
+    return NotificationMessage(
+        channel=channel or NotificationChannel.EMAIL, recipient=recipient, template=template
+    )
+
+
+def test_batch_messages_groups_by_channel_and_template():
+    messages = [
+        _message("a@example.com"),
+        _message("b@example.com", template="auth.verify_email"),
+        _message("c@example.com"),
+        _message("+6500000000", channel=NotificationChannel.WHATSAPP),
+        _message("d@example.com"),
+    ]
+
+    batches = [[message.recipient for message in batch] for batch in batch_messages(messages, 2)]
+
+    assert batches == [
+        ["a@example.com", "c@example.com"],
+        ["d@example.com"],
+        ["b@example.com"],
+        ["+6500000000"],
+    ]
+
+
+def test_send_only_providers_are_adapted_with_per_recipient_results():
+    provider = FlakyProvider()
+    adapter = as_batch_provider(provider)
+    assert isinstance(adapter, SingleSendBatchAdapter)
+    assert adapter.max_batch_size == 1
+
+    set_notification_provider(provider)
+    try:
+        results = send_messages([_message("ok@example.com"), _message("bounce@example.com")])
+    finally:
+        set_notification_provider(None)
+
+    assert [(result.recipient, result.delivered) for result in results] == [
+        ("ok@example.com", True),
+        ("bounce@example.com", False),
+    ]
+    assert "mailbox unavailable" in results[1].error
+    assert [message.recipient for message in provider.messages] == ["ok@example.com"]
+
+
+def test_dispatcher_uses_send_batch_when_available(session):
+    provider = FakeNotificationProvider(
+        latency_seconds=0, max_batch_size=3, failing_recipients={"member4@example.com"}
+    )
+    assert as_batch_provider(provider) is provider
+    set_notification_provider(provider)
+    dispatcher = NotificationDispatcher(batch_size=5, send_concurrency=2)
+    try:
+        session.add_all(
+            User(
+                email=f"member{index}@example.com",
+                password_hash="hashed",
+                first_name="Member",
+                last_name=str(index),
+                status=UserStatus.active.value,
+            )
+            for index in range(8)
+        )
+        session.commit()
+
+        result = dispatcher.run_content_published(
+            session.get_bind(),
+            {
+                "broadcast_id": "c" * 32,
+                "content_id": str(uuid.uuid4()),
+                "title": "Battlecards",
+                "description": None,
+                "owner_id": None,
+                "actor_id": None,
+            },
+        )
+
+        assert result.delivered == 7
+        assert result.failed == 1
+        assert [failure.recipient for failure in result.failures] == ["member4@example.com"]
+        # Two recipient pages (5 + 3) split into provider batches of at most 3.
+        assert provider.calls == 3
+    finally:
+        dispatcher.shutdown()
+        set_notification_provider(None)
+
+
+def test_digest_members_get_one_message_per_window(session):
+    dummy = DummyProvider()
+    set_notification_provider(dummy)
+    dispatcher = NotificationDispatcher(batch_size=10, send_concurrency=2)
+    try:
+        users = [
+            User(
+                email=f"{name}@example.com",
+                password_hash="hashed",
+                first_name=name,
+                last_name="Member",
+                status=UserStatus.active.value,
+            )
+            for name in ("instant", "hourly", "daily")
+        ]
+        session.add_all(users)
+        session.commit()
+        session.add_all(
+            UserPreference(
+                user_id=user.id,
+                privacy_level=PrivacyLevel.private.value,
+                content_digest=frequency.value,
+            )
+            for user, frequency in zip(users, ContentDigest)
+        )
+        items = [
+            ContentItem(
+                title=f"Kit {index}",
+                file_path="content/kit.pdf",
+                file_type="pdf",
+                status=ContentStatus.published.value,
+            )
+            for index in range(3)
+        ]
+        session.add_all(items)
+        session.commit()
+
+        for index, item in enumerate(items):
+            result = dispatcher.run_content_published(
+                session.get_bind(),
+                {
+                    "broadcast_id": f"{index:032d}",
+                    "content_id": str(item.id),
+                    "title": item.title,
+                    "description": None,
+                    "owner_id": None,
+                    "actor_id": None,
+                },
+            )
+            assert (result.delivered, result.digested) == (1, 2)
+        assert [message.recipient for message in dummy.messages] == ["instant@example.com"] * 3
+
+        items[2].status = ContentStatus.archived.value
+        session.commit()
+        dummy.messages.clear()
+
+        # The current window is still open: nothing is due yet.
+        assert flush_content_digests(TestingSessionLocal, ContentDigest.hourly).events == 0
+
+        later = datetime.now(timezone.utc) + timedelta(hours=1)
+        result = flush_content_digests(TestingSessionLocal, ContentDigest.hourly, now=later)
+        assert (result.events, result.delivered, result.failed) == (3, 1, 0)
+        assert result.messages_saved == 2
+        assert len(dummy.messages) == 1
+        digest = dummy.messages[0]
+        assert digest.recipient == "hourly@example.com"
+        assert digest.template == "content.digest"
+        assert [item["title"] for item in digest.context["items"]] == ["Kit 0", "Kit 1"]
+
+        remaining = session.query(NotificationDigestEntry).all()
+        assert {entry.frequency for entry in remaining} == {ContentDigest.daily.value}
+    finally:
+        dispatcher.shutdown()
+        set_notification_provider(None)
+
+
+def test_failed_digests_stay_buffered(session):
+    provider = FlakyProvider()
+    set_notification_provider(provider)
+    try:
+        user = User(
+            email="bounce@example.com",
+            password_hash="hashed",
+            first_name="Bounce",
+            last_name="Member",
+            status=UserStatus.active.value,
+        )
+        content = ContentItem(
+            title="Kit",
+            file_path="content/kit.pdf",
+            file_type="pdf",
+            status=ContentStatus.published.value,
+        )
+        session.add_all([user, content])
+        session.commit()
+        session.add(
+            NotificationDigestEntry(
+                user_id=user.id,
+                frequency=ContentDigest.daily.value,
+                content_id=content.id,
+                title=content.title,
+                broadcast_id="d" * 32,
+                created_at=datetime.now(timezone.utc) - timedelta(days=1),
+            )
+        )
+        session.commit()
+
+        result = flush_content_digests(TestingSessionLocal, ContentDigest.daily)
+
+        assert (result.delivered, result.failed) == (0, 1)
+        assert session.query(NotificationDigestEntry).count() == 1
+    finally:
+        set_notification_provider(None)
@@ -16,6 +16,7 @@ from backend.app.models.user import User, UserStatus
 from backend.app.dependencies import get_current_user
 from backend.app.config import get_settings
 
+from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
@@ -103,6 +104,32 @@ def test_get_profile_returns_defaults(client: TestClient, session):
     app.dependency_overrides.pop(get_current_user, None)
 
 
+def test_get_profile_revalidates_with_etag(client: TestClient, session):
+    user = _create_user(session)
+    app.dependency_overrides[get_current_user] = lambda: session.get(User, user.id)
+    client.patch("/profile/me/preferences", json={"notify_content": True})
+
+    first = client.get("/profile/me")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    unchanged = client.get("/profile/me", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+
+    preferences = session.query(UserPreference).filter_by(user_id=user.id).one()
+    preferences.notify_content = not preferences.notify_content
+    preferences.updated_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    session.commit()
+
+    changed = client.get("/profile/me", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["notify_content"] == preferences.notify_content
+    assert changed.headers["etag"] != etag
+
+    app.dependency_overrides.pop(get_current_user, None)
+
+
 def test_update_profile_updates_fields_and_logs(client: TestClient, session):
     user = _create_user(session)
     profile = UserProfile(user_id=user.id)
@@ -314,10 +341,21 @@ def test_update_notification_preferences(client: TestClient, session):
     prefs = session.get(UserPreference, user.id)
     assert prefs.notify_content is False
     assert prefs.notify_community is True
+    assert body["content_digest"] == "immediate"
+
+    response = client.patch("/profile/me/preferences", json={"content_digest": "daily"})
+    assert response.status_code == 200
+    assert response.json()["content_digest"] == "daily"
+    session.refresh(prefs)
+    assert prefs.content_digest == "daily"
+    assert (
+        client.patch("/profile/me/preferences", json={"content_digest": "weekly"}).status_code
+        == 422
+    )
 
     audit_entries = (
         session.query(AuditLog).filter(AuditLog.action_type == "profile.preferences.update").all()
     )
-    assert len(audit_entries) == 1
+    assert len(audit_entries) == 2
 
     app.dependency_overrides.pop(get_current_user, None)
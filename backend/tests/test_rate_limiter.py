@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+
+from backend.app.utils.rate_limiter import ShardedRateLimiter, SqliteGcraRateLimiter
+
+
+def test_limits_each_key_independently():
+    limiter = ShardedRateLimiter(limit=2, window_seconds=60, shards=4)
+
+    assert limiter.check("1.1.1.1:/auth/login") is None
+    assert limiter.check("1.1.1.1:/auth/login") is None
+    retry_after = limiter.check("1.1.1.1:/auth/login")
+    assert retry_after is not None and 1.0 <= retry_after <= 60
+
+    assert limiter.check("2.2.2.2:/auth/login") is None
+
+
+def test_idle_keys_are_evicted_once_their_window_expires():
+    limiter = ShardedRateLimiter(limit=3, window_seconds=0.05, shards=1)
+    for index in range(50):
+        limiter.check(f"10.0.0.{index}:/auth/login")
+    assert limiter.key_count() == 50
+
+    time.sleep(0.06)
+    assert limiter.check("10.0.1.1:/auth/login") is None
+    assert limiter.key_count() == 1
+
+
+def test_key_count_is_bounded():
+    limiter = ShardedRateLimiter(limit=5, window_seconds=600, shards=4, max_keys=100)
+    for index in range(10_000):
+        limiter.check(f"172.16.{index // 256}.{index % 256}:/auth/login")
+
+    assert limiter.key_count() <= 100
+    # The most recent caller is still tracked.
+    for _ in range(4):
+        limiter.check("172.16.39.15:/auth/login")
+    assert limiter.check("172.16.39.15:/auth/login") is not None
+
+
+def test_sqlite_gcra_limit_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / "rate_limits.sqlite3")
+    # Two instances on one file stand in for two uvicorn workers.
+    worker_a = SqliteGcraRateLimiter(path, limit=3, window_seconds=60)
+    worker_b = SqliteGcraRateLimiter(path, limit=3, window_seconds=60)
+
+    assert worker_a.check("1.1.1.1:/auth/login") is None
+    assert worker_b.check("1.1.1.1:/auth/login") is None
+    assert worker_a.check("1.1.1.1:/auth/login") is None
+    retry_after = worker_b.check("1.1.1.1:/auth/login")
+    assert retry_after is not None and 19 <= retry_after <= 20
+    assert worker_a.check("1.1.1.1:/auth/login") is not None
+
+    assert worker_a.check("2.2.2.2:/auth/login") is None
+
+    worker_b.reset()
+    assert worker_a.check("1.1.1.1:/auth/login") is None
+
+
+def test_sqlite_gcra_admits_again_after_emission_interval(tmp_path):
+    limiter = SqliteGcraRateLimiter(str(tmp_path / "gcra.sqlite3"), limit=2, window_seconds=0.2)
+
+    assert limiter.check("key") is None
+    assert limiter.check("key") is None
+    assert limiter.check("key") is not None
+    time.sleep(0.11)
+    assert limiter.check("key") is None
+    assert limiter.check("key") is not None
+
+
+def test_sqlite_gcra_still_limits_while_the_store_is_locked(tmp_path):
+    path = str(tmp_path / "rate_limits.sqlite3")
+    limiter = SqliteGcraRateLimiter(path, limit=2, window_seconds=60, busy_timeout=0.05)
+
+    blocker = sqlite3.connect(path)
+    blocker.execute("BEGIN EXCLUSIVE")
+    try:
+        started = time.monotonic()
+        assert limiter.check("1.1.1.1:/auth/login") is None
+        assert limiter.check("1.1.1.1:/auth/login") is None
+        assert limiter.check("1.1.1.1:/auth/login") is not None
+        assert time.monotonic() - started < 1
+    finally:
+        blocker.rollback()
+        blocker.close()
@@ -14,6 +14,7 @@ export type ContentSummary = {
   owner_id: string | null;
   likes_count: number;
   comments_count: number;
+  highlight?: string | null;
 };
 
 export type ContentDetail = ContentSummary & {
@@ -22,6 +23,10 @@ export type ContentDetail = ContentSummary & {
   owner_name: string | null;
 };
 
+export type ContentBatchResponse = {
+  items: ContentDetail[];
+};
+
 export type ContentDownloadResponse = {
   token: string;
   expires_in: number;
@@ -46,6 +51,7 @@ export type ContentListResponse = {
   total: number;
   page: number;
   page_size: number;
+  next_cursor: string | null;
 };
 
 export type ContentCategory = {
@@ -190,6 +196,18 @@ export async function fetchContentDetail(contentId: string): Promise<ContentDeta
   }
 }
 
+export async function fetchContentDetails(contentIds: string[]): Promise<ContentDetail[]> {
+  if (contentIds.length === 0) return [];
+  try {
+    const { data } = await apiClient.get<ContentBatchResponse>("/content/batch", {
+      params: { ids: contentIds.join(",") }
+    });
+    return data.items;
+  } catch (error) {
+    throw toApiError(error);
+  }
+}
+
 export async function requestDownloadToken(contentId: string): Promise<ContentDownloadResponse> {
   try {
     const { data } = await apiClient.post<ContentDownloadResponse>(`/content/${contentId}/download`);